@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import contextlib
+import glob
+import os
+import pathlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TextIO
+
+from . import profiling
+from .generator import get_generator, parse_dialects
+from .parser.loader import LoadCache, load_file
+
+if TYPE_CHECKING:
+    from .generator import SpiceGenerator
+    from .model.netlist import Netlist
+    from .pdk.pdk_config import PdkConfig
+
+# Exit codes used by the CLI, keyed by the stage a cell failed in
+STAGE_EXIT_CODES: dict[str, int] = {
+    "parse":    2,
+    "resolve":  2,
+    "generate": 3,
+    "write":    4,
+}
+
+
+@dataclass
+class BuildOptions:
+    """Settings applied to every cell of a library build."""
+
+    dialects:           list[str] = field(default_factory=lambda: ["spice3"])
+    pdk:                PdkConfig | None = None
+    corner:             str | None = None
+    corners:            list[str] | None = None   # One output per corner (needs pdk)
+    cache_dir:          str | pathlib.Path | None = None
+    columnar_threshold: int | None = None
+    validate:           bool = True                # False: trusted input, skip schema validation
+    prune:              bool = True                # Drop defs the top cell does not use
+    dedup:              bool = False               # Merge identical defs (see transform.deduplicate)
+    flatten:            bool = False               # Write each top cell flat (see transform.flatten)
+    flatten_depth:      int | None = None          # With flatten: levels to expand (None: all)
+
+    @property
+    def output_dialect(self) -> str | None:
+        """The dialect named in output file names, or None for a multi-dialect build."""
+        return self.dialects[0] if len(self.dialects) == 1 else None
+
+    def load_kwargs(self) -> dict:
+        """Keyword arguments for load_file()."""
+        return {
+            "cache_dir": self.cache_dir,
+            "columnar_threshold": self.columnar_threshold,
+            "validate": self.validate,
+        }
+
+
+@dataclass
+class CellResult:
+    """Outcome of generating one top cell in a batch build."""
+
+    input_path:  pathlib.Path
+    output_path: pathlib.Path
+    top_cell:    str | None = None
+    stage:       str | None = None   # Stage that failed; None on success
+    error:       str | None = None
+    outputs:     list[pathlib.Path] = field(default_factory=list)   # Files written
+    pruned:      int = 0                                            # Unused defs dropped
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def expand_inputs(
+    inputs: Iterable[str | pathlib.Path] = (),
+    manifest: str | pathlib.Path | None = None,
+) -> list[pathlib.Path]:
+    """
+    Expand input arguments into an ordered, de-duplicated list of cell files.
+
+    Each input may be a path or a glob pattern (expanded in sorted order).
+    A manifest is a text file listing one path or glob per line; blank lines
+    and '#' comments are ignored, and relative entries are resolved against
+    the manifest's directory. Manifest entries follow the explicit inputs.
+    """
+    patterns: list[pathlib.Path] = [pathlib.Path(p) for p in inputs]
+    if manifest is not None:
+        manifest = pathlib.Path(manifest)
+        base = manifest.parent
+        for line in manifest.read_text(encoding="utf-8").splitlines():
+            entry = line.split("#", 1)[0].strip()
+            if entry:
+                patterns.append(base / entry)
+
+    result: list[pathlib.Path] = []
+    seen: set[pathlib.Path] = set()
+    for pattern in patterns:
+        if glob.has_magic(str(pattern)):
+            matches = [pathlib.Path(m) for m in sorted(glob.glob(str(pattern), recursive=True))]
+        else:
+            matches = [pattern]
+        for match in matches:
+            key = match.resolve()
+            if key not in seen:
+                seen.add(key)
+                result.append(match)
+    return result
+
+
+def output_path_for(
+    input_path: pathlib.Path,
+    output_dir: pathlib.Path,
+    dialect: str | None,
+) -> pathlib.Path:
+    """
+    Output file for a cell in a batch build: <output_dir>/<stem>_<dialect>.sp.
+    For a multi-dialect build (dialect None) this is <stem>.sp, which
+    write_outputs() expands into one <stem>_<dialect>.sp per dialect.
+    """
+    if dialect is None:
+        return output_dir / f"{input_path.stem}.sp"
+    return output_dir / f"{input_path.stem}_{dialect}.sp"
+
+
+def tagged_output_path(output_path: pathlib.Path, tag: str) -> pathlib.Path:
+    """Per-dialect or per-corner variant of an output file: <stem>_<tag><suffix>."""
+    return output_path.with_name(f"{output_path.stem}_{tag}{output_path.suffix}")
+
+
+def write_outputs(
+    netlist: Netlist,
+    output_path: pathlib.Path,
+    dialects: Sequence[str],
+    corners: list[str] | None = None,
+) -> list[pathlib.Path]:
+    """
+    Write an already loaded and resolved netlist in every dialect. A single
+    dialect goes to output_path; several go to <stem>_<dialect><suffix>
+    next to it. Each may fan out further per corner (see write_netlist).
+    Returns the files written.
+    """
+    written: list[pathlib.Path] = []
+    for dialect in dialects:
+        path = output_path if len(dialects) == 1 else tagged_output_path(output_path, dialect)
+        written += write_netlist(get_generator(dialect), netlist, path, corners)
+    return written
+
+
+def write_netlist(
+    generator: SpiceGenerator,
+    netlist: Netlist,
+    output_path: pathlib.Path,
+    corners: list[str] | None = None,
+) -> list[pathlib.Path]:
+    """
+    Stream a netlist into output_path, or with `corners` into one file per
+    corner (see tagged_output_path) with the body generated only once.
+
+    Returns the files written. On any error the files opened so far are
+    removed and the exception is re-raised.
+    """
+    if corners:
+        paths = {c: tagged_output_path(output_path, c) for c in corners}
+    else:
+        paths = {"": output_path}
+
+    opened: list[pathlib.Path] = []
+    try:
+        with contextlib.ExitStack() as stack:
+            streams: dict[str, TextIO] = {}
+            for corner, path in paths.items():
+                stream = stack.enter_context(path.open("w", encoding="utf-8"))
+                opened.append(path)
+                streams[corner] = stack.enter_context(profiling.profiled_stream(stream))
+            if corners:
+                generator.generate_corners_to(netlist, streams)
+            else:
+                generator.generate_to(netlist, streams[""])
+            profiling.count("output_files", len(streams))
+    except BaseException:
+        for path in opened:
+            path.unlink(missing_ok=True)
+        raise
+    return list(paths.values())
+
+
+def generate_library(
+    inputs: Iterable[str | pathlib.Path],
+    output_dir: str | pathlib.Path,
+    dialect: str | Sequence[str] = "spice3",
+    pdk: PdkConfig | None = None,
+    corner: str | None = None,
+    cache: LoadCache | None = None,
+    jobs: int | None = 1,
+    cache_dir: str | pathlib.Path | None = None,
+    columnar_threshold: int | None = None,
+    corners: list[str] | None = None,
+    validate: bool = True,
+    prune: bool = True,
+    dedup: bool = False,
+    flatten: bool = False,
+    flatten_depth: int | None = None,
+) -> list[CellResult]:
+    """
+    Generate one netlist per input cell file into output_dir.
+
+    `dialect` may name several dialects (a list, or 'spice3,hspice' / 'all'):
+    each cell is then loaded and resolved once and written once per dialect.
+
+    All cells share one dependency cache, so a dep file used by many cells is
+    read and validated once, and the PDK config is loaded once by the caller.
+    A failure in one cell is recorded in its CellResult and does not stop
+    the others. Results are returned in input order.
+
+    With jobs > 1 (or None for one per CPU) the cells are spread over a
+    process pool. Each worker receives the parsed PDK once and keeps its own
+    warm dep cache for every cell it builds; `cache` is only used when
+    running in-process. `cache_dir` enables the persistent parse cache and
+    may be shared by all workers. `columnar_threshold` is passed to
+    load_file(). With `corners` (and a pdk) each cell is loaded and resolved
+    once and written to one file per corner (see tagged_output_path).
+    `validate=False` loads every cell through the trusted fast path.
+    Defs a top cell does not instantiate are left out of its output unless
+    `prune` is False (see CellResult.pruned). `dedup` merges structurally
+    identical defs in each cell. With `flatten` each top cell is written
+    flat, expanded `flatten_depth` levels deep (every level when None).
+    """
+    dialects = parse_dialects(dialect) if isinstance(dialect, str) else list(dialect)
+    options = BuildOptions(
+        dialects=dialects, pdk=pdk, corner=corner, corners=corners,
+        cache_dir=cache_dir, columnar_threshold=columnar_threshold, validate=validate,
+        prune=prune, dedup=dedup, flatten=flatten, flatten_depth=flatten_depth,
+    )
+    input_paths = [pathlib.Path(p) for p in inputs]
+    output_dir = pathlib.Path(output_dir)
+    _check_unique_outputs(input_paths, output_dir, options.output_dialect)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_paths = [output_path_for(p, output_dir, options.output_dialect) for p in input_paths]
+
+    workers = _effective_jobs(jobs, len(input_paths))
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(input_paths) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(options,),
+        ) as pool:
+            # map() yields in submission order, so results are deterministic
+            # regardless of which worker finishes first
+            return list(pool.map(_build_in_worker, input_paths, output_paths,
+                                 chunksize=chunksize))
+
+    loaded = LoadCache() if cache is None else cache
+    return [
+        build_cell(input_path, output_path, options, cache=loaded)
+        for input_path, output_path in zip(input_paths, output_paths)
+    ]
+
+
+def _effective_jobs(jobs: int | None, n_cells: int) -> int:
+    if jobs is None or jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, n_cells))
+
+
+# Per-worker state, set once by _init_worker in each pool process
+_worker_options = BuildOptions()
+_worker_cache = LoadCache()
+
+
+def _init_worker(options: BuildOptions) -> None:
+    global _worker_options, _worker_cache
+    _worker_options = options
+    _worker_cache = LoadCache()
+
+
+def _build_in_worker(input_path: pathlib.Path, output_path: pathlib.Path) -> CellResult:
+    return build_cell(input_path, output_path, _worker_options, cache=_worker_cache)
+
+
+def build_cell(
+    input_path: pathlib.Path,
+    output_path: pathlib.Path,
+    options: BuildOptions | None = None,
+    cache: LoadCache | None = None,
+) -> CellResult:
+    """Load, resolve and generate a single cell, capturing any error."""
+    options = options or BuildOptions()
+    result = CellResult(input_path=input_path, output_path=output_path)
+
+    try:
+        netlist = load_file(input_path, cache=cache, **options.load_kwargs())
+    except Exception as exc:
+        return _fail(result, "parse", exc)
+    result.top_cell = netlist.top_cell
+
+    if options.pdk is not None:
+        try:
+            from .pdk import resolve
+            netlist = resolve(netlist, options.pdk, options.corner)
+        except Exception as exc:
+            return _fail(result, "resolve", exc)
+
+    try:
+        if options.prune:
+            # After resolution: resolved devices may instantiate a def by its PDK name
+            from .transform import prune
+            loaded = len(netlist.subckt_defs)
+            netlist = prune(netlist)
+            result.pruned = loaded - len(netlist.subckt_defs)
+        if options.dedup:
+            from .transform import deduplicate
+            netlist = deduplicate(netlist)
+        if options.flatten:
+            # Lazy: the hierarchy is walked while the output is generated
+            from .transform import flatten
+            netlist = flatten(netlist, options.flatten_depth)
+        corners = options.corners if options.pdk is not None else None
+        result.outputs = write_outputs(netlist, output_path, options.dialects, corners)
+    except OSError as exc:
+        return _fail(result, "write", exc)
+    except Exception as exc:
+        return _fail(result, "generate", exc)
+    return result
+
+
+def _fail(result: CellResult, stage: str, exc: Exception) -> CellResult:
+    result.stage = stage
+    result.error = str(exc)
+    return result
+
+
+def _check_unique_outputs(
+    input_paths: list[pathlib.Path],
+    output_dir: pathlib.Path,
+    dialect: str | None,
+) -> None:
+    owners: dict[pathlib.Path, pathlib.Path] = {}
+    for input_path in input_paths:
+        out = output_path_for(input_path, output_dir, dialect)
+        if out in owners:
+            raise ValueError(
+                f"Inputs '{owners[out]}' and '{input_path}' would both be written "
+                f"to '{out}'. Rename one of the cell files."
+            )
+        owners[out] = input_path
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import argparse
+import glob
 import pathlib
 import sys
 import textwrap
+from typing import TYPE_CHECKING
 
-from .parser.loader import load_file
-from .generator import DIALECT_REGISTRY, get_generator
+# Only the lightweight generator package is imported up front. The loader
+# (pydantic, PyYAML), PDK support and batch/watch machinery are imported
+# inside the code paths that use them, so `--help` and simple invocations
+# do not pay for them.
+from .generator import DIALECT_REGISTRY, get_generator, parse_dialects
+
+if TYPE_CHECKING:
+    from .model.netlist import Netlist
+    from .pdk.pdk_config import PdkConfig
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
@@ -24,21 +33,48 @@ def _build_arg_parser() -> argparse.ArgumentParser:
               spice_gen opamp.yaml --dialect ngspice --stdout
               spice_gen cell.json  --dialect spice3  -v
 
+              # Every dialect from one load: nand2_spice3.sp, nand2_hspice.sp, nand2_ngspice.sp
+              spice_gen nand2.yaml --dialect all
+
+              # Batch mode: many cells in one process, shared dep cache
+              spice_gen cells/*.yaml --output-dir build/
+              spice_gen --manifest stdcells.txt --pdk pdks/sky130A.yaml --output-dir build/ -j 16
+
+              # Regenerate affected cells whenever a topology file changes
+              spice_gen cells/*.yaml --output-dir build/ --watch
+
               # PDK-aware generation
               spice_gen sky130_inverter.yaml --pdk pdks/sky130A.yaml --dialect ngspice --stdout
               spice_gen sky130_inverter.yaml --pdk pdks/sky130A.yaml --corner ff --dialect ngspice
+
+              # One netlist per corner from a single load/resolve/generate pass
+              spice_gen sky130_inverter.yaml --pdk pdks/sky130A.yaml --corners tt,ff,ss
+
+              # Compile a hierarchy once into a binary library, then load it fast
+              spice_gen compile top.yaml -o top.sglib
+              spice_gen top.sglib --cell ALU --dialect ngspice --stdout
         """),
     )
     p.add_argument(
-        "input",
-        help="Path to input YAML or JSON topology file",
+        "inputs",
+        nargs="*",
+        metavar="input",
+        help=(
+            "Path to input YAML or JSON topology file. Several paths or glob "
+            "patterns select batch mode (see --output-dir)"
+        ),
     )
     p.add_argument(
         "-d", "--dialect",
-        default="spice3",
-        choices=valid_dialects,
+        dest="dialects",
+        default=["spice3"],
+        type=_dialect_list,
         metavar="DIALECT",
-        help=f"SPICE output dialect (default: spice3). Choices: {valid_dialects}",
+        help=(
+            f"SPICE output dialect (default: spice3). Choices: {valid_dialects}. "
+            "A comma-separated list or 'all' loads the input once and writes "
+            "one file per dialect"
+        ),
     )
     p.add_argument(
         "-o", "--output",
@@ -46,6 +82,28 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         metavar="FILE",
         help="Output file path (default: <input_stem>_<dialect>.sp)",
     )
+    p.add_argument(
+        "--output-dir",
+        default=None,
+        metavar="DIR",
+        help=(
+            "Batch mode: write <stem>_<dialect>.sp for every input into DIR "
+            "(default: current directory)"
+        ),
+    )
+    p.add_argument(
+        "--manifest",
+        default=None,
+        metavar="FILE",
+        help="Batch mode: text file listing input paths or globs, one per line",
+    )
+    p.add_argument(
+        "-j", "--jobs",
+        type=_jobs,
+        default=1,
+        metavar="N",
+        help="Batch mode: generate cells in N worker processes (0 = one per CPU; default: 1)",
+    )
     p.add_argument(
         "--stdout",
         action="store_true",
@@ -63,6 +121,112 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         metavar="CORNER",
         help="Process corner (e.g. tt, ff, ss). Defaults to PDK's default_corner.",
     )
+    p.add_argument(
+        "--corners",
+        default=None,
+        metavar="LIST",
+        help=(
+            "Comma-separated corners (e.g. tt,ff,ss) or 'all' from the PDK config. "
+            "Writes one file per corner, <output_stem>_<corner>.sp, generating "
+            "the netlist body once. Requires --pdk"
+        ),
+    )
+    p.add_argument(
+        "--cache-dir",
+        default=None,
+        metavar="DIR",
+        help="Cache parsed topology files in DIR and reuse them while unchanged",
+    )
+    p.add_argument(
+        "--columnar-threshold",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Store the primitives of cells with at least N primitives in a "
+            "compact columnar table (for very large flat cells)"
+        ),
+    )
+    p.add_argument(
+        "--cell",
+        default=None,
+        metavar="NAME",
+        help=(
+            "With a compiled library (.sglib) input, generate only cell NAME "
+            "and its deps, decoding nothing else"
+        ),
+    )
+    p.add_argument(
+        "--trusted",
+        action="store_true",
+        help=(
+            "Skip schema validation for machine-generated input that was "
+            "already validated; only minimal structural checks are made"
+        ),
+    )
+    p.add_argument(
+        "--prune",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Leave out subcircuits the top cell does not instantiate, directly "
+            "or indirectly (default: on in batch mode, off for a single input, "
+            "with or without --watch)"
+        ),
+    )
+    p.add_argument(
+        "--dedup",
+        action="store_true",
+        help=(
+            "Merge subcircuits that differ only in name into one .subckt and "
+            "point their instances at it"
+        ),
+    )
+    p.add_argument(
+        "--flatten",
+        action="store_true",
+        help=(
+            "Write the top cell flat: every subcircuit instance is expanded into "
+            "primitives with hierarchical names (XA/XB/M1)"
+        ),
+    )
+    p.add_argument(
+        "--flatten-depth",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Flatten only N levels below the top cell (implies --flatten)",
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Keep running and regenerate outputs whose topology files, deps "
+            "or PDK config change"
+        ),
+    )
+    p.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        metavar="SECONDS",
+        help="Polling interval for --watch (default: 1.0)",
+    )
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help=(
+            "Record wall time and peak memory per phase (read, validate, build, "
+            "resolve, generate, write) plus file, def, device and output counts, "
+            "and print them as JSON to stderr (single input only)"
+        ),
+    )
+    p.add_argument(
+        "--profile-out",
+        default=None,
+        metavar="FILE",
+        help="Write the --profile JSON report to FILE instead of stderr",
+    )
     p.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -71,25 +235,421 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     return p
 
 
+def _build_compile_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(
+        prog="spice_gen compile",
+        description=(
+            "Compile a topology file and its whole dep closure into one binary "
+            "cell library (.sglib) that spice_gen loads without parsing or validation."
+        ),
+    )
+    p.add_argument("input", help="Path to the top YAML or JSON topology file")
+    p.add_argument(
+        "-o", "--output",
+        default=None,
+        metavar="FILE",
+        help="Library file to write (default: <input_stem>.sglib)",
+    )
+    p.add_argument(
+        "--columnar-threshold",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Store the primitives of cells with at least N primitives in a columnar table",
+    )
+    p.add_argument(
+        "--trusted",
+        action="store_true",
+        help="Skip schema validation while compiling (input already validated)",
+    )
+    p.add_argument(
+        "--cache-dir",
+        default=None,
+        metavar="DIR",
+        help="Cache parsed topology files in DIR and reuse them while unchanged",
+    )
+    p.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print diagnostic information to stderr",
+    )
+    return p
+
+
+def _run_compile(argv: list[str]) -> int:
+    args = _build_compile_parser().parse_args(argv)
+    input_path = pathlib.Path(args.input)
+    if not input_path.exists():
+        print(f"error: input file not found: {input_path}", file=sys.stderr)
+        return 1
+    from .parser.library import LIBRARY_SUFFIX, compile_library
+
+    out_path = pathlib.Path(args.output or f"{input_path.stem}{LIBRARY_SUFFIX}")
+    try:
+        netlist = compile_library(
+            input_path, out_path, cache_dir=args.cache_dir,
+            columnar_threshold=args.columnar_threshold, validate=not args.trusted,
+        )
+        size = out_path.stat().st_size
+    except OSError as exc:
+        if exc.filename is not None and pathlib.Path(exc.filename) != out_path:
+            # A topology file that could not be read
+            print(f"error: failed to parse input: {exc}", file=sys.stderr)
+            return 2
+        print(f"error: could not write output: {exc}", file=sys.stderr)
+        return 4
+    except Exception as exc:
+        print(f"error: failed to parse input: {exc}", file=sys.stderr)
+        return 2
+    if args.verbose:
+        print(f"[spice_gen] compiled {len(netlist.subckt_defs)} cell(s), {size} bytes",
+              file=sys.stderr)
+    print(out_path)
+    return 0
+
+
+def _dialect_list(spec: str) -> list[str]:
+    try:
+        return parse_dialects(spec)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _jobs(spec: str) -> int:
+    try:
+        jobs = int(spec)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid job count: {spec!r}") from None
+    if jobs < 0:
+        raise argparse.ArgumentTypeError("must be >= 0 (0 = one per CPU)")
+    return jobs
+
+
+def _output_dialect(args: argparse.Namespace) -> str | None:
+    # Dialect named in default output file names; None when there are several
+    return args.dialects[0] if len(args.dialects) == 1 else None
+
+
+def _print_yaml_backend() -> None:
+    from .yaml_backend import YAML_BACKEND
+    print(f"[spice_gen] yaml backend: {YAML_BACKEND}", file=sys.stderr)
+
+
+def _is_batch(args: argparse.Namespace) -> bool:
+    return bool(
+        len(args.inputs) > 1
+        or args.manifest
+        or args.output_dir
+        or any(glob.has_magic(i) for i in args.inputs)
+    )
+
+
+def _prune(args: argparse.Namespace) -> bool:
+    # Pruning is on by default for batch builds only
+    return _is_batch(args) if args.prune is None else args.prune
+
+
+def _batch_inputs(args: argparse.Namespace) -> list[pathlib.Path] | None:
+    """Expand batch inputs, printing errors and returning None on failure."""
+    from .batch import expand_inputs
+
+    if args.stdout or args.output:
+        print("error: --stdout and --output cannot be used with multiple inputs; "
+              "use --output-dir", file=sys.stderr)
+        return None
+
+    try:
+        inputs = expand_inputs(args.inputs, args.manifest)
+    except OSError as exc:
+        print(f"error: could not read manifest: {exc}", file=sys.stderr)
+        return None
+    missing = [p for p in inputs if not p.exists()]
+    if missing or not inputs:
+        for p in missing:
+            print(f"error: input file not found: {p}", file=sys.stderr)
+        if not inputs:
+            print("error: no input files matched", file=sys.stderr)
+        return None
+    return inputs
+
+
+def _report_results(results: list, verbose: bool) -> int:
+    """Print batch results; return the exit code for the worst failure."""
+    from .batch import STAGE_EXIT_CODES
+
+    rc = 0
+    for result in results:
+        if result.ok:
+            if verbose and result.pruned:
+                print(f"[spice_gen] {result.input_path}: pruned {result.pruned} unused cell(s)",
+                      file=sys.stderr)
+            for path in result.outputs:
+                if verbose:
+                    print(f"[spice_gen] written to: {path}", file=sys.stderr)
+                else:
+                    print(path)
+        else:
+            print(f"error: {result.input_path}: {result.stage} failed: {result.error}",
+                  file=sys.stderr)
+            rc = max(rc, STAGE_EXIT_CODES[result.stage])
+    return rc
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    """Generate every selected input into --output-dir in a single process."""
+    from .batch import generate_library
+
+    inputs = _batch_inputs(args)
+    if inputs is None:
+        return 1
+
+    pdk = None
+    if args.pdk:
+        pdk_path = pathlib.Path(args.pdk)
+        if not pdk_path.exists():
+            print(f"error: PDK config file not found: {pdk_path}", file=sys.stderr)
+            return 1
+        if args.verbose:
+            print(f"[spice_gen] applying PDK: {pdk_path}  corner: {args.corner or 'default'}", file=sys.stderr)
+        try:
+            from .pdk import load_pdk
+            pdk = load_pdk(pdk_path)
+        except Exception as exc:
+            print(f"error: PDK resolution failed: {exc}", file=sys.stderr)
+            return 2
+
+    try:
+        corners = _select_corners(args, pdk)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    output_dir = pathlib.Path(args.output_dir or ".")
+    if args.verbose:
+        _print_yaml_backend()
+        print(f"[spice_gen] batch: {len(inputs)} cell(s) -> {output_dir}  "
+              f"dialect: {','.join(args.dialects)}  jobs: {args.jobs}", file=sys.stderr)
+    try:
+        results = generate_library(
+            inputs, output_dir, dialect=args.dialects, pdk=pdk, corner=args.corner or None,
+            jobs=args.jobs, cache_dir=args.cache_dir,
+            columnar_threshold=args.columnar_threshold, corners=corners,
+            validate=not args.trusted, prune=_prune(args), dedup=args.dedup,
+            flatten=args.flatten, flatten_depth=args.flatten_depth,
+        )
+    except (ValueError, OSError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+
+    return _report_results(results, args.verbose)
+
+
+def _run_watch(args: argparse.Namespace) -> int:
+    """Build the selected inputs, then regenerate them as their sources change."""
+    from .batch import output_path_for
+    from .watch import Watcher
+
+    if _is_batch(args):
+        inputs = _batch_inputs(args)
+        if inputs is None:
+            return 1
+        output_dir = pathlib.Path(args.output_dir or ".")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        targets = [(p, output_path_for(p, output_dir, _output_dialect(args))) for p in inputs]
+    else:
+        if args.stdout:
+            print("error: --watch cannot be used with --stdout", file=sys.stderr)
+            return 1
+        input_path = pathlib.Path(args.inputs[0])
+        if not input_path.exists():
+            print(f"error: input file not found: {input_path}", file=sys.stderr)
+            return 1
+        targets = [(input_path, _single_output_path(args, input_path))]
+
+    if args.pdk and not pathlib.Path(args.pdk).exists():
+        print(f"error: PDK config file not found: {args.pdk}", file=sys.stderr)
+        return 1
+
+    corners = None
+    if args.corners:
+        # The corner list is fixed for the session, so expand it up front
+        try:
+            from .pdk import load_pdk
+            pdk = load_pdk(args.pdk) if args.pdk else None
+        except Exception as exc:
+            print(f"error: PDK resolution failed: {exc}", file=sys.stderr)
+            return 2
+        try:
+            corners = _select_corners(args, pdk)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 1
+
+    watcher = Watcher(
+        targets, dialect=args.dialects, pdk_path=args.pdk,
+        corner=args.corner or None, cache_dir=args.cache_dir,
+        columnar_threshold=args.columnar_threshold, corners=corners,
+        validate=not args.trusted, prune=_prune(args), dedup=args.dedup,
+        flatten=args.flatten, flatten_depth=args.flatten_depth,
+    )
+    if args.verbose:
+        _print_yaml_backend()
+        print(f"[spice_gen] watching {len(targets)} cell(s); Ctrl-C to stop", file=sys.stderr)
+    try:
+        watcher.run(
+            interval=args.watch_interval,
+            on_results=lambda results: _report_results(results, args.verbose),
+        )
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _select_corners(args: argparse.Namespace, pdk: PdkConfig | None) -> list[str] | None:
+    """
+    Expand --corners against the PDK config (None when not given).
+    Raises ValueError for an invalid combination or an unknown corner.
+    """
+    if not args.corners:
+        return None
+    if pdk is None:
+        raise ValueError("--corners requires --pdk")
+    if args.corner:
+        raise ValueError("--corner and --corners cannot be used together")
+    if args.stdout:
+        raise ValueError("--corners writes one file per corner and cannot be used with --stdout")
+    return pdk.select_corners(args.corners)
+
+
+def _single_output_path(args: argparse.Namespace, input_path: pathlib.Path) -> pathlib.Path:
+    # With several dialects this is the base name each dialect is tagged onto
+    if args.output:
+        return pathlib.Path(args.output)
+    dialect = _output_dialect(args)
+    return pathlib.Path(f"{input_path.stem}_{dialect}.sp" if dialect else f"{input_path.stem}.sp")
+
+
+def _write_netlist(
+    netlist: Netlist,
+    out_path: pathlib.Path,
+    dialects: list[str],
+    corners: list[str] | None,
+    verbose: bool,
+) -> int:
+    """
+    Stream a generated netlist into out_path (one file per dialect and per
+    corner when several are selected) and print the files written.
+
+    Returns 0 on success, 3 on a generation error and 4 on an I/O error.
+    Partially written files are removed on failure.
+    """
+    from .batch import write_outputs
+
+    try:
+        written = write_outputs(netlist, out_path, dialects, corners)
+    except OSError as exc:
+        print(f"error: could not write output: {exc}", file=sys.stderr)
+        return 4
+    except Exception as exc:
+        print(f"error: generation failed: {exc}", file=sys.stderr)
+        return 3
+    for path in written:
+        if verbose:
+            print(f"[spice_gen] written to: {path}", file=sys.stderr)
+        else:
+            print(path)
+    return 0
+
+
+def _generate_to_stdout(netlist: Netlist, dialect: str) -> None:
+    from . import profiling
+
+    with profiling.profiled_stream(sys.stdout) as stream:
+        get_generator(dialect).generate_to(netlist, stream)
+
+
 def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "compile":
+        return _run_compile(argv[1:])
+
     parser = _build_arg_parser()
     args = parser.parse_args(argv)
 
-    input_path = pathlib.Path(args.input)
+    if not args.inputs and not args.manifest:
+        parser.error("at least one input file (or --manifest) is required")
+    if (args.profile or args.profile_out) and (args.watch or _is_batch(args)):
+        parser.error("--profile takes a single input file (not batch or --watch mode)")
+    if args.cell and (args.watch or _is_batch(args)):
+        parser.error("--cell takes a single compiled library input (not batch or --watch mode)")
+    if args.flatten_depth is not None:
+        if args.flatten_depth < 0:
+            parser.error("--flatten-depth must be >= 0")
+        args.flatten = True
+
+    if args.watch:
+        return _run_watch(args)
+    if _is_batch(args):
+        return _run_batch(args)
+
+    input_path = pathlib.Path(args.inputs[0])
     if not input_path.exists():
         print(f"error: input file not found: {input_path}", file=sys.stderr)
         return 1
+    if args.stdout and len(args.dialects) > 1:
+        print("error: --stdout takes a single dialect", file=sys.stderr)
+        return 1
+
+    if args.profile or args.profile_out:
+        return _run_profiled(args, input_path)
+    return _run_single(args, input_path)
+
+
+def _run_profiled(args: argparse.Namespace, input_path: pathlib.Path) -> int:
+    """Run _run_single under a Profile and report it as JSON."""
+    from .profiling import Profile, profiling
+
+    profile = Profile()
+    with profiling(profile):
+        status = _run_single(args, input_path)
+    if args.profile_out is None:
+        profile.write_json(sys.stderr)
+        return status
+    try:
+        with open(args.profile_out, "w", encoding="utf-8") as f:
+            profile.write_json(f)
+    except OSError as exc:
+        print(f"error: could not write profile: {exc}", file=sys.stderr)
+        return status or 4
+    return status
+
 
+def _run_single(args: argparse.Namespace, input_path: pathlib.Path) -> int:
     # Parse topology
     if args.verbose:
+        _print_yaml_backend()
         print(f"[spice_gen] loading: {input_path}", file=sys.stderr)
     try:
-        netlist = load_file(input_path)
+        if args.cell:
+            from .parser.library import load_library
+            netlist = load_library(input_path, cell=args.cell)
+        else:
+            from .parser.loader import load_file
+            netlist = load_file(
+                input_path, cache_dir=args.cache_dir,
+                columnar_threshold=args.columnar_threshold,
+                validate=not args.trusted,
+            )
     except Exception as exc:
         print(f"error: failed to parse input: {exc}", file=sys.stderr)
         return 2
+    if args.profile or args.profile_out:
+        from .profiling import count_netlist
+        count_netlist(netlist)
 
     # PDK resolution (optional)
+    pdk = None
     if args.pdk:
         pdk_path = pathlib.Path(args.pdk)
         if not pdk_path.exists():
@@ -105,38 +665,57 @@ def main(argv: list[str] | None = None) -> int:
             print(f"error: PDK resolution failed: {exc}", file=sys.stderr)
             return 2
 
-    # Generate
-    if args.verbose:
-        print(f"[spice_gen] generating dialect: {args.dialect}", file=sys.stderr)
+    # Multi-corner: the resolved netlist is shared, only the .lib line differs
     try:
-        generator = get_generator(args.dialect)
-        output_text = generator.generate(netlist)
-    except Exception as exc:
-        print(f"error: generation failed: {exc}", file=sys.stderr)
-        return 3
-
-    # Output
-    if args.stdout:
-        sys.stdout.write(output_text)
-        return 0
+        corners = _select_corners(args, pdk)
+    except ValueError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
 
-    out_path = (
-        pathlib.Path(args.output)
-        if args.output
-        else pathlib.Path(f"{input_path.stem}_{args.dialect}.sp")
-    )
+    if _prune(args):
+        # After resolution: resolved devices may instantiate a def by its PDK name
+        from .transform import prune
+        try:
+            loaded = len(netlist.subckt_defs)
+            netlist = prune(netlist)
+        except ValueError as exc:
+            print(f"error: {exc}", file=sys.stderr)
+            return 2
+        if args.verbose:
+            print(f"[spice_gen] pruned {loaded - len(netlist.subckt_defs)} unused cell(s)",
+                  file=sys.stderr)
 
-    try:
-        out_path.write_text(output_text, encoding="utf-8")
+    if args.dedup:
+        from .transform import deduplicate
+        before = len(netlist.subckt_defs)
+        netlist = deduplicate(netlist)
         if args.verbose:
-            print(f"[spice_gen] written to: {out_path}", file=sys.stderr)
-        else:
-            print(out_path)
-    except OSError as exc:
-        print(f"error: could not write output: {exc}", file=sys.stderr)
-        return 4
+            print(f"[spice_gen] merged {before - len(netlist.subckt_defs)} duplicate cell(s)",
+                  file=sys.stderr)
 
-    return 0
+    if args.flatten:
+        from .transform import flatten
+        try:
+            netlist = flatten(netlist, args.flatten_depth)
+        except ValueError as exc:
+            print(f"error: flattening failed: {exc}", file=sys.stderr)
+            return 3
+
+    # Generate — streamed straight to the destination so the full netlist
+    # text is never held in memory (a flat top cell is expanded on the fly)
+    if args.verbose:
+        print(f"[spice_gen] generating dialect: {','.join(args.dialects)}", file=sys.stderr)
+
+    if args.stdout:
+        try:
+            _generate_to_stdout(netlist, args.dialects[0])
+        except Exception as exc:
+            print(f"error: generation failed: {exc}", file=sys.stderr)
+            return 3
+        return 0
+
+    out_path = _single_output_path(args, input_path)
+    return _write_netlist(netlist, out_path, args.dialects, corners, args.verbose)
 
 
 if __name__ == "__main__":
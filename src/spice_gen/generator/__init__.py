@@ -1,8 +1,15 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from .base import SpiceGenerator
 from .spice3 import Spice3Generator
 from .hspice import HspiceGenerator
 from .ngspice import NgspiceGenerator
 
+if TYPE_CHECKING:
+    from ..model.netlist import Netlist
+
 DIALECT_REGISTRY: dict[str, type[SpiceGenerator]] = {
     "spice3":  Spice3Generator,
     "hspice":  HspiceGenerator,
@@ -21,6 +28,37 @@ def get_generator(dialect: str) -> SpiceGenerator:
     return DIALECT_REGISTRY[key]()
 
 
+def parse_dialects(spec: str) -> list[str]:
+    """
+    Expand a dialect list such as 'spice3,hspice', or 'all' for every
+    registered dialect. Order is kept and duplicates are dropped.
+    """
+    if spec.strip().lower() == "all":
+        return list(DIALECT_REGISTRY)
+    dialects: list[str] = []
+    for name in (d.strip().lower() for d in spec.split(",")):
+        if not name:
+            continue
+        if name not in DIALECT_REGISTRY:
+            raise ValueError(
+                f"Unknown dialect '{name}'. "
+                f"Valid options: {sorted(DIALECT_REGISTRY)}"
+            )
+        if name not in dialects:
+            dialects.append(name)
+    if not dialects:
+        raise ValueError("No dialects selected")
+    return dialects
+
+
+def generate_dialects(netlist: Netlist, dialects: list[str] | None = None) -> dict[str, str]:
+    """
+    Generate one netlist text per dialect from the same in-memory Netlist
+    (every registered dialect by default), keyed by dialect name.
+    """
+    return {d: get_generator(d).generate(netlist) for d in (dialects or DIALECT_REGISTRY)}
+
+
 __all__ = [
     "SpiceGenerator",
     "Spice3Generator",
@@ -28,4 +66,6 @@ __all__ = [
     "NgspiceGenerator",
     "DIALECT_REGISTRY",
     "get_generator",
+    "parse_dialects",
+    "generate_dialects",
 ]
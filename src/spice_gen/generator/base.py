@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 import abc
-
-from ..model.component import AnyComponent, PrimitiveComponent, SubcktInstance
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TextIO
+
+from .. import tracing
+from ..model.component import (
+    AnyComponent, PrimitiveComponent, SubcktInstance, SubcktInstanceArray,
+)
+from ..model.device_table import KIND_CODES, NONE, DeviceTable
 from ..model.netlist import Netlist, PdkInclude, SubcktDef
+from ..model.primitives import PRIMITIVE_REGISTRY
 
 
 class SpiceGenerator(abc.ABC):
@@ -22,24 +29,77 @@ class SpiceGenerator(abc.ABC):
 
     def generate(self, netlist: Netlist) -> str:
         """Produce a complete SPICE netlist string from a Netlist object."""
-        sections: list[str] = []
+        with self._span(netlist):
+            return "".join(self.iter_generate(netlist))
+
+    def generate_to(self, netlist: Netlist, stream: TextIO) -> int:
+        """
+        Write the netlist to a text stream incrementally.
+
+        Only one subckt block is held in memory at a time, so peak memory does
+        not grow with output size. Returns the number of characters written.
+        """
+        written = 0
+        with self._span(netlist):
+            for chunk in self.iter_generate(netlist):
+                stream.write(chunk)
+                written += len(chunk)
+        return written
+
+    def iter_generate(self, netlist: Netlist) -> Iterator[str]:
+        """
+        Yield the netlist as newline-terminated text chunks, in output order.
+
+        Chunks are single lines for the header and includes, and whole lines
+        for every element of each subckt block. Concatenating the chunks gives
+        exactly the text returned by generate().
+        """
+        return _as_lines(self._iter_sections(netlist))
 
-        sections.append(self._format_header(netlist))
+    def generate_corners_to(self, netlist: Netlist, streams: Mapping[str, TextIO]) -> None:
+        """
+        Write one netlist per process corner, keyed by corner name.
+
+        Each stream receives the text generate_to() would write for
+        netlist.with_corner(corner). Only the preamble (header and PDK
+        .lib lines) is formatted per corner; each chunk of the subckt blocks
+        is formatted once and written to every stream.
+        """
+        with self._span(netlist, corners=list(streams)):
+            for corner, stream in streams.items():
+                for chunk in _as_lines(self._iter_preamble(netlist.with_corner(corner))):
+                    stream.write(chunk)
+            targets = list(streams.values())
+            for chunk in _as_lines(self._iter_body(netlist)):
+                for stream in targets:
+                    stream.write(chunk)
+
+    def _span(self, netlist: Netlist, **attrs):
+        """The tracing span around one generator entry point."""
+        return tracing.span(
+            "generate", dialect=self.DIALECT_NAME, cell=netlist.top_cell, **attrs,
+        )
+
+    def _iter_sections(self, netlist: Netlist) -> Iterator[str]:
+        yield from self._iter_preamble(netlist)
+        yield from self._iter_body(netlist)
+
+    def _iter_preamble(self, netlist: Netlist) -> Iterator[str]:
+        yield self._format_header(netlist)
 
         # Emit PDK .lib / .include directives first
         for pdk_inc in netlist.pdk_includes:
-            sections.append(self._format_pdk_include(pdk_inc))
+            yield self._format_pdk_include(pdk_inc)
 
+    def _iter_body(self, netlist: Netlist) -> Iterator[str]:
         # Emit cell-level .include directives
         if netlist.subckt_defs:
             for inc in netlist.subckt_defs[0].includes:
-                sections.append(self._format_include(inc))
+                yield self._format_include(inc)
 
-        # Emit all subckt blocks
+        # Emit all subckt blocks, one line at a time
         for defn in netlist.subckt_defs:
-            sections.append(self._format_subckt(defn, netlist))
-
-        return "\n".join(filter(None, sections)) + "\n"
+            yield from self._iter_subckt(defn, netlist)
 
     # ------------------------------------------------------------------ #
     # Header / includes
@@ -61,15 +121,21 @@ class SpiceGenerator(abc.ABC):
     # ------------------------------------------------------------------ #
 
     def _format_subckt(self, defn: SubcktDef, netlist: Netlist) -> str:
-        lines: list[str] = [
-            self._format_subckt_header(defn),
-            *[self._format_component(comp, netlist) for comp in defn.components],
-            self._format_subckt_footer(defn),
-        ]
-        return "\n".join(lines)
+        return "\n".join(self._iter_subckt(defn, netlist))
+
+    def _iter_subckt(self, defn: SubcktDef, netlist: Netlist) -> Iterator[str]:
+        yield self._format_subckt_header(defn)
+        for comp in defn.components:
+            if isinstance(comp, SubcktInstanceArray):
+                yield from self._iter_instance_array(comp, netlist)
+            else:
+                yield self._format_component(comp, netlist)
+        if defn.devices is not None:
+            yield from self._iter_device_table(defn.devices, netlist)
+        yield self._format_subckt_footer(defn)
 
     def _format_subckt_header(self, defn: SubcktDef) -> str:
-        ports_str = " ".join(defn.ports)
+        ports_str = " ".join(defn.port_bits())
         line = f".subckt {defn.name} {ports_str}"
         if defn.parameters:
             line += " " + self._format_subckt_params(defn.parameters)
@@ -91,8 +157,82 @@ class SpiceGenerator(abc.ABC):
             return self._format_primitive(comp)
         if isinstance(comp, SubcktInstance):
             return self._format_subckt_instance(comp, netlist)
+        if isinstance(comp, SubcktInstanceArray):
+            return "\n".join(self._iter_instance_array(comp, netlist))
         raise TypeError(f"Unknown component type: {type(comp)}")
 
+    # ------------------------------------------------------------------ #
+    # Columnar device table
+    # ------------------------------------------------------------------ #
+
+    def _iter_device_table(self, table: DeviceTable, netlist: Netlist) -> Iterator[str]:
+        """
+        Emit the rows of a DeviceTable straight from its columns.
+
+        Produces the same lines as formatting each row's component view, but
+        the parameter string for each distinct parameter set is formatted
+        once and no per-device objects are created. Dialects that override
+        the per-component formatters fall back to the row views.
+        """
+        cls = type(self)
+        if (
+            cls._format_primitive is not SpiceGenerator._format_primitive
+            or cls._format_subckt_instance is not SpiceGenerator._format_subckt_instance
+        ):
+            for comp in table:
+                yield self._format_component(comp, netlist)
+            return
+
+        letters = [PRIMITIVE_REGISTRY[k].spice_letter for k in KIND_CODES]
+        value_params = [PRIMITIVE_REGISTRY[k].value_param for k in KIND_CODES]
+        # PDK-mapped models become X elements. If the model name is also a
+        # def in this netlist its port order applies, so use the row view.
+        x_models = [ports is not None for ports in table.model_subckt]
+        x_via_row = [
+            is_x and netlist.get_subckt(name) is not None
+            for is_x, name in zip(x_models, table.models)
+        ]
+
+        names, kinds, nets = table.names, table.kinds, table.nets
+        offsets, net_names = table.net_offsets, table.net_names
+        model_idx, value_idx, param_idx = table.model_idx, table.value_idx, table.param_idx
+        models, values, params = table.models, table.values, table.params
+        param_strs: dict[int, str] = {}
+        x_param_strs: dict[tuple[int, int, int], str] = {}
+
+        for i, name in enumerate(names):
+            nets_str = " ".join([net_names[n] for n in nets[offsets[i]:offsets[i + 1]]])
+            m, v, p = model_idx[i], value_idx[i], param_idx[i]
+
+            if m != NONE and x_models[m]:
+                if x_via_row[m]:
+                    yield self._format_component(table.row(i), netlist)
+                    continue
+                key = (p, v, kinds[i])
+                pstr = x_param_strs.get(key)
+                if pstr is None:
+                    merged = dict(params[p])
+                    value_param = value_params[kinds[i]]
+                    if v != NONE and value_param:
+                        merged[value_param] = values[v]
+                    pstr = self._format_instance_params(merged) if merged else ""
+                    x_param_strs[key] = pstr
+                line = f"X{name} {nets_str} {models[m]}"
+                yield f"{line} {pstr}" if pstr else line
+                continue
+
+            parts = [f"{letters[kinds[i]]}{name}", nets_str]
+            if m != NONE:
+                parts.append(models[m])
+            if v != NONE:
+                parts.append(values[v])
+            if p:
+                pstr = param_strs.get(p)
+                if pstr is None:
+                    pstr = param_strs[p] = self._format_instance_params(params[p])
+                parts.append(pstr)
+            yield " ".join(parts)
+
     # ------------------------------------------------------------------ #
     # Primitive element line
     # ------------------------------------------------------------------ #
@@ -147,7 +287,7 @@ class SpiceGenerator(abc.ABC):
             ordered_nets = comp.ordered_nets(defn.ports)
         else:
             # External subcircuit: preserve user-specified dict order
-            ordered_nets = list(comp.port_map.values())
+            ordered_nets = comp.connected_nets()
 
         nets_str = " ".join(ordered_nets)
         line = f"X{comp.instance_name} {nets_str} {comp.subckt_name}"
@@ -156,3 +296,33 @@ class SpiceGenerator(abc.ABC):
             line += " " + self._format_instance_params(comp.parameters)
 
         return line
+
+    def _iter_instance_array(self, comp: SubcktInstanceArray, netlist: Netlist) -> Iterator[str]:
+        """
+        Expand an instance array into one X line per element, e.g.
+          XBIT[0:3] → XBIT[0] ... XBIT[3]
+
+        Port order and the parameter string are worked out once for the
+        whole array. Dialects that override _format_subckt_instance get the
+        expanded SubcktInstance objects instead.
+        """
+        defn = netlist.get_subckt(comp.subckt_name)
+        port_order = defn.ports if defn is not None else None
+        if type(self)._format_subckt_instance is not SpiceGenerator._format_subckt_instance:
+            for inst in comp.expand(port_order):
+                yield self._format_subckt_instance(inst, netlist)
+            return
+
+        suffix = f" {comp.subckt_name}"
+        if comp.parameters:
+            suffix += " " + self._format_instance_params(comp.parameters)
+
+        for name, nets in zip(comp.instances.bits(), comp.iter_nets(port_order)):
+            yield f"X{name} {' '.join(nets)}{suffix}"
+
+
+def _as_lines(sections: Iterable[str]) -> Iterator[str]:
+    # Newline-terminate each non-empty section
+    for section in sections:
+        if section:
+            yield section + "\n"
@@ -1,5 +1,7 @@
 from .primitives import PrimitiveKind, PrimitiveSpec, PRIMITIVE_REGISTRY
-from .component import PrimitiveComponent, SubcktInstance, AnyComponent
+from .bus import BusRange
+from .component import PrimitiveComponent, SubcktInstance, SubcktInstanceArray, AnyComponent
+from .device_table import DeviceTable
 from .netlist import SubcktDef, Netlist
 
 __all__ = [
@@ -8,7 +10,10 @@ __all__ = [
     "PRIMITIVE_REGISTRY",
     "PrimitiveComponent",
     "SubcktInstance",
+    "SubcktInstanceArray",
     "AnyComponent",
+    "BusRange",
+    "DeviceTable",
     "SubcktDef",
     "Netlist",
 ]
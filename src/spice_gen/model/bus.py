@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+# name[msb:lsb] or name<msb:lsb>; the range may ascend or descend
+_RANGE_RE = re.compile(
+    r"^(?P<name>[^\[\]<>:\s]+)"
+    r"(?:\[(?P<sq>\d+):(?P<sq_end>\d+)\]|<(?P<an>\d+):(?P<an_end>\d+)>)$"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class BusRange:
+    """
+    An indexed range such as XBIT[0:1023] or D<7:0>.
+
+    Bits are enumerated from `start` to `stop` inclusive, in the direction
+    written, and named with the same bracket style as the source
+    (D<7:0> → D<7>, D<6>, ... D<0>).
+    """
+
+    name:     str
+    start:    int
+    stop:     int
+    brackets: str = "[]"
+
+    def __len__(self) -> int:
+        return abs(self.stop - self.start) + 1
+
+    def __str__(self) -> str:
+        return f"{self.name}{self.brackets[0]}{self.start}:{self.stop}{self.brackets[1]}"
+
+    @property
+    def step(self) -> int:
+        return 1 if self.stop >= self.start else -1
+
+    def indices(self) -> range:
+        return range(self.start, self.stop + self.step, self.step)
+
+    def bit(self, index: int) -> str:
+        """Name of a single bit, e.g. bit(3) → 'D[3]'."""
+        return f"{self.name}{self.brackets[0]}{index}{self.brackets[1]}"
+
+    def bits(self) -> Iterator[str]:
+        """Every bit name, in range order."""
+        open_, close = self.brackets
+        prefix = self.name + open_
+        for i in self.indices():
+            yield f"{prefix}{i}{close}"
+
+    def slice(self, offset: int, width: int) -> str | BusRange:
+        """
+        The `width` bits starting `offset` positions into the range, as a
+        sub-range (or a single bit name when width is 1).
+        """
+        first = self.start + self.step * offset
+        if width == 1:
+            return self.bit(first)
+        return BusRange(self.name, first, first + self.step * (width - 1), self.brackets)
+
+
+# A port or net: a plain name, or a bus kept as a range until emission
+Net = str | BusRange
+
+
+def parse_range(text: str) -> BusRange | None:
+    """Parse 'name[a:b]' or 'name<a:b>', returning None for a plain name."""
+    if not text or text[-1] not in "]>":
+        return None
+    m = _RANGE_RE.match(text)
+    if m is None:
+        return None
+    if m["sq"] is not None:
+        return BusRange(m["name"], int(m["sq"]), int(m["sq_end"]), "[]")
+    return BusRange(m["name"], int(m["an"]), int(m["an_end"]), "<>")
+
+
+def parse_net(text: str) -> Net:
+    """A BusRange for range notation, otherwise the name unchanged."""
+    return parse_range(text) or text
+
+
+def net_name(net: Net) -> str:
+    """Base name of a port or net (the bus name for a range)."""
+    return net.name if isinstance(net, BusRange) else net
+
+
+def net_width(net: Net) -> int:
+    return len(net) if isinstance(net, BusRange) else 1
+
+
+def net_bits(net: Net) -> list[str]:
+    """Individual bit names of a port or net."""
+    return list(net.bits()) if isinstance(net, BusRange) else [net]
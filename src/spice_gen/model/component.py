@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
+from .bus import BusRange, Net, net_bits, net_name, net_width
 from .primitives import PrimitiveKind, PrimitiveSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class PrimitiveComponent:
-    """An instance of a SPICE primitive element (M, Q, R, C, L, V, I, D)."""
+    """
+    An instance of a SPICE primitive element (M, Q, R, C, L, V, I, D).
+
+    Slotted: a large flat cell holds one of these per device, so no
+    per-instance __dict__ is kept. The builder interns net names and
+    parameter keys so repeated nets such as VDD/VSS share one string.
+    """
 
     instance_name: str
     kind:          PrimitiveKind
@@ -28,22 +37,52 @@ class PrimitiveComponent:
             ) from exc
 
 
-@dataclass
+@dataclass(slots=True)
 class SubcktInstance:
-    """An instance of a hierarchical subcircuit (.subckt reference)."""
+    """
+    An instance of a hierarchical subcircuit (.subckt reference).
+
+    A connection may be a BusRange (e.g. DATA<255:0>) attached to a bus port
+    of the same width; it stays a range until the netlist is written.
+    """
 
     instance_name: str
     subckt_name:   str
-    port_map:      dict[str, str]   # port_name -> net_name
+    port_map:      dict[str, Net]   # port_name -> net_name or bus range
     parameters:    dict[str, str] = field(default_factory=dict)
 
-    def ordered_nets(self, port_order: list[str]) -> list[str]:
+    def ordered_nets(self, port_order: list[Net]) -> list[str]:
         """
-        Return net names ordered by the referenced SubcktDef.ports list.
-        port_order must come from the resolved SubcktDef at generation time.
+        Return net names ordered by the referenced SubcktDef.ports list,
+        with buses expanded bit by bit. port_order must come from the
+        resolved SubcktDef at generation time.
         """
+        nets: list[str] = []
+        port_map = self.port_map
+        for port in port_order:
+            if type(port) is str:
+                net = port_map.get(port)
+                if type(net) is str:
+                    nets.append(net)
+                    continue
+            net = self._lookup(net_name(port))
+            _check_width(self.instance_name, port, net)
+            nets.extend(net_bits(net))
+        return nets
+
+    def connected_nets(self) -> list[str]:
+        """All connected nets in port_map order, buses expanded (for external subcircuits)."""
+        nets: list[str] = []
+        for net in self.port_map.values():
+            if isinstance(net, BusRange):
+                nets.extend(net.bits())
+            else:
+                nets.append(net)
+        return nets
+
+    def _lookup(self, port: str) -> Net:
         try:
-            return [self.port_map[port] for port in port_order]
+            return self.port_map[port]
         except KeyError as exc:
             raise ValueError(
                 f"Subckt instance '{self.instance_name}' is missing port {exc} "
@@ -51,5 +90,113 @@ class SubcktInstance:
             ) from exc
 
 
+@dataclass(slots=True)
+class SubcktInstanceArray:
+    """
+    An array of identical subcircuit instances, written as e.g. id XBIT[0:1023].
+
+    The array stays a single object through building and PDK resolution;
+    generators expand it into one X line per element while streaming. For a
+    port `w` bits wide (1 for a scalar port), a connection `w` bits wide is
+    shared by every element, while one `len(array) * w` bits wide is split
+    into consecutive `w`-bit slices, one per element, in range order.
+    """
+
+    instances:   BusRange
+    subckt_name: str
+    port_map:    dict[str, Net]   # port_name -> shared net or per-element bus
+    parameters:  dict[str, str] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    @property
+    def instance_name(self) -> str:
+        return str(self.instances)
+
+    def iter_connections(self, port_order: list[Net] | None = None) -> Iterator[tuple[Net, ...]]:
+        """
+        Yield each element's connections, one per port of port_order. Without
+        a port order (external subcircuits) the port_map order is used and
+        port widths are inferred from the connections.
+        """
+        if port_order is None:
+            port_order = self._inferred_ports()
+        n = len(self.instances)
+        columns: list[Iterator[Net]] = []
+        for port in port_order:
+            name = net_name(port)
+            try:
+                net = self.port_map[name]
+            except KeyError as exc:
+                raise ValueError(
+                    f"Subckt instance array '{self.instance_name}' is missing port {exc} "
+                    f"(required by '{self.subckt_name}')"
+                ) from exc
+            width, net_w = net_width(port), net_width(net)
+            if net_w == width:
+                columns.append(itertools.repeat(net, n))
+            elif net_w == n * width:
+                columns.append(_slices(net, width, n))
+            else:
+                raise ValueError(
+                    f"Subckt instance array '{self.instance_name}': port '{port}' is "
+                    f"{width} bit(s) wide, so it needs a {width}- or {n * width}-bit "
+                    f"connection, but is connected to {net} ({net_w} bits)"
+                )
+        return zip(*columns)
+
+    def iter_nets(self, port_order: list[Net] | None = None) -> Iterator[tuple[str, ...]]:
+        """Yield each element's nets, buses expanded bit by bit."""
+        connections = self.iter_connections(port_order)
+        if port_order is not None and all(type(p) is str for p in port_order):
+            # Scalar ports only: every element connection is a single net
+            return connections
+        return (
+            tuple(bit for net in conns for bit in net_bits(net))
+            for conns in connections
+        )
+
+    def expand(self, port_order: list[Net] | None = None) -> Iterator[SubcktInstance]:
+        """
+        Yield the individual instances, one per array element. Pass the
+        referenced SubcktDef.ports when known so bus ports split correctly.
+        """
+        ports = port_order if port_order is not None else self._inferred_ports()
+        names = [net_name(p) for p in ports]
+        for name, conns in zip(self.instances.bits(), self.iter_connections(ports)):
+            yield SubcktInstance(
+                instance_name=name,
+                subckt_name=self.subckt_name,
+                port_map=dict(zip(names, conns)),
+                parameters=self.parameters,
+            )
+
+    def _inferred_ports(self) -> list[Net]:
+        # A bus as wide as the array is split one bit per element; any other
+        # bus is taken to be a whole bus port shared by every element
+        n = len(self.instances)
+        ports: list[Net] = []
+        for port, net in self.port_map.items():
+            if isinstance(net, BusRange) and len(net) != n:
+                ports.append(BusRange(port, len(net) - 1, 0, net.brackets))
+            else:
+                ports.append(port)
+        return ports
+
+
+def _slices(bus: BusRange, width: int, count: int) -> Iterator[Net]:
+    for k in range(count):
+        yield bus.slice(k * width, width)
+
+
+def _check_width(instance_name: str, port: Net, net: Net) -> None:
+    if net_width(port) != net_width(net):
+        raise ValueError(
+            f"Subckt instance '{instance_name}': port '{port}' is {net_width(port)} "
+            f"bit(s) wide but is connected to {net} ({net_width(net)} bits)"
+        )
+
+
 # Union type alias used throughout the codebase
-AnyComponent = PrimitiveComponent | SubcktInstance
+AnyComponent = PrimitiveComponent | SubcktInstance | SubcktInstanceArray
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator
+
+from .component import AnyComponent, PrimitiveComponent, SubcktInstance
+from .primitives import PRIMITIVE_REGISTRY, PrimitiveKind
+
+# Kind code (index) -> PrimitiveKind. Codes are stored one byte per device.
+KIND_CODES: tuple[PrimitiveKind, ...] = tuple(PrimitiveKind)
+_KIND_INDEX: dict[PrimitiveKind, int] = {kind: i for i, kind in enumerate(KIND_CODES)}
+
+# Sentinel for "no model" / "no value" in the index columns
+NONE = -1
+
+
+class DeviceTable:
+    """
+    Columnar storage for the primitives of a large flat cell.
+
+    Instead of one PrimitiveComponent object per device, each attribute is a
+    column indexed by row number:
+
+      names        instance names
+      kinds        kind codes into KIND_CODES (1 byte per device)
+      nets         net indices into net_names, all rows concatenated in
+                   canonical port order; row i owns nets[net_offsets[i]:net_offsets[i+1]]
+      model_idx    index into models, or NONE
+      value_idx    index into values, or NONE
+      param_idx    index into params, a table of de-duplicated parameter dicts
+
+    net_names, models, values and params are shared lookup tables, so a net
+    or a parameter set used by many devices is stored once.
+
+    model_subckt holds one entry per model: None for a native element, or
+    the PDK port names for models emitted as X elements after PDK resolution
+    (an empty tuple means lowercase canonical port names).
+
+    Iterating a table yields AnyComponent views, so code written against
+    SubcktDef.components keeps working; generators emit straight from the
+    columns instead.
+    """
+
+    __slots__ = (
+        "names", "kinds", "nets", "net_offsets", "net_names",
+        "model_idx", "models", "model_subckt", "value_idx", "values",
+        "param_idx", "params",
+        "_net_lookup", "_model_lookup", "_value_lookup", "_param_lookup",
+    )
+
+    def __init__(self) -> None:
+        self.names:        list[str] = []
+        self.kinds:        array = array("B")
+        self.nets:         array = array("I")
+        self.net_offsets:  array = array("I", [0])
+        self.net_names:    list[str] = []
+        self.model_idx:    array = array("i")
+        self.models:       list[str] = []
+        self.model_subckt: list[tuple[str, ...] | None] = []
+        self.value_idx:    array = array("i")
+        self.values:       list[str] = []
+        self.param_idx:    array = array("I")
+        self.params:       list[dict[str, str]] = [{}]
+
+        self._net_lookup:   dict[str, int] = {}
+        self._model_lookup: dict[str, int] = {}
+        self._value_lookup: dict[str, int] = {}
+        self._param_lookup: dict[tuple[tuple[str, str], ...], int] = {(): 0}
+
+    # ------------------------------------------------------------------ #
+    # Building
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def from_components(cls, components: list[PrimitiveComponent]) -> DeviceTable:
+        table = cls()
+        for comp in components:
+            table.append_component(comp)
+        return table
+
+    def append_component(self, comp: PrimitiveComponent) -> None:
+        self.append(
+            comp.instance_name, comp.kind, comp.connections,
+            comp.parameters, comp.model_name, comp.value,
+        )
+
+    def append(
+        self,
+        instance_name: str,
+        kind: PrimitiveKind,
+        connections: dict[str, str],
+        parameters: dict[str, str],
+        model_name: str | None = None,
+        value: str | None = None,
+    ) -> None:
+        """Add one device. Nets are stored in the kind's canonical port order."""
+        spec = PRIMITIVE_REGISTRY[kind]
+        try:
+            net_ids = [self._net_id(connections[port]) for port in spec.port_order]
+        except KeyError as exc:
+            raise ValueError(
+                f"Component '{instance_name}' is missing required port {exc}. "
+                f"Expected ports: {list(spec.port_order)}"
+            ) from exc
+
+        self.names.append(instance_name)
+        self.kinds.append(_KIND_INDEX[kind])
+        self.nets.extend(net_ids)
+        self.net_offsets.append(len(self.nets))
+        self.model_idx.append(NONE if model_name is None else self._model_id(model_name))
+        self.value_idx.append(NONE if value is None else self._value_id(value))
+        self.param_idx.append(self._param_id(parameters))
+
+    def _net_id(self, net: str) -> int:
+        idx = self._net_lookup.get(net)
+        if idx is None:
+            idx = self._net_lookup[net] = len(self.net_names)
+            self.net_names.append(net)
+        return idx
+
+    def _model_id(self, model: str) -> int:
+        idx = self._model_lookup.get(model)
+        if idx is None:
+            idx = self._model_lookup[model] = len(self.models)
+            self.models.append(model)
+            self.model_subckt.append(None)
+        return idx
+
+    def _value_id(self, value: str) -> int:
+        idx = self._value_lookup.get(value)
+        if idx is None:
+            idx = self._value_lookup[value] = len(self.values)
+            self.values.append(value)
+        return idx
+
+    def _param_id(self, params: dict[str, str]) -> int:
+        key = tuple(params.items())
+        idx = self._param_lookup.get(key)
+        if idx is None:
+            idx = self._param_lookup[key] = len(self.params)
+            self.params.append(dict(params))
+        return idx
+
+    # ------------------------------------------------------------------ #
+    # Derived tables
+    # ------------------------------------------------------------------ #
+
+    def with_models(
+        self,
+        models: list[str],
+        model_subckt: list[tuple[str, ...] | None],
+    ) -> DeviceTable:
+        """
+        Return a table with a replaced model table (e.g. after PDK resolution).
+        All per-device columns and other lookup tables are shared, not copied.
+        """
+        new = DeviceTable.__new__(DeviceTable)
+        for slot in DeviceTable.__slots__:
+            setattr(new, slot, getattr(self, slot))
+        new.models = list(models)
+        new.model_subckt = list(model_subckt)
+        new._model_lookup = {}
+        for i, name in enumerate(new.models):
+            new._model_lookup.setdefault(name, i)
+        return new
+
+    # ------------------------------------------------------------------ #
+    # Row access / AnyComponent view
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __iter__(self) -> Iterator[AnyComponent]:
+        for i in range(len(self.names)):
+            yield self.row(i)
+
+    def kind(self, i: int) -> PrimitiveKind:
+        return KIND_CODES[self.kinds[i]]
+
+    def ordered_nets(self, i: int) -> list[str]:
+        """Net names of row i in canonical SPICE port order."""
+        names = self.net_names
+        return [names[n] for n in self.nets[self.net_offsets[i]:self.net_offsets[i + 1]]]
+
+    def row(self, i: int) -> AnyComponent:
+        """Materialize row i as a PrimitiveComponent (or SubcktInstance if PDK-mapped)."""
+        kind = KIND_CODES[self.kinds[i]]
+        spec = PRIMITIVE_REGISTRY[kind]
+        nets = self.ordered_nets(i)
+        m = self.model_idx[i]
+        v = self.value_idx[i]
+        params = dict(self.params[self.param_idx[i]])
+        model = self.models[m] if m != NONE else None
+        value = self.values[v] if v != NONE else None
+
+        pdk_ports = self.model_subckt[m] if m != NONE else None
+        if pdk_ports is not None:
+            ports = pdk_ports or tuple(p.lower() for p in spec.port_order)
+            if value is not None and spec.value_param:
+                params[spec.value_param] = value
+            return SubcktInstance(
+                instance_name=self.names[i],
+                subckt_name=model,
+                port_map=dict(zip(ports, nets)),
+                parameters=params,
+            )
+
+        return PrimitiveComponent(
+            instance_name=self.names[i],
+            kind=kind,
+            spec=spec,
+            connections=dict(zip(spec.port_order, nets)),
+            parameters=params,
+            model_name=model,
+            value=value,
+        )
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 
+from .bus import Net, net_bits
 from .component import AnyComponent
+from .device_table import DeviceTable
 
 
-@dataclass
+@dataclass(slots=True)
 class PdkInclude:
     """Represents a PDK .lib file + corner to be emitted before the subckt block."""
 
@@ -13,18 +16,35 @@ class PdkInclude:
     corner:   str   # Corner section name (e.g. "tt", "ff", "ss")
 
 
-@dataclass
+@dataclass(slots=True)
 class SubcktDef:
     """
     Represents a single .subckt block: its interface (ports) and contents (components).
     This is the primary container produced by the parser for each input file.
+
+    Large flat cells may keep their primitives in a columnar DeviceTable
+    (`devices`) instead of as objects in `components`; devices are emitted
+    after the components. iter_components() gives a uniform view of both.
     """
 
     name:       str
-    ports:      list[str]           # Ordered port list; order defines the .subckt line
+    ports:      list[Net]           # Ordered port list (bus ports stay ranges, e.g. D<255:0>)
     components: list[AnyComponent]
     parameters: dict[str, str] = field(default_factory=dict)
     includes:   list[str]      = field(default_factory=list)
+    devices:    DeviceTable | None = None
+
+    def port_bits(self) -> list[str]:
+        """Port names with bus ports expanded bit by bit, in declaration order."""
+        if all(type(p) is str for p in self.ports):
+            return list(self.ports)
+        return [bit for port in self.ports for bit in net_bits(port)]
+
+    def iter_components(self) -> Iterator[AnyComponent]:
+        """Yield every component, materializing device-table rows on the fly."""
+        yield from self.components
+        if self.devices is not None:
+            yield from self.devices
 
 
 @dataclass
@@ -32,15 +52,72 @@ class Netlist:
     """
     Top-level container. Holds one or more SubcktDef blocks in dependency order
     (dependencies before dependents).
+
+    A name -> SubcktDef index is kept alongside subckt_defs so that port-order
+    lookups during generation are O(1). add_subckt() keeps the index in sync,
+    and assigning a new subckt_defs list re-indexes on the next lookup. Defs
+    appended to the list directly, or renamed in place, are found by a linear
+    scan when the index misses, which also rebuilds the index; to replace a
+    def, use add_subckt().
     """
 
     subckt_defs:  list[SubcktDef]  = field(default_factory=list)
     top_cell:     str | None       = None
     pdk_includes: list[PdkInclude] = field(default_factory=list)
+    _index:       dict[str, SubcktDef] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    _indexed:     list[SubcktDef] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        self._reindex()
+
+    def _reindex(self) -> None:
+        index: dict[str, SubcktDef] = {}
+        for defn in self.subckt_defs:
+            # First definition wins, matching the loader's de-duplication rule
+            index.setdefault(defn.name, defn)
+        self._index = index
+        self._indexed = self.subckt_defs
 
     def get_subckt(self, name: str) -> SubcktDef | None:
         """Look up a SubcktDef by name (used for port-order resolution)."""
+        if self.subckt_defs is not self._indexed:
+            self._reindex()
+        defn = self._index.get(name)
+        if defn is not None and defn.name == name:
+            return defn
+        # Missed (e.g. an external subcircuit): subckt_defs may have been
+        # changed directly, so fall back to a scan
         for defn in self.subckt_defs:
             if defn.name == name:
+                self._reindex()
                 return defn
         return None
+
+    def add_subckt(self, defn: SubcktDef) -> None:
+        """
+        Add a SubcktDef, or replace the existing def of the same name in place
+        (keeping its position in dependency order).
+        """
+        for pos, existing in enumerate(self.subckt_defs):
+            if existing.name == defn.name:
+                self.subckt_defs[pos] = defn
+                break
+        else:
+            self.subckt_defs.append(defn)
+        self._index[defn.name] = defn
+
+    def with_corner(self, corner: str) -> Netlist:
+        """
+        Return a copy with every PDK include switched to `corner`. The
+        SubcktDefs are shared, not copied: corners differ only in the .lib line.
+        """
+        return Netlist(
+            subckt_defs=list(self.subckt_defs),
+            top_cell=self.top_cell,
+            pdk_includes=[PdkInclude(lib_file=inc.lib_file, corner=corner)
+                          for inc in self.pdk_includes],
+        )
@@ -1,3 +1,3 @@
-from .loader import load_file
+from .loader import LoadCache, load_file
 
-__all__ = ["load_file"]
+__all__ = ["LoadCache", "load_file"]
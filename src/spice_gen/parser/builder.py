@@ -1,45 +1,121 @@
 from __future__ import annotations
 
-from ..schema.cell_schema import CellSchema, ComponentSchema
-from ..model.component import AnyComponent, PrimitiveComponent, SubcktInstance
+from sys import intern
+from typing import TYPE_CHECKING
+
+from ..model.bus import BusRange, Net, parse_range
+from ..model.component import (
+    AnyComponent, PrimitiveComponent, SubcktInstance, SubcktInstanceArray,
+)
+from ..model.device_table import DeviceTable
 from ..model.netlist import SubcktDef
 from ..model.primitives import PrimitiveKind, PRIMITIVE_REGISTRY
 
+if TYPE_CHECKING:
+    from ..schema.cell_schema import CellSchema, ComponentSchema
+    from .trusted import RawCell
+
+
+def build_subckt_def(
+    cell: CellSchema | RawCell,
+    columnar_threshold: int | None = None,
+) -> SubcktDef:
+    """
+    Convert a validated CellSchema (or, for trusted input, a RawCell with the
+    same fields) into the internal SubcktDef model.
+
+    If columnar_threshold is set and the cell has at least that many
+    primitives, the primitives are stored in a columnar DeviceTable rather
+    than as PrimitiveComponent objects.
+    """
+    devices: DeviceTable | None = None
+    if columnar_threshold is not None and (
+        sum(1 for c in cell.components if c.type == "primitive") >= columnar_threshold
+    ):
+        devices = DeviceTable()
+        components: list[AnyComponent] = []
+        for c in cell.components:
+            if c.type == "primitive":
+                _append_primitive_row(devices, c)
+            else:
+                components.append(_build_component(c))
+    else:
+        components = [_build_component(c) for c in cell.components]
 
-def build_subckt_def(cell: CellSchema) -> SubcktDef:
-    """Convert a validated CellSchema into the internal SubcktDef model."""
-    components: list[AnyComponent] = [_build_component(c) for c in cell.components]
     return SubcktDef(
-        name=cell.name,
-        ports=list(cell.ports),
+        name=intern(cell.name),
+        ports=[_intern_net(p) for p in cell.ports],
         components=components,
-        parameters={k: str(v) for k, v in cell.parameters.items()},
+        parameters=_intern_params(cell.parameters),
         includes=list(cell.includes),
+        devices=devices,
     )
 
 
+# Net names, port names and parameter keys/values repeat across thousands of
+# devices (VDD, VSS, W, L, ...). Interning makes every occurrence share one
+# string object instead of keeping a copy per device.
+
+def _intern_nets(connections: dict[str, str]) -> dict[str, str]:
+    return {intern(port): intern(net) for port, net in connections.items()}
+
+
+def _intern_net(net: str) -> Net:
+    # Bus notation (D<255:0>, D[0:7]) is kept as a single BusRange
+    return parse_range(net) or intern(net)
+
+
+def _intern_port_map(connections: dict[str, str]) -> dict[str, Net]:
+    # Keys name the port; a bus port may be written with or without its range
+    port_map: dict[str, Net] = {}
+    for port, net in connections.items():
+        key = parse_range(port)
+        port_map[intern(key.name) if key is not None else intern(port)] = _intern_net(net)
+    return port_map
+
+
+def _intern_params(params: dict) -> dict[str, str]:
+    # Convert all parameter values to strings for uniform handling downstream
+    return {intern(k): intern(str(v)) for k, v in params.items()}
+
+
 def _build_component(c: ComponentSchema) -> AnyComponent:
     if c.type == "primitive":
         return _build_primitive(c)
+    instances = parse_range(c.id)
+    if instances is not None:
+        return _build_instance_array(c, instances)
     return _build_subckt_instance(c)
 
 
-def _build_primitive(c: ComponentSchema) -> PrimitiveComponent:
+def _split_primitive_params(
+    c: ComponentSchema,
+) -> tuple[PrimitiveKind, dict[str, str], str | None, str | None]:
     kind = PrimitiveKind(c.model)
     spec = PRIMITIVE_REGISTRY[kind]
 
-    # Convert all parameter values to strings for uniform handling downstream
-    params: dict[str, str] = {k: str(v) for k, v in c.parameters.items()}
+    params = _intern_params(c.parameters)
 
     # Extract the special value and model_name fields from the generic params dict
     value      = params.pop(spec.value_param, None)  if spec.value_param  else None
     model_name = params.pop(spec.model_param, None)  if spec.model_param  else None
+    return kind, params, value, model_name
+
+
+def _append_primitive_row(table: DeviceTable, c: ComponentSchema) -> None:
+    kind, params, value, model_name = _split_primitive_params(c)
+    table.append(intern(c.id), kind, c.connections, params, model_name, value)
+
+
+def _build_primitive(c: ComponentSchema) -> PrimitiveComponent:
+    kind, params, value, model_name = _split_primitive_params(c)
+    spec = PRIMITIVE_REGISTRY[kind]
 
     return PrimitiveComponent(
         instance_name=c.id,
         kind=kind,
         spec=spec,
-        connections=dict(c.connections),
+        connections=_intern_nets(c.connections),
         parameters=params,
         model_name=model_name,
         value=value,
@@ -49,7 +125,16 @@ def _build_primitive(c: ComponentSchema) -> PrimitiveComponent:
 def _build_subckt_instance(c: ComponentSchema) -> SubcktInstance:
     return SubcktInstance(
         instance_name=c.id,
-        subckt_name=c.model,
-        port_map=dict(c.connections),
-        parameters={k: str(v) for k, v in c.parameters.items()},
+        subckt_name=intern(c.model),
+        port_map=_intern_port_map(c.connections),
+        parameters=_intern_params(c.parameters),
+    )
+
+
+def _build_instance_array(c: ComponentSchema, instances: BusRange) -> SubcktInstanceArray:
+    return SubcktInstanceArray(
+        instances=instances,
+        subckt_name=intern(c.model),
+        port_map=_intern_port_map(c.connections),
+        parameters=_intern_params(c.parameters),
     )
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+
+from .. import __version__
+from ..model.netlist import SubcktDef
+
+# Bump whenever the pickled model layout changes so stale entries are ignored
+CACHE_FORMAT = 4
+
+# A parsed cell file: the raw 'deps' entries and the built SubcktDef
+CachedCell = tuple[list[str], SubcktDef]
+
+
+class ParseCache:
+    """
+    Opt-in on-disk cache of parsed topology files.
+
+    Entries are keyed by the file's resolved path, a SHA-256 of its content
+    and the spice_gen version, so an edited file or an upgraded tool always
+    misses. Each entry stores the file's dep list and its built SubcktDef,
+    letting the loader skip YAML parsing and schema validation on a hit.
+
+    Entries are pickles: only point this at a directory you trust.
+    """
+
+    def __init__(self, directory: str | pathlib.Path) -> None:
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, path: pathlib.Path, data: bytes, variant: str = "") -> str:
+        """
+        Cache key for a file's content. `variant` distinguishes builds of the
+        same file with different loader options (e.g. columnar storage).
+        """
+        h = hashlib.sha256()
+        h.update(f"{__version__}\0{CACHE_FORMAT}\0{variant}\0{path}\0".encode("utf-8"))
+        h.update(data)
+        return h.hexdigest()
+
+    def get(self, key: str) -> CachedCell | None:
+        """Return the cached entry for key, or None on a miss or unreadable entry."""
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated or incompatible entry — treat as a miss; put() replaces it
+            return None
+
+    def put(self, key: str, entry: CachedCell) -> None:
+        """Store an entry atomically so concurrent builds never see a partial file."""
+        target = self._entry_path(key)
+        target.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, target)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        return self.directory / key[:2] / f"{key}.pickle"
@@ -0,0 +1,213 @@
+"""
+Compiled cell libraries: a topology file and its whole dep closure in one
+binary file that loads without YAML parsing or schema validation.
+
+Layout (all offsets relative to the end of the header):
+
+    MAGIC | header length (u64) | header | string table | def blobs ...
+
+The header is a small pickle holding the format and spice_gen version, the
+top cell and the def index: (name, offset, length, referenced def names)
+per def, in dependency order. Every string in the library is stored once in
+the string table; def blobs are pickles that refer to strings (and to the
+shared PrimitiveSpec registry entries) by persistent id, so loaded names are
+interned and shared exactly as after a fresh load. Loading one cell decodes
+only the string table and the blobs of that cell and its deps.
+
+Libraries are pickles: only load files you built or trust.
+"""
+from __future__ import annotations
+
+import io
+import pathlib
+import pickle
+import struct
+from sys import intern
+from typing import Any, BinaryIO
+
+from .. import __version__, profiling, tracing
+from ..model.component import SubcktInstance, SubcktInstanceArray
+from ..model.netlist import Netlist, SubcktDef
+from ..model.primitives import PRIMITIVE_REGISTRY, PrimitiveKind
+from .loader import LIBRARY_SUFFIX, is_library, load_file  # noqa: F401  (is_library re-exported)
+
+MAGIC = b"SPICEGENLIB\n"
+
+# Bump whenever the library layout or the pickled model layout changes
+LIBRARY_FORMAT = 1
+
+_LENGTH = struct.Struct("<Q")
+
+# Persistent ids below zero name the shared PrimitiveSpec registry entries
+_SPECS = [PRIMITIVE_REGISTRY[kind] for kind in PrimitiveKind]
+_SPEC_IDS = {id(spec): -1 - i for i, spec in enumerate(_SPECS)}
+
+
+# ------------------------------------------------------------------ #
+# Writing
+# ------------------------------------------------------------------ #
+
+
+class _BlobPickler(pickle.Pickler):
+    """Pickler that replaces strings and registry specs with persistent ids."""
+
+    def __init__(self, file: BinaryIO, strings: dict[str, int]) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.strings = strings
+
+    def persistent_id(self, obj: Any) -> int | None:
+        if type(obj) is str:
+            index = self.strings.get(obj)
+            if index is None:
+                index = self.strings[obj] = len(self.strings)
+            return index
+        return _SPEC_IDS.get(id(obj))
+
+
+def write_library(netlist: Netlist, path: str | pathlib.Path) -> int:
+    """
+    Write every def of `netlist` into a compiled library at `path`.
+    Returns the number of bytes written.
+    """
+    defined = {d.name for d in netlist.subckt_defs}
+    strings: dict[str, int] = {}
+    blobs: list[bytes] = []
+    index: list[tuple[str, int, int, tuple[str, ...]]] = []
+
+    offset = 0
+    for defn in netlist.subckt_defs:
+        buf = io.BytesIO()
+        _BlobPickler(buf, strings).dump(defn)
+        blob = buf.getvalue()
+        index.append((defn.name, offset, len(blob), _referenced(defn, defined)))
+        blobs.append(blob)
+        offset += len(blob)
+
+    table = pickle.dumps(list(strings), protocol=pickle.HIGHEST_PROTOCOL)
+    header = pickle.dumps({
+        "format":  LIBRARY_FORMAT,
+        "version": __version__,
+        "top":     netlist.top_cell,
+        "strings": (0, len(table)),
+        "defs":    [(n, o + len(table), size, deps) for n, o, size, deps in index],
+    }, protocol=pickle.HIGHEST_PROTOCOL)
+
+    path = pathlib.Path(path)
+    with path.open("wb") as f:
+        f.write(MAGIC)
+        f.write(_LENGTH.pack(len(header)))
+        f.write(header)
+        f.write(table)
+        for blob in blobs:
+            f.write(blob)
+        return f.tell()
+
+
+def _referenced(defn: SubcktDef, defined: set[str]) -> tuple[str, ...]:
+    """Names of the library defs instantiated by defn, in first-use order."""
+    names = {
+        c.subckt_name: None
+        for c in defn.components
+        if isinstance(c, (SubcktInstance, SubcktInstanceArray)) and c.subckt_name in defined
+    }
+    return tuple(names)
+
+
+# ------------------------------------------------------------------ #
+# Reading
+# ------------------------------------------------------------------ #
+
+
+def load_library(path: str | pathlib.Path, cell: str | None = None) -> Netlist:
+    """
+    Load a compiled library. With `cell`, only that cell and the defs it
+    depends on are decoded and the returned Netlist has `cell` on top.
+    Raises ValueError for a file that is not a library, was written by a
+    different spice_gen version, or does not contain `cell`.
+    """
+    path = pathlib.Path(path)
+    profiling.count("files")
+    with tracing.span("load", path=path, cell=cell), path.open("rb") as f:
+        header = _read_header(f, path)
+        data_start = f.tell()
+        entries = header["defs"]
+        if cell is not None:
+            entries = _closure(entries, cell, path)
+
+        with tracing.span("read", path=path):
+            lookup = _read_strings(f, data_start, *header["strings"])
+            defs = [
+                _read_def(f, data_start + offset, length, lookup)
+                for _, offset, length, _ in entries
+            ]
+    return Netlist(subckt_defs=defs, top_cell=cell or header["top"])
+
+
+def library_cells(path: str | pathlib.Path) -> list[str]:
+    """Names of the defs in a compiled library, in dependency order."""
+    path = pathlib.Path(path)
+    with path.open("rb") as f:
+        return [name for name, *_ in _read_header(f, path)["defs"]]
+
+
+def _read_header(f: BinaryIO, path: pathlib.Path) -> dict:
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError(f"'{path}' is not a compiled spice_gen library")
+    (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+    header = pickle.loads(f.read(length))
+    if header.get("format") != LIBRARY_FORMAT or header.get("version") != __version__:
+        raise ValueError(
+            f"'{path}' was compiled by spice_gen {header.get('version')} "
+            f"(library format {header.get('format')}); recompile it with "
+            f"spice_gen {__version__}"
+        )
+    return header
+
+
+def _closure(entries: list, cell: str, path: pathlib.Path) -> list:
+    """The index entries of `cell` and everything it depends on, in file order."""
+    by_name = {entry[0]: entry for entry in entries}
+    if cell not in by_name:
+        raise ValueError(
+            f"Cell '{cell}' is not in library '{path}'. "
+            f"Available: {sorted(by_name)}"
+        )
+    needed: set[str] = set()
+    pending = [cell]
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending.extend(by_name[name][3])
+    return [entry for entry in entries if entry[0] in needed]
+
+
+def _read_strings(f: BinaryIO, data_start: int, offset: int, length: int) -> dict[int, Any]:
+    f.seek(data_start + offset)
+    lookup: dict[int, Any] = dict(enumerate(intern(s) for s in pickle.loads(f.read(length))))
+    for i, spec in enumerate(_SPECS):
+        lookup[-1 - i] = spec
+    return lookup
+
+
+def _read_def(f: BinaryIO, offset: int, length: int, lookup: dict[int, Any]) -> SubcktDef:
+    f.seek(offset)
+    unpickler = pickle.Unpickler(io.BytesIO(f.read(length)))
+    # A C-level lookup: resolving a string reference runs no Python code
+    unpickler.persistent_load = lookup.__getitem__
+    return unpickler.load()
+
+
+def compile_library(
+    path: str | pathlib.Path,
+    output: str | pathlib.Path,
+    **load_kwargs: Any,
+) -> Netlist:
+    """
+    Load a topology file with its deps (see load_file for `load_kwargs`) and
+    write it as a compiled library at `output`. Returns the loaded Netlist.
+    """
+    netlist = load_file(path, **load_kwargs)
+    write_library(netlist, output)
+    return netlist
+
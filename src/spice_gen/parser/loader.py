@@ -1,16 +1,101 @@
 from __future__ import annotations
 
-import json
+import functools
 import pathlib
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-import yaml
-
-from ..schema.cell_schema import TopLevelSchema
+from .. import profiling, tracing
 from ..model.netlist import Netlist, SubcktDef
-from .builder import build_subckt_def
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from .cache import CachedCell, ParseCache
+
+# The schema (pydantic), YAML backend and disk cache are imported where they
+# are first needed: a run served entirely from the parse cache never loads
+# pydantic or PyYAML. Under a Profile they are imported up front instead (see
+# _import_parsers), so their one-time cost is not billed to read/validate.
+
+# Compiled cell libraries (see parser.library); defined here so recognising
+# one does not import the library reader
+LIBRARY_SUFFIX = ".sglib"
+
+# Threads used to read and parse the dep files of a hierarchy concurrently
+PREFETCH_THREADS = 8
+
+
+class LoadCache:
+    """
+    Per-process cache shared by several load_file() calls.
+
+    parsed:  resolved path -> (raw deps entries, the file's own SubcktDef)
+    loaded:  resolved path -> SubcktDefs in dependency order (deps first,
+             the file's own cell last)
+    deps:    resolved path -> resolved paths of its direct deps
+
+    Keeping the per-file parse separate from the assembled dep lists lets
+    invalidate() drop a single edited file and re-assemble its dependents
+    without re-parsing them.
+    """
+
+    def __init__(self) -> None:
+        self.parsed: dict[pathlib.Path, CachedCell] = {}
+        self.loaded: dict[pathlib.Path, list[SubcktDef]] = {}
+        self.deps:   dict[pathlib.Path, list[pathlib.Path]] = {}
+
+    def __contains__(self, path: object) -> bool:
+        return path in self.loaded
+
+    def files(self) -> list[pathlib.Path]:
+        """All files known to this cache: parsed ones and every declared dep."""
+        files = dict.fromkeys(self.parsed)
+        for parent, children in self.deps.items():
+            files.setdefault(parent)
+            files.update(dict.fromkeys(children))
+        return list(files)
 
-def load_file(path: str | pathlib.Path) -> Netlist:
+    def dependents(self, path: pathlib.Path) -> set[pathlib.Path]:
+        """Files that depend on `path`, directly or transitively (excluding itself)."""
+        reverse: dict[pathlib.Path, list[pathlib.Path]] = {}
+        for parent, children in self.deps.items():
+            for child in children:
+                reverse.setdefault(child, []).append(parent)
+
+        result: set[pathlib.Path] = set()
+        stack = [path]
+        while stack:
+            for parent in reverse.get(stack.pop(), ()):
+                if parent not in result:
+                    result.add(parent)
+                    stack.append(parent)
+        result.discard(path)
+        return result
+
+    def invalidate(self, path: str | pathlib.Path) -> set[pathlib.Path]:
+        """
+        Forget a changed file. Its parse is dropped; the assembled dep lists of
+        the file and of everything depending on it are dropped so they are
+        rebuilt on the next load. Returns the file and all its dependents.
+        """
+        path = pathlib.Path(path).resolve()
+        affected = self.dependents(path) | {path}
+        self.parsed.pop(path, None)
+        self.deps.pop(path, None)
+        for p in affected:
+            self.loaded.pop(p, None)
+        return affected
+
+
+def load_file(
+    path: str | pathlib.Path,
+    cache: LoadCache | None = None,
+    cache_dir: str | pathlib.Path | None = None,
+    columnar_threshold: int | None = None,
+    validate: bool = True,
+    prefetch_threads: int = PREFETCH_THREADS,
+) -> Netlist:
     """
     Load a YAML or JSON topology file, validate it, and return a Netlist.
 
@@ -21,26 +106,75 @@ def load_file(path: str | pathlib.Path) -> Netlist:
 
     Dep paths are resolved relative to the file that declares them.
     Circular dependencies raise ValueError.
+
+    Pass the same LoadCache to several calls to parse each file only once
+    across all of them (e.g. when generating a whole cell library). The
+    SubcktDefs in the cache are shared between the returned Netlists and
+    must not be mutated.
+
+    `cache_dir` enables a persistent on-disk parse cache (see ParseCache):
+    files whose content is unchanged since a previous run are not re-parsed
+    or re-validated.
+
+    `columnar_threshold` stores the primitives of any cell with at least that
+    many primitives in a columnar DeviceTable (see SubcktDef.devices).
+
+    A compiled library (.sglib, see parser.library) is loaded directly; it
+    already holds every dep, so the other options do not apply.
+
+    `validate=False` is the trusted fast path for machine-generated input
+    that was validated upstream: cells are built straight from the parsed
+    dicts with only minimal structural checks (see parser.trusted).
+
+    Once the top file is parsed, its dep files are read and parsed on up to
+    `prefetch_threads` threads, hiding per-file latency on network
+    filesystems; 1 reads them one at a time. The result, and any error
+    raised, is the same either way.
     """
     path = pathlib.Path(path).resolve()
-    all_defs = _load_recursive(path, loaded={}, in_progress=set())
-    return Netlist(subckt_defs=all_defs, top_cell=all_defs[-1].name)
+    if is_library(path):
+        from .library import load_library
+        return load_library(path)
+    if cache is None:
+        cache = LoadCache()
+    disk_cache = None
+    if cache_dir is not None:
+        from .cache import ParseCache
+        disk_cache = ParseCache(cache_dir)
+    parse = functools.partial(
+        _parse_cell, disk_cache=disk_cache, columnar_threshold=columnar_threshold,
+        validate=validate,
+    )
+    if profiling.active() is not None:
+        _import_parsers(validate)
+    with tracing.span("load", path=path):
+        if prefetch_threads > 1:
+            parse = _prefetch(path, cache, parse, prefetch_threads)
+        all_defs = _load_recursive(path, cache, in_progress=set(), parse=parse)
+    return Netlist(subckt_defs=list(all_defs), top_cell=all_defs[-1].name)
+
+
+def is_library(path: str | pathlib.Path) -> bool:
+    """True when `path` names a compiled cell library."""
+    return pathlib.Path(path).suffix.lower() == LIBRARY_SUFFIX
 
 
 def _load_recursive(
     path: pathlib.Path,
-    loaded: dict[pathlib.Path, list[SubcktDef]],
+    cache: LoadCache,
     in_progress: set[pathlib.Path],
+    parse: Callable[[pathlib.Path], CachedCell],
 ) -> list[SubcktDef]:
     """
     Recursively load a cell file and all its deps.
 
     Returns a list of SubcktDefs in dependency order (deps first, cell last).
-    Uses `loaded` to avoid reprocessing shared deps (diamond dependencies).
-    Uses `in_progress` to detect cycles.
+    Uses `cache` to avoid reprocessing shared deps (diamond dependencies).
+    Uses `in_progress` to detect cycles. `parse` turns one file into its
+    (deps, SubcktDef) pair.
     """
-    if path in loaded:
-        return loaded[path]
+    if path in cache.loaded:
+        return cache.loaded[path]
 
     if path in in_progress:
         raise ValueError(
@@ -50,42 +184,185 @@ def _load_recursive(
 
     in_progress.add(path)
 
-    raw = _read_raw(path)
-    validated = TopLevelSchema.model_validate(raw)
+    if path not in cache.parsed:
+        cache.parsed[path] = parse(path)
+    deps, top_def = cache.parsed[path]
 
     # Collect SubcktDefs from all deps first, in order, without duplicates
     result: list[SubcktDef] = []
     seen_names: set[str] = set()
+    # Edges are recorded as they are discovered so that invalidate() still
+    # sees them if loading a dep fails part-way
+    dep_paths: list[pathlib.Path] = []
+    cache.deps[path] = dep_paths
 
-    for dep_str in validated.cell.deps:
+    for dep_str in deps:
         dep_path = (path.parent / dep_str).resolve()
         if not dep_path.exists():
             raise ValueError(
                 f"Dep not found: '{dep_str}' (resolved to '{dep_path}') "
                 f"declared in '{path}'"
             )
-        dep_defs = _load_recursive(dep_path, loaded, in_progress)
+        dep_paths.append(dep_path)
+        dep_defs = _load_recursive(dep_path, cache, in_progress, parse)
         for defn in dep_defs:
             if defn.name not in seen_names:
                 result.append(defn)
                 seen_names.add(defn.name)
 
     # Append this cell's own SubcktDef last
-    top_def = build_subckt_def(validated.cell)
     result.append(top_def)
 
     in_progress.discard(path)
-    loaded[path] = result
+    cache.loaded[path] = result
     return result
 
 
-def _read_raw(path: pathlib.Path) -> dict:
+def _prefetch(
+    root: pathlib.Path,
+    cache: LoadCache,
+    parse: Callable[[pathlib.Path], CachedCell],
+    threads: int,
+) -> Callable[[pathlib.Path], CachedCell]:
+    """
+    Parse every file reachable from `root` that is not cached yet, the deps
+    on a thread pool, and return a parse function serving those results.
+
+    Only parsing happens here. _load_recursive still walks the graph in
+    declaration order, so dependency order, de-duplication, cycle detection
+    and the first error raised are unchanged. A failed parse is kept in its
+    future and re-raised when the walk reaches that file.
+    """
+    if root in cache.loaded:
+        return parse
+    if root not in cache.parsed:
+        cache.parsed[root] = parse(root)
+
+    futures: dict[pathlib.Path, Future[CachedCell]] = {}
+
+    def deps_of(path: pathlib.Path, entry: CachedCell) -> list[pathlib.Path]:
+        return [(path.parent / dep).resolve() for dep in entry[0]]
+
+    pending = deps_of(root, cache.parsed[root])
+    if not pending:
+        return parse
+
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    seen = {root}
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="spice_gen-load") as pool:
+        running: dict[Future[CachedCell], pathlib.Path] = {}
+        while pending or running:
+            # Cached files are expanded in place: the loop also visits
+            # the deps appended to `pending` while it runs
+            for path in pending:
+                if path in seen or path in cache.loaded:
+                    continue
+                seen.add(path)
+                if path in cache.parsed:
+                    pending.extend(deps_of(path, cache.parsed[path]))
+                elif path.exists():
+                    # Missing deps are reported by _load_recursive, with context
+                    future = pool.submit(parse, path)
+                    futures[path] = future
+                    running[future] = path
+            pending = []
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = running.pop(future)
+                if future.exception() is None:
+                    pending.extend(deps_of(path, future.result()))
+
+    def prefetched(path: pathlib.Path) -> CachedCell:
+        future = futures.pop(path, None)
+        return parse(path) if future is None else future.result()
+
+    return prefetched
+
+
+def _parse_cell(
+    path: pathlib.Path,
+    disk_cache: ParseCache | None = None,
+    columnar_threshold: int | None = None,
+    validate: bool = True,
+) -> CachedCell:
+    """Parse, validate and build one file, going through the disk cache if enabled."""
+    profiling.count("files")
+    with tracing.span("file", path=path):
+        return _read_cell(path, disk_cache, columnar_threshold, validate)
+
+
+def _read_cell(
+    path: pathlib.Path,
+    disk_cache: ParseCache | None,
+    columnar_threshold: int | None,
+    validate: bool,
+) -> CachedCell:
+    if disk_cache is None:
+        with tracing.span("read", path=path):
+            raw = _read_raw(path)
+        return _build_cell(raw, columnar_threshold, validate)
+
+    with tracing.span("read", path=path):
+        data = path.read_bytes()
+        # Trusted builds are cached apart so a validated load never reuses one
+        variant = f"columnar={columnar_threshold}" if columnar_threshold is not None else ""
+        if not validate:
+            variant += ";trusted"
+        key = disk_cache.key(path, data, variant)
+        entry = disk_cache.get(key)
+        if entry is not None:
+            profiling.count("cached_files")
+            return entry
+        raw = _read_raw(path, data.decode("utf-8"))
+
+    entry = _build_cell(raw, columnar_threshold, validate)
+    disk_cache.put(key, entry)
+    return entry
+
+
+def _build_cell(
+    raw: dict,
+    columnar_threshold: int | None = None,
+    validate: bool = True,
+) -> CachedCell:
+    from .builder import build_subckt_def
+
+    with tracing.span("validate", trusted=not validate):
+        if validate:
+            from ..schema.cell_schema import TopLevelSchema
+            cell = TopLevelSchema.model_validate(raw).cell
+        else:
+            from .trusted import trusted_cell
+            cell = trusted_cell(raw)
+    with tracing.span("build"):
+        defn = build_subckt_def(cell, columnar_threshold)
+    return list(cell.deps), defn
+
+
+def _import_parsers(validate: bool) -> None:
+    """Import the parsing modules under their own `import` span."""
+    with tracing.span("import"):
+        from .. import yaml_backend  # noqa: F401
+        from . import builder  # noqa: F401
+        if validate:
+            from ..schema import cell_schema  # noqa: F401
+        else:
+            from . import trusted  # noqa: F401
+
+
+def _read_raw(path: pathlib.Path, text: str | None = None) -> dict:
     suffix = path.suffix.lower()
-    text = path.read_text(encoding="utf-8")
-    if suffix in (".yaml", ".yml"):
-        return yaml.safe_load(text)
+    if suffix not in (".yaml", ".yml", ".json"):
+        raise ValueError(
+            f"Unsupported file extension '{suffix}'. Expected .yaml, .yml, or .json."
+        )
+    if text is None:
+        text = path.read_text(encoding="utf-8")
     if suffix == ".json":
+        import json
         return json.loads(text)
-    raise ValueError(
-        f"Unsupported file extension '{suffix}'. Expected .yaml, .yml, or .json."
-    )
+    from ..yaml_backend import load_yaml
+    return load_yaml(text)
@@ -0,0 +1,107 @@
+"""
+Trusted ingestion: build cells from raw dicts without pydantic validation.
+
+For machine-generated topology files that were already validated upstream.
+Only the structure the builder relies on is checked (the required keys and
+their container types, that names, ports, deps, includes, ids and nets are
+strings, the component type and primitive model). The id syntax, duplicate
+ids and array overlaps are not checked. Invalid input that passes these
+checks may fail later or produce a wrong netlist.
+"""
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from ..model.primitives import PrimitiveKind
+
+_PRIMITIVE_MODELS = frozenset(k.value for k in PrimitiveKind)
+_COMPONENT_TYPES = ("primitive", "subckt")
+
+
+class RawComponent(NamedTuple):
+    """A component as read from the file; stands in for ComponentSchema."""
+
+    id:          str
+    type:        str
+    model:       str
+    connections: dict[str, str]
+    parameters:  dict[str, Any]
+
+
+class RawCell(NamedTuple):
+    """A cell as read from the file; stands in for CellSchema."""
+
+    name:       str
+    ports:      list[str]
+    parameters: dict[str, Any]
+    includes:   list[str]
+    deps:       list[str]
+    components: list[RawComponent]
+
+
+def trusted_cell(raw: Any) -> RawCell:
+    """
+    Convert a parsed topology document into a RawCell with minimal checks.
+    Raises ValueError when the document does not have the expected shape.
+    """
+    cell = raw.get("cell") if isinstance(raw, dict) else None
+    if not isinstance(cell, dict):
+        raise ValueError("Top-level 'cell' mapping is missing")
+    name = cell.get("name")
+    ports = cell.get("ports")
+    comps = cell.get("components")
+    if not isinstance(name, str):
+        raise ValueError("Cell 'name' must be a string")
+    if not isinstance(ports, list) or not ports:
+        raise ValueError(f"Cell '{name}': 'ports' must be a non-empty list")
+    if not isinstance(comps, list):
+        raise ValueError(f"Cell '{name}': 'components' must be a list")
+    if not all(type(p) is str for p in ports):
+        raise ValueError(f"Cell '{name}': 'ports' must be a list of strings")
+
+    includes = cell.get("includes") or []
+    deps = cell.get("deps") or []
+    for field, value in (("includes", includes), ("deps", deps)):
+        if not isinstance(value, list) or not all(type(v) is str for v in value):
+            raise ValueError(f"Cell '{name}': '{field}' must be a list of strings")
+
+    return RawCell(
+        name=name,
+        ports=ports,
+        parameters=cell.get("parameters") or {},
+        includes=includes,
+        deps=deps,
+        components=[_trusted_component(name, i, c) for i, c in enumerate(comps)],
+    )
+
+
+def _trusted_component(cell: str, index: int, c: Any) -> RawComponent:
+    if not isinstance(c, dict):
+        raise ValueError(f"Cell '{cell}': component #{index} must be a mapping")
+    try:
+        comp = RawComponent(
+            c["id"], c["type"], c["model"], c["connections"], c.get("parameters") or {},
+        )
+    except KeyError as exc:
+        raise ValueError(
+            f"Cell '{cell}': component #{index} is missing required field {exc}"
+        ) from None
+    if type(comp.id) is not str:
+        raise ValueError(f"Cell '{cell}': component #{index}: 'id' must be a string")
+    if comp.type not in _COMPONENT_TYPES:
+        raise ValueError(
+            f"Cell '{cell}': component '{comp.id}' has invalid type '{comp.type}'"
+        )
+    if comp.type == "primitive" and comp.model not in _PRIMITIVE_MODELS:
+        raise ValueError(
+            f"Cell '{cell}': component '{comp.id}': unknown primitive model '{comp.model}'"
+        )
+    if not isinstance(comp.connections, dict):
+        raise ValueError(f"Cell '{cell}': component '{comp.id}': 'connections' must be a mapping")
+    if type(comp.model) is not str or not all(
+        type(p) is str and type(n) is str for p, n in comp.connections.items()
+    ):
+        raise ValueError(
+            f"Cell '{cell}': component '{comp.id}': model, ports and nets must be strings"
+        )
+    return comp
@@ -1,4 +1,4 @@
 from .pdk_config import PdkConfig, ModelEntry
-from .resolver import load_pdk, resolve
+from .resolver import invalidate_pdk_cache, load_pdk, resolve
 
-__all__ = ["PdkConfig", "ModelEntry", "load_pdk", "resolve"]
+__all__ = ["PdkConfig", "ModelEntry", "load_pdk", "invalidate_pdk_cache", "resolve"]
@@ -34,6 +34,28 @@ class PdkConfig(BaseModel):
             )
         return self
 
+    def select_corners(self, spec: str) -> list[str]:
+        """
+        Expand a corner list such as 'tt,ff,ss', or 'all' for every corner
+        of this PDK, in the order given. Unknown corners raise ValueError.
+        """
+        if spec.strip() == "all":
+            return list(self.corners)
+        selected: list[str] = []
+        for corner in (c.strip() for c in spec.split(",")):
+            if not corner:
+                continue
+            if corner not in self.corners:
+                raise ValueError(
+                    f"Unknown corner '{corner}' for PDK '{self.name}'. "
+                    f"Valid corners: {self.corners}"
+                )
+            if corner not in selected:
+                selected.append(corner)
+        if not selected:
+            raise ValueError("No corners selected")
+        return selected
+
     def resolve_model(self, logical_name: str) -> ModelEntry | None:
         """Return the ModelEntry for a logical name, or None if not mapped."""
         return self.models.get(logical_name)
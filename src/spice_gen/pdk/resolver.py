@@ -1,21 +1,81 @@
 from __future__ import annotations
 
 import pathlib
+import threading
+from collections import OrderedDict
+from dataclasses import replace
 
-import yaml
-
+from .. import tracing
+from ..yaml_backend import load_yaml
 from ..model.component import AnyComponent, PrimitiveComponent, SubcktInstance
+from ..model.device_table import DeviceTable
 from ..model.netlist import Netlist, PdkInclude, SubcktDef
 from .pdk_config import ModelEntry, PdkConfig
 
 
-def load_pdk(path: str | pathlib.Path) -> PdkConfig:
-    """Load and validate a PDK YAML config file."""
+# ------------------------------------------------------------------ #
+# PDK config loading (process-wide LRU cache)
+# ------------------------------------------------------------------ #
+
+# Number of distinct PDK configs kept in memory
+PDK_CACHE_SIZE = 8
+
+# resolved path -> ((st_mtime_ns, st_size), config), least recently used first
+_pdk_cache: OrderedDict[pathlib.Path, tuple[tuple[int, int], PdkConfig]] = OrderedDict()
+_pdk_cache_lock = threading.Lock()
+
+
+def load_pdk(path: str | pathlib.Path, use_cache: bool = True) -> PdkConfig:
+    """
+    Load and validate a PDK YAML config file.
+
+    Configs are cached process-wide, keyed by resolved path and the file's
+    modification time and size, so repeated loads of an unchanged file
+    return the same PdkConfig without reading it again. An edited file is
+    reloaded automatically. The returned config is shared: treat it as
+    read-only. Pass use_cache=False to always read the file.
+    """
     path = pathlib.Path(path)
-    raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+    if not use_cache:
+        return _read_pdk(path)
+
+    key = path.resolve()
+    st = key.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _pdk_cache_lock:
+        hit = _pdk_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            _pdk_cache.move_to_end(key)
+            return hit[1]
+
+    pdk = _read_pdk(key)
+    with _pdk_cache_lock:
+        _pdk_cache[key] = (stamp, pdk)
+        _pdk_cache.move_to_end(key)
+        while len(_pdk_cache) > PDK_CACHE_SIZE:
+            _pdk_cache.popitem(last=False)
+    return pdk
+
+
+def invalidate_pdk_cache(path: str | pathlib.Path | None = None) -> None:
+    """Drop one cached PDK config, or every cached config when path is None."""
+    with _pdk_cache_lock:
+        if path is None:
+            _pdk_cache.clear()
+        else:
+            _pdk_cache.pop(pathlib.Path(path).resolve(), None)
+
+
+def _read_pdk(path: pathlib.Path) -> PdkConfig:
+    raw = load_yaml(path.read_text(encoding="utf-8"))
     return PdkConfig.model_validate(raw)
 
 
+# ------------------------------------------------------------------ #
+# Resolution
+# ------------------------------------------------------------------ #
+
+
 def resolve(
     netlist: Netlist,
     pdk: PdkConfig,
@@ -31,10 +91,17 @@ def resolve(
     Components whose model_name is not in the PDK mapping are left unchanged,
     preserving backward compatibility with explicit (non-logical) model names.
 
+    Nothing is copied that resolution does not change: untouched defs and
+    components are the input objects themselves, and mapped components share
+    their connection and parameter dicts with the input. Treat the result as
+    read-only alongside the input netlist.
+
     A PdkInclude(.lib file + corner) is injected into the returned Netlist.
     """
     effective_corner = corner or pdk.default_corner
-    new_defs = [_resolve_def(defn, pdk) for defn in netlist.subckt_defs]
+    resolver = _Resolver(pdk)
+    with tracing.span("resolve", pdk=pdk.name, corner=effective_corner):
+        new_defs = [resolver.resolve_def(defn) for defn in netlist.subckt_defs]
     pdk_inc = PdkInclude(lib_file=str(pdk.lib_path), corner=effective_corner)
     return Netlist(
         subckt_defs=new_defs,
@@ -43,37 +110,91 @@ def resolve(
     )
 
 
-def _resolve_def(defn: SubcktDef, pdk: PdkConfig) -> SubcktDef:
-    return SubcktDef(
-        name=defn.name,
-        ports=defn.ports,
-        components=[_resolve_component(c, pdk) for c in defn.components],
-        parameters=defn.parameters,
-        includes=defn.includes,
-    )
-
-
-def _resolve_component(comp: AnyComponent, pdk: PdkConfig) -> AnyComponent:
-    if not isinstance(comp, PrimitiveComponent) or comp.model_name is None:
-        return comp
+class _Resolver:
+    """
+    State for one resolve() call; each logical model name is looked up once.
+    """
 
-    entry = pdk.resolve_model(comp.model_name)
-    if entry is None:
-        return comp  # Unknown logical name — pass through unchanged
+    __slots__ = ("pdk", "_entries")
+
+    def __init__(self, pdk: PdkConfig) -> None:
+        self.pdk = pdk
+        self._entries: dict[str, ModelEntry | None] = {}
+
+    def entry(self, model_name: str) -> ModelEntry | None:
+        try:
+            return self._entries[model_name]
+        except KeyError:
+            entry = self._entries[model_name] = self.pdk.resolve_model(model_name)
+            return entry
+
+    def resolve_def(self, defn: SubcktDef) -> SubcktDef:
+        components = self._resolve_components(defn.components)
+        devices = defn.devices
+        if devices is not None:
+            devices = _resolve_table(devices, self.pdk)
+        if components is None and devices is defn.devices:
+            return defn  # Nothing mapped — share the whole def
+        return SubcktDef(
+            name=defn.name,
+            ports=defn.ports,
+            components=defn.components if components is None else components,
+            parameters=defn.parameters,
+            includes=defn.includes,
+            devices=devices,
+        )
+
+    def _resolve_components(self, components: list[AnyComponent]) -> list[AnyComponent] | None:
+        """Resolved component list, or None when every component is unchanged."""
+        resolved: list[AnyComponent] | None = None
+        for i, comp in enumerate(components):
+            new = self.resolve_component(comp)
+            if new is not comp and resolved is None:
+                resolved = components[:i]
+            if resolved is not None:
+                resolved.append(new)
+        return resolved
+
+    def resolve_component(self, comp: AnyComponent) -> AnyComponent:
+        if not isinstance(comp, PrimitiveComponent) or comp.model_name is None:
+            return comp
+        entry = self.entry(comp.model_name)
+        if entry is None:
+            return comp  # Unknown logical name — pass through unchanged
+        return _resolve_component(comp, entry)
+
+
+def _resolve_table(table: DeviceTable, pdk: PdkConfig) -> DeviceTable:
+    """
+    Resolve a columnar device table by rewriting its model table only.
 
+    Each distinct model name is looked up once; the per-device columns are
+    shared with the input table. Models mapped with is_subckt=True are marked
+    so the rows are emitted as X elements.
+    """
+    models = list(table.models)
+    model_subckt = list(table.model_subckt)
+    changed = False
+    for m, name in enumerate(table.models):
+        if table.model_subckt[m] is not None:
+            continue  # Already resolved
+        entry = pdk.resolve_model(name)
+        if entry is None:
+            continue  # Unknown logical name — pass through unchanged
+        models[m] = entry.pdk_name
+        if entry.is_subckt:
+            model_subckt[m] = tuple(entry.ports) if entry.ports else ()
+        changed = True
+    return table.with_models(models, model_subckt) if changed else table
+
+
+def _resolve_component(comp: PrimitiveComponent, entry: ModelEntry) -> AnyComponent:
     if entry.is_subckt:
         return _to_subckt_instance(comp, entry)
-
-    # Simple model name swap — keep as PrimitiveComponent
-    return PrimitiveComponent(
-        instance_name=comp.instance_name,
-        kind=comp.kind,
-        spec=comp.spec,
-        connections=comp.connections,
-        parameters=comp.parameters,
-        model_name=entry.pdk_name,
-        value=comp.value,
-    )
+    if entry.pdk_name == comp.model_name:
+        return comp
+    # Simple model name swap — only the name differs; the dicts are shared
+    return replace(comp, model_name=entry.pdk_name)
 
 
 def _to_subckt_instance(comp: PrimitiveComponent, entry: ModelEntry) -> SubcktInstance:
@@ -95,10 +216,10 @@ def _to_subckt_instance(comp: PrimitiveComponent, entry: ModelEntry) -> SubcktIn
 
     port_map = dict(zip(pdk_ports, ordered_nets))
 
-    # Merge value into parameters for passive devices
-    params = dict(comp.parameters)
+    # Merge value into parameters for passive devices; copy only then
+    params = comp.parameters
     if comp.value is not None and comp.spec.value_param:
-        params[comp.spec.value_param] = comp.value
+        params = {**params, comp.spec.value_param: comp.value}
 
     return SubcktInstance(
         instance_name=comp.instance_name,
@@ -0,0 +1,246 @@
+"""
+Per-phase wall time, peak memory and counters for `spice_gen --profile`.
+
+A Profile is a Tracer (see tracing) that aggregates the pipeline's spans by
+name. The loader and output writer also bump counters with count(), which
+is a no-op unless a Profile is active (see profiling()).
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TextIO
+
+from . import tracing
+
+if TYPE_CHECKING:
+    from .model.netlist import Netlist
+
+# Phases in pipeline order; reports list them in this order
+PHASES = ("import", "read", "validate", "build", "resolve", "generate", "write")
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    """Totals for one phase over every time it ran."""
+
+    calls:      int = 0
+    seconds:    float = 0.0   # Wall time, excluding nested phases
+    peak_bytes: int = 0       # Highest allocation above the phase's starting point
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "wall_ms": round(self.seconds * 1e3, 3),
+            "peak_bytes": self.peak_bytes,
+        }
+
+
+@dataclass(slots=True)
+class _Frame:
+    stats:     PhaseStats
+    start:     float
+    base:      int         # Traced memory when the phase started
+    peak:      int = 0     # Highest traced memory seen so far
+    nested:    float = 0.0  # Time spent in nested phases
+
+
+@dataclass
+class Profile(tracing.Tracer):
+    """
+    Accumulates per-phase statistics and named counters.
+
+    Spans named in PHASES are recorded as phases; other spans are ignored.
+    Phases may nest (e.g. write inside generate when output is streamed);
+    a phase's time excludes its nested phases, and its peak memory includes
+    them. Phase times from concurrent threads (dep files are parsed on a
+    pool) add up, so they may exceed the total wall time; tracemalloc has a
+    single peak, so peaks of overlapping phases are approximate.
+    """
+
+    phases:  dict[str, PhaseStats] = field(default_factory=dict)
+    counts:  dict[str, int] = field(default_factory=dict)
+    seconds: float = 0.0
+    _local:  threading.local = field(default_factory=threading.local, repr=False)
+    _lock:   threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def _stack(self) -> list[_Frame]:
+        # Spans nest per thread (the loader parses dep files on a pool)
+        try:
+            return self._local.stack
+        except AttributeError:
+            stack = self._local.stack = []
+            return stack
+
+    def span_start(self, name: str, attrs: Mapping[str, Any]) -> None:
+        if name not in PHASES:
+            return
+        with self._lock:
+            stats = self.phases.setdefault(name, PhaseStats())
+        current, peak = _traced()
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak = max(parent.peak, peak)
+        _reset_peak()
+        self._stack.append(_Frame(stats, time.perf_counter(), current, current))
+
+    def span_end(self, name: str, attrs: Mapping[str, Any], error: BaseException | None) -> None:
+        if name not in PHASES:
+            return
+        frame = self._stack.pop()
+        elapsed = time.perf_counter() - frame.start
+        peak = max(frame.peak, _traced()[1])
+        stats = frame.stats
+        with self._lock:
+            stats.calls += 1
+            stats.seconds += elapsed - frame.nested
+            stats.peak_bytes = max(stats.peak_bytes, peak - frame.base)
+        if self._stack:
+            parent = self._stack[-1]
+            parent.nested += elapsed
+            parent.peak = max(parent.peak, peak)
+        _reset_peak()
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + n
+
+    def to_dict(self) -> dict:
+        order = [p for p in PHASES if p in self.phases]
+        order += sorted(p for p in self.phases if p not in PHASES)
+        return {
+            "wall_ms": round(self.seconds * 1e3, 3),
+            "phases": {p: self.phases[p].to_dict() for p in order},
+            "counts": dict(sorted(self.counts.items())),
+        }
+
+    def write_json(self, stream: TextIO) -> None:
+        json.dump(self.to_dict(), stream, indent=2)
+        stream.write("\n")
+
+
+def _traced() -> tuple[int, int]:
+    return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+
+def _reset_peak() -> None:
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+
+
+# ------------------------------------------------------------------ #
+# Active profile
+# ------------------------------------------------------------------ #
+
+_active: Profile | None = None
+
+
+@contextlib.contextmanager
+def profiling(profile: Profile, memory: bool = True) -> Iterator[Profile]:
+    """
+    Make `profile` the active profile, and register it as a tracer, for the
+    duration of the block.
+
+    With `memory` tracemalloc is started (unless already running) so peak
+    memory is recorded; this slows Python allocations, so wall times are
+    inflated by a roughly constant factor.
+    """
+    global _active
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    previous, _active = _active, profile
+    tracing.add_tracer(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.seconds += time.perf_counter() - start
+        tracing.remove_tracer(profile)
+        _active = previous
+        if started:
+            tracemalloc.stop()
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add to a counter of the active profile (no-op when none)."""
+    if _active is not None:
+        _active.count(name, n)
+
+
+def active() -> Profile | None:
+    return _active
+
+
+def count_netlist(netlist: Netlist) -> None:
+    """Count the defs, primitives and subckt instances of a loaded netlist."""
+    if _active is None:
+        return
+    from .model.component import PrimitiveComponent, SubcktInstanceArray
+
+    primitives = instances = 0
+    for defn in netlist.subckt_defs:
+        for comp in defn.components:
+            if isinstance(comp, PrimitiveComponent):
+                primitives += 1
+            elif isinstance(comp, SubcktInstanceArray):
+                instances += len(comp)
+            else:
+                instances += 1
+        if defn.devices is not None:
+            primitives += len(defn.devices)
+    _active.count("defs", len(netlist.subckt_defs))
+    _active.count("primitives", primitives)
+    _active.count("instances", instances)
+
+
+class ProfiledStream:
+    """
+    Text stream wrapper that times writes to the underlying stream as the
+    'write' phase and counts output bytes. Chunks are buffered so each
+    underlying write (and its timing) covers many lines.
+    """
+
+    BUFFER_CHARS = 1 << 16
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self._chunks: list[str] = []
+        self._size = 0
+
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.BUFFER_CHARS:
+            self.flush()
+        return len(text)
+
+    def flush(self) -> None:
+        if not self._chunks:
+            return
+        data = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        with tracing.span("write"):
+            self._stream.write(data)
+        count("output_bytes", len(data.encode("utf-8")))
+
+
+@contextlib.contextmanager
+def profiled_stream(stream: TextIO) -> Iterator[TextIO]:
+    """
+    Yield `stream` wrapped in a ProfiledStream when a profile is active,
+    flushing it on exit; otherwise yield `stream` unchanged.
+    """
+    if _active is None:
+        yield stream
+        return
+    wrapped = ProfiledStream(stream)
+    yield wrapped
+    wrapped.flush()
@@ -5,6 +5,8 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, Field, model_validator
 
+from ..model.bus import parse_range
+
 _IDENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 VALID_PRIMITIVE_MODELS = frozenset({
@@ -21,13 +23,32 @@ class ComponentSchema(BaseModel):
 
     @model_validator(mode="after")
     def _check_id_format(self) -> "ComponentSchema":
-        if not _IDENT_RE.match(self.id):
+        array = parse_range(self.id)
+        if not _IDENT_RE.match(array.name if array is not None else self.id):
             raise ValueError(
                 f"Component id '{self.id}' is invalid. "
-                "Use letters, digits, or underscores; must start with a letter or underscore."
+                "Use letters, digits, or underscores; must start with a letter or underscore "
+                "(optionally followed by an array range such as [0:7])."
             )
         return self
 
+    @model_validator(mode="after")
+    def _check_ranges_on_subckts_only(self) -> "ComponentSchema":
+        # Widths are checked against the referenced cell's ports at generation
+        if self.type == "subckt":
+            return self
+        if parse_range(self.id) is not None:
+            raise ValueError(
+                f"Component '{self.id}': array ids are only supported for subckt instances"
+            )
+        for port, net in self.connections.items():
+            if parse_range(net) is not None:
+                raise ValueError(
+                    f"Component '{self.id}': bus connection {port}: {net} is only "
+                    "supported for subckt instances"
+                )
+        return self
+
     @model_validator(mode="after")
     def _check_primitive_model(self) -> "ComponentSchema":
         if self.type == "primitive" and self.model not in VALID_PRIMITIVE_MODELS:
@@ -49,10 +70,20 @@ class CellSchema(BaseModel):
     @model_validator(mode="after")
     def _check_no_duplicate_ids(self) -> "CellSchema":
         seen: set[str] = set()
+        arrays: dict[tuple[str, str], list[tuple[int, int]]] = {}
         for comp in self.components:
             if comp.id in seen:
                 raise ValueError(f"Duplicate component id: '{comp.id}'")
             seen.add(comp.id)
+
+            array = parse_range(comp.id)
+            if array is None:
+                continue
+            lo, hi = sorted((array.start, array.stop))
+            spans = arrays.setdefault((array.name, array.brackets), [])
+            if any(lo <= other_hi and other_lo <= hi for other_lo, other_hi in spans):
+                raise ValueError(f"Component array '{comp.id}' overlaps another array")
+            spans.append((lo, hi))
         return self
 
 
@@ -0,0 +1,93 @@
+"""
+Instrumentation hooks for the loader, resolver and generators.
+
+Register a Tracer to be told when each span of work starts and ends:
+
+    class Timer(Tracer):
+        def span_start(self, name, attrs):
+            ...
+        def span_end(self, name, attrs, error):
+            ...
+
+    with tracing(Timer()):
+        netlist = load_file("top.yaml")
+
+Spans nest: `load` (one per load_file call) contains one `file` span per
+topology file parsed, each containing `read`, `validate` and `build`;
+`resolve` covers PDK resolution and `generate` one generator call (with
+nested `write` spans while profiling streamed output). With no tracer
+registered, span() returns a shared no-op context manager.
+"""
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+
+class Tracer:
+    """
+    Receives span start/end callbacks. Both methods are no-ops by default;
+    override either. Callbacks run synchronously on the traced thread.
+    """
+
+    def span_start(self, name: str, attrs: Mapping[str, Any]) -> None:
+        """Called when a span begins; attrs describe it (e.g. path, dialect)."""
+
+    def span_end(self, name: str, attrs: Mapping[str, Any], error: BaseException | None) -> None:
+        """Called when the span ends, with the exception that ended it, if any."""
+
+
+# Registered tracers; a tuple so span() can read it without locking
+_tracers: tuple[Tracer, ...] = ()
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def add_tracer(tracer: Tracer) -> None:
+    """Register a tracer for every subsequent span, in this and other threads."""
+    global _tracers
+    _tracers = _tracers + (tracer,)
+
+
+def remove_tracer(tracer: Tracer) -> None:
+    """Unregister a tracer; unknown tracers are ignored."""
+    global _tracers
+    _tracers = tuple(t for t in _tracers if t is not tracer)
+
+
+@contextlib.contextmanager
+def tracing(tracer: Tracer) -> Iterator[Tracer]:
+    """Register `tracer` for the duration of the block."""
+    add_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        remove_tracer(tracer)
+
+
+def enabled() -> bool:
+    """True when at least one tracer is registered."""
+    return bool(_tracers)
+
+
+def span(name: str, **attrs: Any) -> contextlib.AbstractContextManager:
+    """Context manager reporting a span to every registered tracer."""
+    if not _tracers:
+        return _NULL_SPAN
+    return _span(_tracers, name, attrs)
+
+
+@contextlib.contextmanager
+def _span(tracers: tuple[Tracer, ...], name: str, attrs: dict[str, Any]) -> Iterator[None]:
+    for tracer in tracers:
+        tracer.span_start(name, attrs)
+    error: BaseException | None = None
+    try:
+        yield
+    except BaseException as exc:
+        error = exc
+        raise
+    finally:
+        for tracer in reversed(tracers):
+            tracer.span_end(name, attrs, error)
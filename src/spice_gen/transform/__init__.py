@@ -0,0 +1,5 @@
+from .dedup import deduplicate
+from .flatten import FlatComponents, flatten, iter_flat
+from .prune import prune, reachable_defs
+
+__all__ = ["FlatComponents", "deduplicate", "flatten", "iter_flat", "prune", "reachable_defs"]
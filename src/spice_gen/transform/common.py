@@ -0,0 +1,34 @@
+"""Helpers shared by the netlist transforms."""
+from __future__ import annotations
+
+from collections.abc import Container
+from dataclasses import replace
+
+from ..model.netlist import Netlist, SubcktDef
+
+
+def select_defs(
+    netlist: Netlist,
+    names: Container[str],
+    top: SubcktDef | None = None,
+) -> Netlist:
+    """
+    Return a Netlist of the defs of `netlist` named in `names`, in their
+    original order and followed by `top` when given. Only the def each name
+    resolves to is kept (later defs of the same name are shadowed). The
+    netlist's includes, top cell and PDK includes are preserved.
+    """
+    defs = [
+        d for d in netlist.subckt_defs
+        if d.name in names and netlist.get_subckt(d.name) is d
+    ]
+    if top is not None:
+        defs.append(top)
+    # Generators write the first def's includes as the netlist's includes
+    if defs and defs[0].includes != netlist.subckt_defs[0].includes:
+        defs[0] = replace(defs[0], includes=netlist.subckt_defs[0].includes)
+    return Netlist(
+        subckt_defs=defs,
+        top_cell=netlist.top_cell,
+        pdk_includes=list(netlist.pdk_includes),
+    )
@@ -0,0 +1,149 @@
+"""
+Structural de-duplication: merge defs that differ only in their name.
+
+The loader de-duplicates defs by name. Script-generated libraries often
+also hold variants with different names and identical contents, each
+written as its own .subckt. deduplicate() keeps the first def of each
+group of identical defs and points every instance of the others at it.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import replace
+
+from ..model.component import AnyComponent, PrimitiveComponent
+from ..model.device_table import DeviceTable
+from ..model.netlist import Netlist, SubcktDef
+from .common import select_defs
+
+
+def deduplicate(netlist: Netlist) -> Netlist:
+    """
+    Return a Netlist in which structurally identical defs are merged.
+
+    Two defs are identical when their ports, parameters, includes and
+    components (instance names, nets, models, values and parameters, in
+    order) are equal, with instances of already merged defs compared by the
+    def they were merged into. Defs are compared in dependency order, so
+    merging a group of leaf cells can make the cells above them identical
+    too. The first def of each group is kept; the top cell is never merged
+    away.
+
+    The output netlist is the same apart from the dropped .subckt blocks and
+    the renamed instance references. Untouched defs and components are
+    shared with the input, as after resolve().
+    """
+    top = netlist.top_cell or (netlist.subckt_defs[-1].name if netlist.subckt_defs else None)
+    merged: dict[str, str] = {}            # dropped def name -> kept def name
+    kept: dict[tuple, str] = {}            # structure key -> kept def name
+    survivors: set[str] = set()
+    for defn in netlist.subckt_defs:
+        if netlist.get_subckt(defn.name) is not defn:
+            continue  # Shadowed by an earlier def of the same name
+        if defn.name != top:
+            first = kept.setdefault(_structure(defn, merged.get), defn.name)
+            if first != defn.name:
+                merged[defn.name] = first
+                continue
+        survivors.add(defn.name)
+
+    result = select_defs(netlist, survivors)
+    if merged:
+        # Renamed once every merge is known, so no reference can be left dangling
+        result.subckt_defs = [_rename_instances(d, merged) for d in result.subckt_defs]
+    return result
+
+
+# ------------------------------------------------------------------ #
+# Structure keys
+# ------------------------------------------------------------------ #
+
+# Maps a def name to the def it was merged into, or None
+_Rename = Callable[[str], "str | None"]
+
+
+def _structure(defn: SubcktDef, rename: _Rename) -> tuple:
+    """Everything that determines a def's .subckt block, except its name."""
+    return (
+        tuple(defn.ports),
+        tuple(defn.parameters.items()),
+        tuple(defn.includes),
+        tuple(_component_key(c, rename) for c in defn.components),
+        None if defn.devices is None else _table_key(defn.devices, rename),
+    )
+
+
+def _component_key(comp: AnyComponent, rename: _Rename) -> tuple:
+    if type(comp) is PrimitiveComponent:
+        return (
+            PrimitiveComponent, comp.instance_name, comp.kind,
+            # Nets are written in port order, whatever the dict order
+            tuple(sorted(comp.connections.items())),
+            tuple(comp.parameters.items()), comp.model_name, comp.value,
+        )
+    name = comp.subckt_name
+    return (
+        type(comp),
+        comp.instance_name,
+        rename(name) or name,
+        tuple(comp.port_map.items()),
+        tuple(comp.parameters.items()),
+    )
+
+
+def _table_key(table: DeviceTable, rename: _Rename) -> tuple[Hashable, ...]:
+    # Tables built from the same rows in the same order have equal columns
+    return (
+        tuple(table.names),
+        table.kinds.tobytes(),
+        table.nets.tobytes(),
+        table.net_offsets.tobytes(),
+        tuple(table.net_names),
+        table.model_idx.tobytes(),
+        tuple(_table_models(table, rename)),
+        tuple(table.model_subckt),
+        table.value_idx.tobytes(),
+        tuple(table.values),
+        table.param_idx.tobytes(),
+        tuple(tuple(p.items()) for p in table.params),
+    )
+
+
+def _table_models(table: DeviceTable, rename: _Rename) -> list[str]:
+    # Only models written as X elements can refer to a def
+    return [
+        (rename(m) or m) if ports is not None else m
+        for m, ports in zip(table.models, table.model_subckt)
+    ]
+
+
+# ------------------------------------------------------------------ #
+# Rewriting references
+# ------------------------------------------------------------------ #
+
+
+def _rename_instances(defn: SubcktDef, merged: dict[str, str]) -> SubcktDef:
+    """defn with instances of merged defs pointed at the kept def."""
+    components: list[AnyComponent] | None = None
+    for i, comp in enumerate(defn.components):
+        if type(comp) is PrimitiveComponent:
+            continue
+        name = merged.get(comp.subckt_name)
+        if name is not None:
+            if components is None:
+                components = list(defn.components)
+            components[i] = replace(comp, subckt_name=name)
+
+    devices = defn.devices
+    if devices is not None:
+        models = _table_models(devices, merged.get)
+        if models != devices.models:
+            devices = devices.with_models(models, devices.model_subckt)
+
+    if components is None and devices is defn.devices:
+        return defn
+    return replace(
+        defn,
+        components=defn.components if components is None else components,
+        devices=devices,
+    )
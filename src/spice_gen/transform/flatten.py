@@ -0,0 +1,285 @@
+"""
+Hierarchy flattening: expand the subcircuit instances of the top cell into
+primitives with hierarchical instance and net names.
+
+A device M1 inside instance XINV1 of XBUF becomes XBUF/XINV1/M1, and a net
+`mid` internal to XINV1 becomes XBUF/XINV1/mid; nets bound to ports take the
+name of the net connected one level up. Ground ("0") is global and never
+renamed.
+
+The flat component list is never built. flatten() returns a Netlist whose
+top def holds a FlatComponents view, which walks the hierarchy each time it
+is iterated with an explicit stack (no recursion) and keeps only one frame
+per level, so generators stream millions of flat devices in memory
+proportional to the hierarchy depth.
+"""
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+
+from ..model.bus import BusRange, Net
+from ..model.component import (
+    AnyComponent, PrimitiveComponent, SubcktInstance, SubcktInstanceArray,
+)
+from ..model.netlist import Netlist, SubcktDef
+from .common import select_defs
+
+SEPARATOR = "/"
+
+# Nets that keep their name at every level of the hierarchy
+GLOBAL_NETS = ("0",)
+
+# A single bus bit: name[3] or name<3>
+_BIT_RE = re.compile(r"^(?P<name>.+?)(?P<open>[\[<])(?P<index>\d+)[\]>]$")
+
+
+def flatten(
+    netlist: Netlist,
+    max_depth: int | None = None,
+    separator: str = SEPARATOR,
+) -> Netlist:
+    """
+    Return a Netlist with the top cell flattened.
+
+    With `max_depth`, only that many levels below the top are expanded
+    (0 leaves the top cell as it is); deeper instances stay subcircuit
+    instances. Instances that pass parameters, or of cells that declare
+    parameters, are never expanded: their parameter expressions are left to
+    the simulator. The defs still referenced by unexpanded instances are
+    kept, in their original order, before the flat top cell.
+
+    The result shares its defs with `netlist` and its top def's components
+    are a lazy FlatComponents view: generate it, but resolve the PDK first
+    (resolution needs a list of components).
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError(f"max_depth must be >= 0, got {max_depth}")
+    top = _top_def(netlist)
+    kept = _kept_defs(netlist, top, max_depth)
+
+    flat = SubcktDef(
+        name=top.name,
+        ports=top.ports,
+        components=FlatComponents(netlist, max_depth, separator),  # type: ignore[arg-type]
+        parameters=top.parameters,
+        includes=top.includes,
+        devices=top.devices,
+    )
+    return select_defs(netlist, kept, top=flat)
+
+
+class FlatComponents:
+    """
+    The components of a flattened top cell (not including its device table),
+    produced on demand by iter_flat(). Each iteration walks the hierarchy
+    again; there is no len() or indexing.
+    """
+
+    __slots__ = ("netlist", "max_depth", "separator")
+
+    def __init__(self, netlist: Netlist, max_depth: int | None, separator: str) -> None:
+        self.netlist = netlist
+        self.max_depth = max_depth
+        self.separator = separator
+
+    def __iter__(self) -> Iterator[AnyComponent]:
+        return iter_flat(self.netlist, self.max_depth, self.separator)
+
+    def __repr__(self) -> str:
+        return f"FlatComponents(top={self.netlist.top_cell!r}, max_depth={self.max_depth})"
+
+
+def iter_flat(
+    netlist: Netlist,
+    max_depth: int | None = None,
+    separator: str = SEPARATOR,
+) -> Iterator[AnyComponent]:
+    """
+    Yield the components of the flattened top cell (see flatten()), except
+    the rows of the top cell's own device table. Components of the top cell
+    itself are yielded unchanged; everything below is renamed.
+    """
+    top = _top_def(netlist)
+    get_subckt = netlist.get_subckt
+
+    def expansion(comp: AnyComponent, depth: int) -> SubcktDef | None:
+        if max_depth is not None and depth >= max_depth:
+            return None
+        child = get_subckt(comp.subckt_name)
+        if child is None or comp.parameters or child.parameters:
+            return None
+        return child
+
+    # One frame per hierarchy level: the def being expanded (None for the
+    # elements of an array), the components still to visit, the prefix for
+    # names at that level and its net map (None at the top)
+    stack: list[tuple[str | None, Iterator[AnyComponent], str, dict[str, str] | None, int]] = [
+        (top.name, iter(top.components), "", None, 0),
+    ]
+    active = {top.name}  # Defs being expanded, to reject recursive subcircuits
+    while stack:
+        _, comps, prefix, nets, depth = stack[-1]
+        for comp in comps:
+            if type(comp) is PrimitiveComponent:
+                yield comp if nets is None else _flat_primitive(comp, prefix, nets)
+                continue
+            child = expansion(comp, depth)
+            if child is None:
+                yield comp if nets is None else _flat_instance(comp, prefix, nets)
+            elif isinstance(comp, SubcktInstanceArray):
+                # Visit the elements at this same level
+                stack.append((None, comp.expand(child.ports), prefix, nets, depth))
+                break
+            else:
+                if child.name in active:
+                    raise ValueError(f"Subcircuit '{child.name}' instantiates itself")
+                active.add(child.name)
+                bound = comp.ordered_nets(child.ports)
+                if nets is not None:
+                    bound = [_flat_net(n, prefix, nets) for n in bound]
+                child_nets = {g: g for g in GLOBAL_NETS}
+                child_nets.update(zip(child.port_bits(), bound))
+                stack.append((
+                    child.name,
+                    child.iter_components(),
+                    f"{prefix}{comp.instance_name}{separator}",
+                    child_nets,
+                    depth + 1,
+                ))
+                break
+        else:
+            active.discard(stack.pop()[0])
+
+
+# ------------------------------------------------------------------ #
+# Renaming
+# ------------------------------------------------------------------ #
+
+
+def _flat_net(net: str, prefix: str, nets: dict[str, str]) -> str:
+    # The frame's net map doubles as a cache of the renamed internal nets
+    flat = nets.get(net)
+    if flat is None:
+        flat = nets[net] = prefix + net
+    return flat
+
+
+def _flat_primitive(comp: PrimitiveComponent, prefix: str, nets: dict[str, str]) -> PrimitiveComponent:
+    return PrimitiveComponent(
+        instance_name=prefix + comp.instance_name,
+        kind=comp.kind,
+        spec=comp.spec,
+        connections={p: _flat_net(n, prefix, nets) for p, n in comp.connections.items()},
+        parameters=comp.parameters,
+        model_name=comp.model_name,
+        value=comp.value,
+    )
+
+
+def _flat_instance(
+    comp: SubcktInstance | SubcktInstanceArray,
+    prefix: str,
+    nets: dict[str, str],
+) -> SubcktInstance | SubcktInstanceArray:
+    port_map = {p: _flat_connection(n, prefix, nets) for p, n in comp.port_map.items()}
+    if isinstance(comp, SubcktInstanceArray):
+        r = comp.instances
+        return SubcktInstanceArray(
+            instances=BusRange(prefix + r.name, r.start, r.stop, r.brackets),
+            subckt_name=comp.subckt_name,
+            port_map=port_map,
+            parameters=comp.parameters,
+        )
+    return SubcktInstance(
+        instance_name=prefix + comp.instance_name,
+        subckt_name=comp.subckt_name,
+        port_map=port_map,
+        parameters=comp.parameters,
+    )
+
+
+def _flat_connection(net: Net, prefix: str, nets: dict[str, str]) -> Net:
+    if not isinstance(net, BusRange):
+        return _flat_net(net, prefix, nets)
+    return _as_bus([_flat_net(bit, prefix, nets) for bit in net.bits()], net)
+
+
+def _as_bus(bits: list[str], source: BusRange) -> BusRange:
+    """The bus whose bits are exactly `bits`, in order."""
+    first, last = _BIT_RE.match(bits[0]), _BIT_RE.match(bits[-1])
+    if first and last and first["name"] == last["name"] and first["open"] == last["open"]:
+        brackets = "[]" if first["open"] == "[" else "<>"
+        bus = BusRange(first["name"], int(first["index"]), int(last["index"]), brackets)
+        if list(bus.bits()) == bits:
+            return bus
+    raise ValueError(
+        f"Cannot flatten connection {source}: its nets {bits} do not form a single bus"
+    )
+
+
+# ------------------------------------------------------------------ #
+# Hierarchy walks
+# ------------------------------------------------------------------ #
+
+
+def _top_def(netlist: Netlist) -> SubcktDef:
+    if not netlist.subckt_defs:
+        raise ValueError("Cannot flatten an empty netlist")
+    if netlist.top_cell is None:
+        return netlist.subckt_defs[-1]
+    top = netlist.get_subckt(netlist.top_cell)
+    if top is None:
+        raise ValueError(f"Top cell '{netlist.top_cell}' is not defined in the netlist")
+    return top
+
+
+def _instances(defn: SubcktDef) -> Iterator[tuple[str, bool]]:
+    """
+    (subckt name, has parameters) for each instance in defn. Device-table
+    rows mapped to a def of the same name are reported as parameterized so
+    the def is always kept.
+    """
+    for comp in defn.components:
+        if type(comp) is not PrimitiveComponent:
+            yield comp.subckt_name, bool(comp.parameters)
+    table = defn.devices
+    if table is not None:
+        for name, ports in zip(table.models, table.model_subckt):
+            if ports is not None:
+                yield name, True
+
+
+def _kept_defs(netlist: Netlist, top: SubcktDef, max_depth: int | None) -> set[str]:
+    """Names of the defs that unexpanded instances still refer to."""
+    kept: set[str] = set()
+    seen: set[tuple[str, int]] = set()
+    pending = [(top, 0)]
+    while pending:
+        defn, depth = pending.pop()
+        for name, parameterized in _instances(defn):
+            child = netlist.get_subckt(name)
+            if child is None:
+                continue  # External subcircuit
+            if parameterized or child.parameters or (max_depth is not None and depth >= max_depth):
+                _add_closure(netlist, child, kept)
+                continue
+            # The depth only matters while a limit can still be reached
+            key = (name, depth + 1 if max_depth is not None else 0)
+            if key not in seen:
+                seen.add(key)
+                pending.append((child, depth + 1))
+    return kept
+
+
+def _add_closure(netlist: Netlist, defn: SubcktDef, kept: set[str]) -> None:
+    pending = [defn]
+    while pending:
+        defn = pending.pop()
+        if defn.name in kept:
+            continue
+        kept.add(defn.name)
+        for name, _ in _instances(defn):
+            child = netlist.get_subckt(name)
+            if child is not None:
+                pending.append(child)
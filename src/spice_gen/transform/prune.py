@@ -0,0 +1,60 @@
+"""
+Reachability pruning: drop the defs the top cell never instantiates.
+
+The loader keeps every def of every dep file, including cells of a shared
+dep library that the top cell does not use. prune() keeps only the top cell
+and the defs reachable from it through subcircuit instances.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from .. import profiling
+from ..model.component import PrimitiveComponent
+from ..model.netlist import Netlist, SubcktDef
+from .common import select_defs
+
+
+def prune(netlist: Netlist) -> Netlist:
+    """
+    Return a Netlist holding only the top cell (netlist.top_cell, or the
+    last def when unset) and the defs it uses directly or indirectly, in
+    their original order. Kept defs are shared with the input. Raises
+    ValueError when the top cell is not defined.
+    """
+    if not netlist.subckt_defs:
+        return netlist
+    top = netlist.top_cell or netlist.subckt_defs[-1].name
+    pruned = select_defs(netlist, reachable_defs(netlist, top))
+    profiling.count("pruned_defs", len(netlist.subckt_defs) - len(pruned.subckt_defs))
+    return pruned
+
+
+def reachable_defs(netlist: Netlist, top: str) -> set[str]:
+    """Names of `top` and of every def it instantiates, directly or not."""
+    defn = netlist.get_subckt(top)
+    if defn is None:
+        raise ValueError(f"Top cell '{top}' is not defined in the netlist")
+    reachable = {top}
+    pending = [defn]
+    while pending:
+        for name in _instantiated(pending.pop()):
+            if name not in reachable:
+                child = netlist.get_subckt(name)
+                if child is not None:
+                    reachable.add(name)
+                    pending.append(child)
+    return reachable
+
+
+def _instantiated(defn: SubcktDef) -> Iterator[str]:
+    """Subcircuit names used by defn (repeats included; external ones too)."""
+    for comp in defn.components:
+        if type(comp) is not PrimitiveComponent:
+            yield comp.subckt_name
+    table = defn.devices
+    if table is not None:
+        # Device-table rows mapped to X elements name their subcircuit as the model
+        for name, ports in zip(table.models, table.model_subckt):
+            if ports is not None:
+                yield name
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import pathlib
+import time
+from collections.abc import Callable, Iterable
+
+from .batch import BuildOptions, CellResult, build_cell
+from .parser.loader import LoadCache
+
+
+class Watcher:
+    """
+    Keep a set of top cells up to date as their source files change.
+
+    The parsed dependency graph is held in a LoadCache between polls. When a
+    topology file changes only that file is re-parsed, and only the top cells
+    that depend on it (directly or transitively) are regenerated. A change to
+    the PDK config reloads it and regenerates every top cell. Cells that
+    failed on the previous build are retried on every change.
+
+    Change detection polls file modification times, so it works on any
+    filesystem without extra dependencies.
+    """
+
+    def __init__(
+        self,
+        targets: Iterable[tuple[str | pathlib.Path, str | pathlib.Path]],
+        dialect: str | list[str] = "spice3",
+        pdk_path: str | pathlib.Path | None = None,
+        corner: str | None = None,
+        cache_dir: str | pathlib.Path | None = None,
+        columnar_threshold: int | None = None,
+        corners: list[str] | None = None,
+        validate: bool = True,
+        prune: bool = True,
+        dedup: bool = False,
+        flatten: bool = False,
+        flatten_depth: int | None = None,
+    ) -> None:
+        self.targets = [(pathlib.Path(i), pathlib.Path(o)) for i, o in targets]
+        self.pdk_path = pathlib.Path(pdk_path).resolve() if pdk_path is not None else None
+        self.options = BuildOptions(
+            dialects=[dialect] if isinstance(dialect, str) else list(dialect),
+            corner=corner, corners=corners,
+            cache_dir=cache_dir, columnar_threshold=columnar_threshold,
+            validate=validate, prune=prune, dedup=dedup,
+            flatten=flatten, flatten_depth=flatten_depth,
+        )
+        self.cache = LoadCache()
+        self._pdk_error: str | None = None
+        self._mtimes: dict[pathlib.Path, int | None] = {}
+        self._failed: set[pathlib.Path] = set()
+
+    # ------------------------------------------------------------------ #
+    # Public API
+    # ------------------------------------------------------------------ #
+
+    def watched_files(self) -> list[pathlib.Path]:
+        """Every file whose modification triggers a rebuild."""
+        files = [i.resolve() for i, _ in self.targets]
+        files.extend(self.cache.files())
+        if self.pdk_path is not None:
+            files.append(self.pdk_path)
+        return list(dict.fromkeys(files))
+
+    def build_all(self) -> list[CellResult]:
+        """Load the PDK and build every target. Call once before polling."""
+        self._load_pdk()
+        results = self._build(self.targets)
+        self._record_new_files()
+        return results
+
+    def poll(self) -> list[CellResult]:
+        """
+        Check for changed files and regenerate the affected top cells.
+        Returns the results of the cells rebuilt (empty if nothing changed).
+        """
+        changed = []
+        for path in self.watched_files():
+            mtime = _mtime(path)
+            if mtime != self._mtimes.get(path):
+                self._mtimes[path] = mtime
+                changed.append(path)
+        if not changed:
+            return []
+
+        rebuild_all = False
+        affected: set[pathlib.Path] = set()
+        for path in changed:
+            if path == self.pdk_path:
+                self._load_pdk()
+                rebuild_all = True
+            else:
+                affected |= self.cache.invalidate(path)
+
+        targets = [
+            (i, o) for i, o in self.targets
+            if rebuild_all or i.resolve() in affected or i.resolve() in self._failed
+        ]
+        results = self._build(targets)
+        self._record_new_files()
+        return results
+
+    def run(
+        self,
+        interval: float = 1.0,
+        on_results: Callable[[list[CellResult]], None] | None = None,
+        stop: Callable[[], bool] | None = None,
+    ) -> None:
+        """
+        Build everything, then poll every `interval` seconds until `stop()`
+        returns True (or forever). Each non-empty batch of results is passed
+        to `on_results`.
+        """
+        results = self.build_all()
+        if on_results is not None:
+            on_results(results)
+        while stop is None or not stop():
+            time.sleep(interval)
+            results = self.poll()
+            if results and on_results is not None:
+                on_results(results)
+
+    # ------------------------------------------------------------------ #
+    # Internals
+    # ------------------------------------------------------------------ #
+
+    def _load_pdk(self) -> None:
+        if self.pdk_path is None:
+            return
+        self._mtimes[self.pdk_path] = _mtime(self.pdk_path)
+        try:
+            from .pdk import load_pdk
+            self.options.pdk = load_pdk(self.pdk_path)
+            self._pdk_error = None
+        except Exception as exc:
+            self.options.pdk = None
+            self._pdk_error = f"could not load PDK config: {exc}"
+
+    def _build(self, targets: list[tuple[pathlib.Path, pathlib.Path]]) -> list[CellResult]:
+        results: list[CellResult] = []
+        for input_path, output_path in targets:
+            # Snapshot before loading so an edit made during the build is
+            # still seen as a change on the next poll
+            self._mtimes.setdefault(input_path.resolve(), _mtime(input_path))
+            if self._pdk_error is not None:
+                result = CellResult(input_path=input_path, output_path=output_path,
+                                    stage="resolve", error=self._pdk_error)
+            else:
+                result = build_cell(input_path, output_path, self.options, cache=self.cache)
+            if result.ok:
+                self._failed.discard(input_path.resolve())
+            else:
+                self._failed.add(input_path.resolve())
+            results.append(result)
+        return results
+
+    def _record_new_files(self) -> None:
+        for path in self.watched_files():
+            if path not in self._mtimes:
+                self._mtimes[path] = _mtime(path)
+
+
+def _mtime(path: pathlib.Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
@@ -0,0 +1,36 @@
+"""Benchmark: loading a compiled library vs parsing the YAML hierarchy."""
+import time
+
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.parser.library import load_library, write_library
+from spice_gen.parser.loader import load_file
+
+from ..helpers.synthetic import Topology, write_topology
+
+pytestmark = pytest.mark.benchmark
+
+TOPOLOGY = Topology(devices=5000, depth=3, fanout=4, bus_width=16)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def test_compiled_load_faster(tmp_path):
+    top = write_topology(TOPOLOGY, tmp_path / "src")
+    parsed, t_yaml = _timed(lambda: load_file(top))
+    write_library(parsed, tmp_path / "top.sglib")
+    compiled, t_lib = _timed(lambda: load_file(tmp_path / "top.sglib"))
+    one, t_one = _timed(lambda: load_library(tmp_path / "top.sglib", cell="L1_A"))
+    print(f"\nload hierarchy: yaml {t_yaml*1e3:.0f} ms, compiled {t_lib*1e3:.1f} ms "
+          f"({t_yaml / t_lib:.0f}x), one cell {t_one*1e3:.1f} ms")
+
+    gen = get_generator("ngspice")
+    assert gen.generate(compiled) == gen.generate(parsed)
+    assert [d.name for d in one.subckt_defs] == ["LEAF", "L1_A"]
+    # Typically 50x or more; require a clear margin only
+    assert t_lib * 10 < t_yaml
@@ -0,0 +1,61 @@
+"""Benchmark: concurrent dep file reads vs sequential on a slow filesystem."""
+import json
+import time
+
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.parser import loader
+from spice_gen.parser.loader import load_file
+
+pytestmark = pytest.mark.benchmark
+
+N_DEPS = 64
+LATENCY = 0.005  # Seconds per file read, as on a network filesystem
+
+
+@pytest.fixture
+def wide_top(tmp_path, monkeypatch):
+    for i in range(N_DEPS):
+        (tmp_path / f"c{i}.json").write_text(json.dumps({"cell": {
+            "name": f"C{i}", "ports": ["A", "B"],
+            "components": [{"id": "R1", "type": "primitive", "model": "r",
+                            "connections": {"P": "A", "N": "B"}}],
+        }}))
+    top = tmp_path / "top.json"
+    top.write_text(json.dumps({"cell": {
+        "name": "TOP", "ports": ["A", "B"],
+        "deps": [f"c{i}.json" for i in range(N_DEPS)],
+        "components": [
+            {"id": f"X{i}", "type": "subckt", "model": f"C{i}",
+             "connections": {"A": "A", "B": "B"}}
+            for i in range(N_DEPS)
+        ],
+    }}))
+
+    read_raw = loader._read_raw
+
+    def slow_read_raw(path, text=None):
+        time.sleep(LATENCY)
+        return read_raw(path, text)
+
+    monkeypatch.setattr(loader, "_read_raw", slow_read_raw)
+    return top
+
+
+def _timed_load(path, threads):
+    start = time.perf_counter()
+    netlist = load_file(path, prefetch_threads=threads)
+    return netlist, time.perf_counter() - start
+
+
+def test_prefetch_faster(wide_top):
+    sequential, t_sequential = _timed_load(wide_top, 1)
+    concurrent, t_concurrent = _timed_load(wide_top, loader.PREFETCH_THREADS)
+    print(f"\nload {N_DEPS} deps at {LATENCY*1e3:.0f} ms/file: sequential "
+          f"{t_sequential*1e3:.0f} ms, concurrent {t_concurrent*1e3:.0f} ms "
+          f"({t_sequential / t_concurrent:.1f}x)")
+
+    gen = get_generator("spice3")
+    assert gen.generate(concurrent) == gen.generate(sequential)
+    assert t_concurrent * 3 < t_sequential
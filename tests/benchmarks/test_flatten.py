@@ -0,0 +1,52 @@
+"""Benchmark: streaming flat generation keeps memory flat as the design grows."""
+import gc
+import time
+import tracemalloc
+
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.parser.loader import load_file
+from spice_gen.transform import flatten
+
+from ..helpers.synthetic import Topology, write_topology
+
+pytestmark = pytest.mark.benchmark
+
+SMALL = Topology(devices=50, depth=2, fanout=8, bus_width=16)
+LARGE = Topology(devices=200, depth=2, fanout=8, bus_width=16)
+
+
+class _Sink:
+    """Text stream that only counts what is written."""
+
+    def __init__(self) -> None:
+        self.chars = 0
+
+    def write(self, text: str) -> int:
+        self.chars += len(text)
+        return len(text)
+
+
+def _flat_generate(topo, directory):
+    netlist = flatten(load_file(write_topology(topo, directory)))
+    gen = get_generator("spice3")
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        gen.generate_to(netlist, _Sink())
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    print(f"\nflat {topo.expanded_devices} devices: {elapsed*1e3:.0f} ms "
+          f"(under tracemalloc), {peak / 2**20:.2f} MiB peak", end="")
+    return peak
+
+
+def test_flat_generation_memory_independent_of_size(tmp_path):
+    small = _flat_generate(SMALL, tmp_path / "small")
+    large = _flat_generate(LARGE, tmp_path / "large")
+    # 4x the flat devices, but only one hierarchy frame per level is live
+    assert large < small * 1.5 + 2**20
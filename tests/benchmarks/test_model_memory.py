@@ -0,0 +1,116 @@
+"""Benchmark: memory per device of the internal model on a synthetic flat cell.
+
+The default size keeps the suite fast; set SPICE_GEN_BENCH_DEVICES=1000000
+to measure on a million-device netlist.
+"""
+import gc
+import os
+import tracemalloc
+
+import pytest
+
+from spice_gen.model.netlist import Netlist
+from spice_gen.parser.builder import build_subckt_def
+from spice_gen.pdk import PdkConfig, resolve
+from spice_gen.schema.cell_schema import CellSchema, ComponentSchema
+
+pytestmark = pytest.mark.benchmark
+
+N_DEVICES = int(os.environ.get("SPICE_GEN_BENCH_DEVICES", "20000"))
+
+
+def _fresh(s: str) -> str:
+    """A new string object equal to s, as a YAML parser produces per occurrence."""
+    return "".join(list(s))
+
+
+def _synthetic_cell(n: int) -> CellSchema:
+    # model_construct skips validation: only what the model retains is measured
+    comps = [
+        ComponentSchema.model_construct(
+            id=f"M{i}", type="primitive", model="nmos" if i % 2 else "pmos",
+            connections={
+                _fresh("D"): f"n{i % 1000}", _fresh("G"): f"g{i % 64}",
+                _fresh("S"): _fresh("VSS"), _fresh("B"): _fresh("VSS"),
+            },
+            parameters={
+                _fresh("W"): 0.5, _fresh("L"): 0.15, _fresh("nf"): 1,
+                _fresh("model_name"): _fresh("nmos_1v8"),
+            },
+        )
+        for i in range(n)
+    ]
+    return CellSchema.model_construct(
+        name="FLAT", ports=["VDD", "VSS"], parameters={}, includes=[], deps=[],
+        components=comps,
+    )
+
+
+def _measure(columnar_threshold=None):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        cell = _synthetic_cell(N_DEVICES)
+        defn = build_subckt_def(cell, columnar_threshold)
+        # Only the built model outlives loading; drop the schema objects
+        del cell
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    per_device = (after - before) / N_DEVICES
+    label = "columnar" if columnar_threshold is not None else "model"
+    print(f"\n{label} memory: {per_device:.0f} bytes/device over {N_DEVICES} devices "
+          f"({(after - before) / 2**20:.1f} MiB)")
+    return defn, per_device
+
+
+def test_bytes_per_device():
+    defn, per_device = _measure()
+    assert len(defn.components) == N_DEVICES
+    # ~520 B/device with slotted classes and interned strings (~1040 B/device
+    # with plain dataclasses and per-device string copies)
+    assert per_device < 800
+
+
+def test_bytes_per_device_columnar():
+    defn, per_device = _measure(columnar_threshold=1)
+    assert len(defn.devices) == N_DEVICES
+    # ~200 B/device, mostly the instance name strings; nets, models and
+    # parameter sets are shared lookup-table entries
+    assert per_device < 300
+
+
+def _measure_resolve(defn, pdk) -> float:
+    netlist = Netlist(subckt_defs=[defn], top_cell=defn.name)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        resolved = resolve(netlist, pdk)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert resolved.subckt_defs[0].name == defn.name
+    return (after - before) / N_DEVICES
+
+
+def test_resolve_bytes_per_device():
+    defn = build_subckt_def(_synthetic_cell(N_DEVICES))
+    swap = PdkConfig.model_validate({
+        "name": "bench", "path": "/tmp", "lib_file": "x.spice",
+        "corners": ["tt"], "default_corner": "tt",
+        "models": {"nmos_1v8": {"pdk_name": "nch_bench", "is_subckt": False}},
+    })
+    unmapped = PdkConfig.model_validate({
+        "name": "bench", "path": "/tmp", "lib_file": "x.spice",
+        "corners": ["tt"], "default_corner": "tt", "models": {},
+    })
+    per_device = _measure_resolve(defn, swap)
+    print(f"\nresolve memory: {per_device:.0f} bytes/device (model name swap)")
+    # Only the slotted component object is new; its dicts are shared
+    assert per_device < 150
+    # A def with nothing to map is shared outright
+    assert _measure_resolve(defn, unmapped) < 1
@@ -0,0 +1,143 @@
+"""Benchmark: load_file, resolve and generate on synthetic designs.
+
+Each phase is timed (best of a few runs) and its peak memory recorded with
+tracemalloc, then compared against tests/benchmarks/baseline.json. A phase
+slower or hungrier than its baseline by more than the stored tolerance (and
+by more than the noise floor) fails.
+Set SPICE_GEN_BENCH_UPDATE=1 to rewrite the baseline from the current run.
+"""
+import gc
+import json
+import os
+import pathlib
+import time
+import tracemalloc
+
+import pytest
+
+from spice_gen.generator import DIALECT_REGISTRY, get_generator
+from spice_gen.model.component import SubcktInstanceArray
+from spice_gen.parser.loader import load_file
+from spice_gen.pdk import load_pdk, resolve
+
+from ..helpers.synthetic import Topology, write_topology
+
+BASELINE = pathlib.Path(__file__).parent / "baseline.json"
+PDKS     = pathlib.Path(__file__).parent.parent.parent / "pdks"
+UPDATE   = os.environ.get("SPICE_GEN_BENCH_UPDATE") == "1"
+
+SCENARIOS = {
+    "flat":      Topology(devices=5000, depth=0, fanout=1, diamonds=False),
+    "hierarchy": Topology(devices=1000, depth=4, fanout=8, bus_width=16),
+    "wide_bus":  Topology(devices=500, depth=2, fanout=16, bus_width=256),
+}
+
+REPEAT = 3
+
+
+def _best_time(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _peak_mib(fn) -> float:
+    """Peak memory allocated while fn runs, above what was live before."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return (peak - base) / 2**20
+
+
+def _measure(name: str, topo: Topology, directory: pathlib.Path) -> dict[str, dict]:
+    top = write_topology(topo, directory)
+    pdk = load_pdk(PDKS / "sky130A.yaml")
+    netlist = load_file(top)
+    resolved = resolve(netlist, pdk)
+
+    phases = {
+        "load_file": lambda: load_file(top),
+        "resolve":   lambda: resolve(netlist, pdk),
+    }
+    for dialect in sorted(DIALECT_REGISTRY):
+        gen = get_generator(dialect)
+        phases[f"generate.{dialect}"] = lambda gen=gen: gen.generate(resolved)
+
+    results = {}
+    for phase, fn in phases.items():
+        results[phase] = {
+            "ms":       round(_best_time(fn) * 1e3, 2),
+            "peak_mib": round(_peak_mib(fn), 2),
+        }
+        print(f"\n{name:>10} {phase:<18} {results[phase]['ms']:9.1f} ms "
+              f"{results[phase]['peak_mib']:8.2f} MiB peak", end="")
+    return results
+
+
+def _regressions(name: str, results: dict, baseline: dict) -> list[str]:
+    tolerance = baseline["tolerance"]
+    floor = baseline["noise_floor"]
+    expected = baseline["scenarios"].get(name, {})
+    found = []
+    for phase, measured in results.items():
+        if phase not in expected:
+            continue  # New phase: no baseline yet
+        for metric, limit in tolerance.items():
+            value, reference = measured[metric], expected[phase][metric]
+            # Tiny absolute differences are noise, whatever the ratio
+            if value > reference * limit and value - reference > floor[metric]:
+                found.append(
+                    f"{name} {phase}: {metric} {value} exceeds "
+                    f"baseline {reference} x {limit}"
+                )
+    return found
+
+
+def test_synthetic_topology_shape(tmp_path):
+    topo = Topology(devices=10, depth=2, fanout=3, bus_width=4)
+    netlist = load_file(write_topology(topo, tmp_path))
+    # The shared leaf and level-1 cells are loaded once despite the diamonds
+    assert [d.name for d in netlist.subckt_defs] == [
+        "LEAF", "L1_A", "L1_B", "L2_A", "L2_B", "TOP",
+    ]
+    assert len(netlist.get_subckt("LEAF").components) == 10
+    top = netlist.get_subckt("TOP")
+    assert isinstance(top.components[0], SubcktInstanceArray)
+    assert sum(len(c) if isinstance(c, SubcktInstanceArray) else 1
+               for c in top.components) == 3
+    assert topo.expanded_devices == 270
+
+
+def test_regression_flagged():
+    baseline = {
+        "tolerance": {"ms": 2.0, "peak_mib": 1.5},
+        "noise_floor": {"ms": 5.0, "peak_mib": 0.5},
+        "scenarios": {"s": {"load_file": {"ms": 100.0, "peak_mib": 10.0}}},
+    }
+    ok = {"load_file": {"ms": 150.0, "peak_mib": 12.0}, "resolve": {"ms": 1.0, "peak_mib": 0}}
+    assert _regressions("s", ok, baseline) == []
+    slow = {"load_file": {"ms": 250.0, "peak_mib": 10.0}}
+    assert _regressions("s", slow, baseline) == [
+        "s load_file: ms 250.0 exceeds baseline 100.0 x 2.0",
+    ]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_pipeline_against_baseline(name, tmp_path):
+    results = _measure(name, SCENARIOS[name], tmp_path)
+    baseline = json.loads(BASELINE.read_text())
+    if UPDATE:
+        baseline["scenarios"][name] = results
+        BASELINE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        return
+    assert not _regressions(name, results, baseline)
@@ -0,0 +1,79 @@
+"""Benchmark and regression guard for CLI startup cost."""
+import json
+import pathlib
+import subprocess
+import sys
+import time
+
+import pytest
+
+FIXTURES = pathlib.Path(__file__).parent.parent / "fixtures"
+
+# Modules that must not be imported just to start the CLI or print --help
+HEAVY_MODULES = [
+    "pydantic",
+    "yaml",
+    "spice_gen.schema",
+    "spice_gen.pdk",
+    "spice_gen.batch",
+    "spice_gen.watch",
+    "concurrent.futures",
+    "pickle",
+]
+
+_PROBE = """
+import json, sys
+from spice_gen.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)), file=sys.stderr)
+"""
+
+
+def _imported_modules(*args: str) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", _PROBE, *args],
+        capture_output=True, text=True, check=True,
+    )
+    return set(json.loads(proc.stderr.strip().splitlines()[-1]))
+
+
+def _best_wall_time(cmd: list[str], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_help_does_not_import_heavy_modules():
+    loaded = _imported_modules("--help")
+    assert not [m for m in HEAVY_MODULES if m in loaded]
+
+
+def test_import_cli_does_not_import_heavy_modules():
+    loaded = _imported_modules()  # argparse error path, nothing generated
+    assert not [m for m in HEAVY_MODULES if m in loaded]
+
+
+def test_plain_run_does_not_import_pdk_or_batch():
+    loaded = _imported_modules(str(FIXTURES / "inverter.yaml"), "--stdout")
+    assert "spice_gen.parser.loader" in loaded
+    assert not [m for m in ("spice_gen.pdk", "spice_gen.batch", "concurrent.futures")
+                if m in loaded]
+
+
+@pytest.mark.benchmark
+def test_help_startup_time():
+    baseline = _best_wall_time([sys.executable, "-c", "pass"])
+    help_time = _best_wall_time(
+        [sys.executable, "-c", "from spice_gen.cli import main; main(['--help'])"]
+    )
+    overhead = help_time - baseline
+    print(f"\nspice_gen --help: {help_time*1e3:.0f} ms "
+          f"(interpreter {baseline*1e3:.0f} ms, overhead {overhead*1e3:.0f} ms)")
+    # Generous bound; the module checks above (run by default) are the precise guard
+    assert overhead < 0.5
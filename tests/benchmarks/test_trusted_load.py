@@ -0,0 +1,47 @@
+"""Benchmark: trusted (unvalidated) loading vs schema validation on a large cell."""
+import json
+import time
+
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.parser.loader import load_file
+
+pytestmark = pytest.mark.benchmark
+
+N_COMPONENTS = 100_000
+
+
+@pytest.fixture(scope="module")
+def big_cell(tmp_path_factory):
+    # JSON keeps parsing cheap so the comparison is dominated by validation
+    components = [
+        {
+            "id": f"M{i}", "type": "primitive", "model": "nmos" if i % 2 else "pmos",
+            "connections": {"D": f"n{i % 1000}", "G": f"g{i % 64}", "S": "VSS", "B": "VSS"},
+            "parameters": {"W": 0.5, "L": 0.15, "nf": 1, "model_name": "nmos_1v8"},
+        }
+        for i in range(N_COMPONENTS)
+    ]
+    path = tmp_path_factory.mktemp("trusted") / "big.json"
+    path.write_text(json.dumps({"cell": {"name": "BIG", "ports": ["VDD", "VSS"],
+                                         "components": components}}))
+    return path
+
+
+def _timed_load(path, validate):
+    start = time.perf_counter()
+    netlist = load_file(path, validate=validate)
+    return netlist, time.perf_counter() - start
+
+
+def test_trusted_load_faster(big_cell):
+    validated, t_validated = _timed_load(big_cell, True)
+    trusted, t_trusted = _timed_load(big_cell, False)
+    print(f"\nload {N_COMPONENTS} components: validated {t_validated*1e3:.0f} ms, "
+          f"trusted {t_trusted*1e3:.0f} ms ({t_validated / t_trusted:.1f}x)")
+
+    gen = get_generator("spice3")
+    assert gen.generate(trusted) == gen.generate(validated)
+    # Validation itself is ~5x cheaper; reading and building are unchanged
+    assert t_trusted * 1.3 < t_validated
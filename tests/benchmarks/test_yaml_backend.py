@@ -0,0 +1,46 @@
+"""Benchmark: libyaml-backed loader vs pure-Python PyYAML on a large cell."""
+import time
+
+import pytest
+import yaml
+
+from spice_gen.yaml_backend import YAML_BACKEND, load_yaml
+
+pytestmark = pytest.mark.benchmark
+
+N_COMPONENTS = 500
+
+
+def _big_cell_yaml(n: int) -> str:
+    lines = ["cell:", "  name: BIG", "  ports: [A, Z, VDD, VSS]", "  components:"]
+    for i in range(n):
+        lines += [
+            f"    - id: M{i}",
+            "      type: primitive",
+            "      model: nmos",
+            f"      connections: {{D: n{i}, G: A, S: VSS, B: VSS}}",
+            "      parameters: {W: 1.0, L: 0.15, nf: 1, model_name: nmos_1v8}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _best_of(fn, repeat=2) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.skipif(YAML_BACKEND != "libyaml", reason="PyYAML built without libyaml")
+def test_libyaml_faster_than_pure_python():
+    text = _big_cell_yaml(N_COMPONENTS)
+    assert load_yaml(text) == yaml.load(text, Loader=yaml.SafeLoader)
+
+    t_c = _best_of(lambda: load_yaml(text))
+    t_py = _best_of(lambda: yaml.load(text, Loader=yaml.SafeLoader))
+    print(f"\nyaml load {N_COMPONENTS} components: libyaml {t_c*1e3:.1f} ms, "
+          f"pure-python {t_py*1e3:.1f} ms ({t_py / t_c:.1f}x)")
+    # libyaml is typically ~10x faster; require a clear margin only
+    assert t_c * 2 < t_py
@@ -1 +1,53 @@
 # Shared fixtures and configuration for pytest
+import os
+import pathlib
+import textwrap
+
+import pytest
+
+from spice_gen.model.component import PrimitiveComponent
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.model.primitives import PRIMITIVE_REGISTRY, PrimitiveKind
+
+
+@pytest.fixture
+def write_yaml(tmp_path):
+    """
+    Return write(name, content): write dedented `content` to tmp_path / name
+    (creating parent directories) and return the path. Rewriting an existing
+    file advances its mtime, so the change is seen even on filesystems with
+    coarse timestamps.
+    """
+    def write(name: str, content: str) -> pathlib.Path:
+        path = tmp_path / name
+        existed = path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(content))
+        if existed:
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        return path
+
+    return write
+
+
+# ------------------------------------------------------------------ #
+# Model factories for transform tests (imported, not fixtures, so they
+# can be used in parametrize lists)
+# ------------------------------------------------------------------ #
+
+
+def resistor(name: str = "1", p: str = "A", n: str = "B", value: str = "1k") -> PrimitiveComponent:
+    return PrimitiveComponent(
+        instance_name=name, kind=PrimitiveKind.R, spec=PRIMITIVE_REGISTRY[PrimitiveKind.R],
+        connections={"P": p, "N": n}, parameters={}, value=value,
+    )
+
+
+def cell(name: str, *components, ports=("A", "B"), **kwargs) -> SubcktDef:
+    """A SubcktDef of `components`; other keyword arguments go to SubcktDef."""
+    return SubcktDef(name=name, ports=list(ports), components=list(components), **kwargs)
+
+
+def def_names(netlist: Netlist) -> list[str]:
+    return [d.name for d in netlist.subckt_defs]
@@ -0,0 +1 @@
+"""Helpers shared by the unit, integration and benchmark tests."""
@@ -0,0 +1,94 @@
+"""Synthetic topology generator for the benchmarks and hierarchy tests.
+
+Writes a tree of YAML cell files: one leaf cell of primitives, `depth`
+hierarchical levels above it and a TOP cell. With `diamonds` each level has
+two variants that both depend on every variant below, so shared deps are
+reached along several paths. Buses of `bus_width` bits are threaded through
+every level, and children are instantiated as instance arrays.
+"""
+from __future__ import annotations
+
+import pathlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Topology:
+    devices:   int = 1000   # primitives in the leaf cell
+    depth:     int = 2      # hierarchical levels between the leaf and TOP
+    fanout:    int = 4      # child instances per hierarchical cell
+    bus_width: int = 8      # width of the D/Q buses on every cell
+    diamonds:  bool = True  # two variants per level, each using both below
+
+    @property
+    def expanded_devices(self) -> int:
+        """Primitive count of the fully flattened TOP cell."""
+        return self.devices * self.fanout ** (self.depth + 1)
+
+
+def _ports(width: int) -> str:
+    return f'[CLK, "D<{width - 1}:0>", "Q<{width - 1}:0>", VDD, VSS]'
+
+
+def _header(name: str, width: int, deps: list[str]) -> list[str]:
+    lines = ["cell:", f"  name: {name}", f"  ports: {_ports(width)}"]
+    if deps:
+        lines.append("  deps: [" + ", ".join(deps) + "]")
+    lines.append("  components:")
+    return lines
+
+
+def _leaf(topo: Topology) -> str:
+    w = topo.bus_width
+    lines = _header("LEAF", w, [])
+    for i in range(topo.devices):
+        kind, bulk = ("nmos", "VSS") if i % 2 else ("pmos", "VDD")
+        drain = f'"Q<{i % w}>"' if i % 8 == 0 else f"n{i % 997}"
+        gate = f'"D<{i % w}>"' if i % 4 == 0 else f"n{(i + 1) % 997}"
+        lines += [
+            f"    - id: M{i}",
+            "      type: primitive",
+            f"      model: {kind}",
+            f"      connections: {{D: {drain}, G: {gate}, S: {bulk}, B: {bulk}}}",
+            f"      parameters: {{W: {0.5 + (i % 5) * 0.1:.1f}, L: 0.15, nf: 1, "
+            f"model_name: {kind}_1v8}}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _hier(name: str, children: list[tuple[str, str]], topo: Topology) -> str:
+    """A cell instantiating `fanout` children, split evenly over the variants."""
+    w = topo.bus_width
+    lines = _header(name, w, [f"{stem}.yaml" for stem, _ in children])
+    per_child = [topo.fanout // len(children)] * len(children)
+    per_child[0] += topo.fanout - sum(per_child)
+    for v, ((_, cell), count) in enumerate(zip(children, per_child)):
+        if count == 0:
+            continue
+        inst = f"X{v}[0:{count - 1}]" if count > 1 else f"X{v}"
+        lines += [
+            f'    - id: "{inst}"',
+            "      type: subckt",
+            f"      model: {cell}",
+            f'      connections: {{CLK: CLK, D: "D<{w - 1}:0>", Q: "Q<{w - 1}:0>", '
+            "VDD: VDD, VSS: VSS}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def write_topology(topo: Topology, directory: pathlib.Path) -> pathlib.Path:
+    """Write the cell files for `topo` into `directory`; return TOP's path."""
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "leaf.yaml").write_text(_leaf(topo))
+    below = [("leaf", "LEAF")]
+    variants = "AB" if topo.diamonds else "A"
+    for level in range(1, topo.depth + 1):
+        current = []
+        for v in variants:
+            stem, cell = f"l{level}_{v.lower()}", f"L{level}_{v}"
+            (directory / f"{stem}.yaml").write_text(_hier(cell, below, topo))
+            current.append((stem, cell))
+        below = current
+    top = directory / "top.yaml"
+    top.write_text(_hier("TOP", below, topo))
+    return top
@@ -0,0 +1,297 @@
+"""Integration tests for the spice_gen command-line interface."""
+import json
+import pathlib
+
+import pytest
+
+from spice_gen.cli import main
+from spice_gen.parser.loader import load_file
+from spice_gen.generator import get_generator
+
+FIXTURES = pathlib.Path(__file__).parent.parent / "fixtures"
+EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
+
+
+class TestSingleInput:
+    def test_output_file_matches_generate(self, tmp_path):
+        out = tmp_path / "inv.sp"
+        rc = main([str(FIXTURES / "inverter.yaml"), "-d", "hspice", "-o", str(out)])
+        assert rc == 0
+        expected = get_generator("hspice").generate(load_file(FIXTURES / "inverter.yaml"))
+        assert out.read_text() == expected
+
+    def test_stdout(self, capsys):
+        rc = main([str(FIXTURES / "inverter.yaml"), "--stdout"])
+        assert rc == 0
+        assert ".subckt INV A Z VDD VSS" in capsys.readouterr().out
+
+    def test_trusted(self, tmp_path):
+        out = tmp_path / "inv.sp"
+        assert main([str(FIXTURES / "inverter.yaml"), "--trusted", "-o", str(out)]) == 0
+        assert out.read_text() == get_generator("spice3").generate(
+            load_file(FIXTURES / "inverter.yaml"))
+
+    def test_missing_input_returns_1(self, tmp_path):
+        assert main([str(tmp_path / "nope.yaml"), "--stdout"]) == 1
+
+    def test_unwritable_output_returns_4(self, tmp_path):
+        out = tmp_path / "missing_dir" / "inv.sp"
+        assert main([str(FIXTURES / "inverter.yaml"), "-o", str(out)]) == 4
+
+
+class TestDialects:
+    def test_all_dialects(self, tmp_path, capsys):
+        out = tmp_path / "inv.sp"
+        rc = main([str(FIXTURES / "inverter.yaml"), "-d", "all", "-o", str(out)])
+        assert rc == 0
+        netlist = load_file(FIXTURES / "inverter.yaml")
+        for dialect in ("spice3", "hspice", "ngspice"):
+            text = (tmp_path / f"inv_{dialect}.sp").read_text()
+            assert text == get_generator(dialect).generate(netlist)
+        assert capsys.readouterr().out.count(".sp") == 3
+
+    def test_with_corners(self, tmp_path):
+        rc = main([str(EXAMPLES / "sky130_inverter.yaml"), "-d", "hspice,ngspice",
+                   "--pdk", str(EXAMPLES.parent / "pdks" / "sky130A.yaml"),
+                   "--corners", "tt,ff", "-o", str(tmp_path / "inv.sp")])
+        assert rc == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "inv_hspice_ff.sp", "inv_hspice_tt.sp", "inv_ngspice_ff.sp", "inv_ngspice_tt.sp",
+        ]
+
+    def test_stdout_needs_single_dialect(self):
+        assert main([str(FIXTURES / "inverter.yaml"), "-d", "spice3,hspice", "--stdout"]) == 1
+
+
+class TestCorners:
+    PDK = str(EXAMPLES.parent / "pdks" / "sky130A.yaml")
+
+    def test_all_corners(self, tmp_path, capsys):
+        out = tmp_path / "inv.sp"
+        rc = main([str(EXAMPLES / "sky130_inverter.yaml"), "--pdk", self.PDK,
+                   "--corners", "all", "-d", "ngspice", "-o", str(out)])
+        assert rc == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "inv_ff.sp", "inv_fs.sp", "inv_sf.sp", "inv_ss.sp", "inv_tt.sp",
+        ]
+        assert 'sky130.lib.spice" sf' in (tmp_path / "inv_sf.sp").read_text()
+        assert capsys.readouterr().out.count(".sp") == 5
+
+    def test_batch_corners(self, tmp_path):
+        rc = main([str(EXAMPLES / "sky130_inverter.yaml"), str(EXAMPLES / "sky130_nand2.yaml"),
+                   "--pdk", self.PDK, "--corners", "tt,ff", "--output-dir", str(tmp_path)])
+        assert rc == 0
+        assert len(list(tmp_path.iterdir())) == 4
+
+    def test_requires_pdk(self, tmp_path):
+        assert main([str(EXAMPLES / "inverter.yaml"), "--corners", "tt",
+                     "-o", str(tmp_path / "x.sp")]) == 1
+
+    def test_unknown_corner(self, tmp_path):
+        assert main([str(EXAMPLES / "sky130_inverter.yaml"), "--pdk", self.PDK,
+                     "--corners", "tt,xx", "-o", str(tmp_path / "x.sp")]) == 1
+        assert not list(tmp_path.iterdir())
+
+
+class TestCompile:
+    def test_compile_then_generate(self, tmp_path, capsys):
+        lib = tmp_path / "aoi.sglib"
+        assert main(["compile", str(EXAMPLES / "sky130_aoi21.yaml"), "-o", str(lib)]) == 0
+        assert capsys.readouterr().out.strip() == str(lib)
+
+        out = tmp_path / "aoi.sp"
+        assert main([str(lib), "-o", str(out)]) == 0
+        expected = get_generator("spice3").generate(load_file(EXAMPLES / "sky130_aoi21.yaml"))
+        assert out.read_text() == expected
+
+    def test_single_cell(self, tmp_path, capsys):
+        lib = tmp_path / "aoi.sglib"
+        main(["compile", str(EXAMPLES / "sky130_aoi21.yaml"), "-o", str(lib)])
+        capsys.readouterr()
+        assert main([str(lib), "--cell", "INV_SKY130", "--stdout"]) == 0
+        out = capsys.readouterr().out
+        assert "cell=INV_SKY130" in out
+        assert ".subckt NAND2" not in out
+
+    def test_cell_requires_library(self, capsys):
+        assert main([str(EXAMPLES / "inverter.yaml"), "--cell", "INV", "--stdout"]) == 2
+        assert "not a compiled spice_gen library" in capsys.readouterr().err
+
+    def test_missing_input(self, tmp_path):
+        assert main(["compile", str(tmp_path / "nope.yaml")]) == 1
+
+    @pytest.mark.parametrize("extra", [["--watch"], ["--output-dir", "out"]])
+    def test_cell_rejected_outside_single_mode(self, tmp_path, extra):
+        lib = tmp_path / "aoi21.sglib"
+        main(["compile", str(EXAMPLES / "sky130_aoi21.yaml"), "-o", str(lib)])
+        with pytest.raises(SystemExit):
+            main([str(lib), "--cell", "INV_SKY130", *extra])
+
+    def test_compile_write_error(self, tmp_path, capsys):
+        out = tmp_path / "missing" / "lib.sglib"
+        assert main(["compile", str(EXAMPLES / "inverter.yaml"), "-o", str(out)]) == 4
+        assert "could not write output" in capsys.readouterr().err
+
+
+class TestPrune:
+    @pytest.fixture
+    def top(self, tmp_path):
+        (tmp_path / "inv.yaml").write_text((EXAMPLES / "inverter.yaml").read_text())
+        nand2 = tmp_path / "nand2.yaml"
+        nand2.write_text((EXAMPLES / "nand2.yaml").read_text().replace(
+            "cell:\n", "cell:\n  deps: [inv.yaml]\n", 1))
+        return nand2
+
+    def test_off_for_single_input(self, top, capsys):
+        assert main([str(top), "--stdout"]) == 0
+        assert ".subckt INV" in capsys.readouterr().out
+
+    def test_single_input_opt_in(self, top, capsys):
+        assert main([str(top), "--stdout", "--prune", "-v"]) == 0
+        captured = capsys.readouterr()
+        assert ".subckt INV" not in captured.out
+        assert "pruned 1 unused cell(s)" in captured.err
+
+    def test_batch_default_and_opt_out(self, top, tmp_path, capsys):
+        assert main([str(top), "--output-dir", str(tmp_path / "a"), "-v"]) == 0
+        assert "pruned 1 unused cell(s)" in capsys.readouterr().err
+        assert ".subckt INV" not in (tmp_path / "a" / "nand2_spice3.sp").read_text()
+        assert main([str(top), "--output-dir", str(tmp_path / "b"), "--no-prune"]) == 0
+        assert ".subckt INV" in (tmp_path / "b" / "nand2_spice3.sp").read_text()
+
+    @pytest.mark.parametrize("extra, pruned", [([], False), (["--prune"], True)])
+    def test_watch_single_input_like_single(self, top, tmp_path, monkeypatch, extra, pruned):
+        from spice_gen.watch import Watcher
+
+        monkeypatch.setattr(Watcher, "run", lambda self, **kwargs: self.build_all())
+        out = tmp_path / "out.sp"
+        assert main([str(top), "--watch", "-o", str(out), *extra]) == 0
+        assert (".subckt INV" not in out.read_text()) == pruned
+
+
+class TestDedup:
+    def test_identical_variants_written_once(self, tmp_path, capsys):
+        from ..helpers.synthetic import Topology, write_topology
+
+        top = write_topology(Topology(devices=4, depth=2, fanout=2), tmp_path)
+        assert main([str(top), "--dedup", "--stdout", "-v"]) == 0
+        captured = capsys.readouterr()
+        assert "merged 2 duplicate cell(s)" in captured.err
+        assert ".subckt L1_B" not in captured.out and ".subckt L2_B" not in captured.out
+
+
+class TestFlatten:
+    def test_flatten(self, capsys):
+        assert main([str(EXAMPLES / "sky130_aoi21.yaml"), "--flatten", "--stdout"]) == 0
+        out = capsys.readouterr().out
+        assert out.count(".subckt") == 1
+        assert "MXNAND/MN2 XNAND/mid B VSS VSS" in out
+
+    def test_depth_zero_keeps_hierarchy(self, capsys):
+        assert main([str(EXAMPLES / "sky130_aoi21.yaml"), "--flatten-depth", "0", "--stdout"]) == 0
+        expected = get_generator("spice3").generate(load_file(EXAMPLES / "sky130_aoi21.yaml"))
+        assert capsys.readouterr().out == expected
+
+    def test_negative_depth_rejected(self):
+        with pytest.raises(SystemExit):
+            main([str(EXAMPLES / "sky130_aoi21.yaml"), "--flatten-depth", "-1"])
+
+    def test_batch(self, tmp_path):
+        rc = main([str(EXAMPLES / "sky130_aoi21.yaml"), str(EXAMPLES / "inverter.yaml"),
+                   "--output-dir", str(tmp_path), "--flatten"])
+        assert rc == 0
+        assert (tmp_path / "sky130_aoi21_spice3.sp").read_text().count(".subckt") == 1
+
+
+class TestProfile:
+    PDK = str(EXAMPLES.parent / "pdks" / "sky130A.yaml")
+
+    def test_report_on_stderr(self, tmp_path, capsys):
+        out = tmp_path / "inv.sp"
+        rc = main([str(EXAMPLES / "sky130_inverter.yaml"), "--pdk", self.PDK,
+                   "-o", str(out), "--profile"])
+        assert rc == 0
+        report = json.loads(capsys.readouterr().err)
+        assert list(report["phases"]) == [
+            "import", "read", "validate", "build", "resolve", "generate", "write",
+        ]
+        assert report["phases"]["read"]["calls"] == 1
+        assert report["phases"]["import"]["calls"] == 1
+        assert report["counts"] == {
+            "defs": 1, "files": 1, "instances": 0, "output_files": 1,
+            "output_bytes": out.stat().st_size, "primitives": 2,
+        }
+
+    def test_report_to_file_with_stdout(self, tmp_path, capsys):
+        report_path = tmp_path / "profile.json"
+        rc = main([str(FIXTURES / "inverter.yaml"), "--stdout",
+                   "--profile-out", str(report_path)])
+        assert rc == 0
+        output = capsys.readouterr()
+        assert output.err == ""
+        report = json.loads(report_path.read_text())
+        assert report["counts"]["output_bytes"] == len(output.out.encode())
+
+    def test_batch_rejected(self, tmp_path):
+        with pytest.raises(SystemExit):
+            main([str(EXAMPLES / "inverter.yaml"), str(EXAMPLES / "nand2.yaml"),
+                  "--output-dir", str(tmp_path), "--profile"])
+
+
+class TestBatch:
+    def test_multiple_inputs_to_output_dir(self, tmp_path, capsys):
+        rc = main([
+            str(EXAMPLES / "inverter.yaml"), str(EXAMPLES / "nand2.yaml"),
+            "--output-dir", str(tmp_path), "-d", "hspice",
+        ])
+        assert rc == 0
+        assert (tmp_path / "inverter_hspice.sp").exists()
+        assert (tmp_path / "nand2_hspice.sp").exists()
+        assert capsys.readouterr().out.count("_hspice.sp") == 2
+
+    def test_glob_pattern(self, tmp_path):
+        rc = main([str(EXAMPLES / "sky130_*.yaml"), "--output-dir", str(tmp_path),
+                   "--pdk", str(EXAMPLES.parent / "pdks" / "sky130A.yaml")])
+        assert rc == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "sky130_aoi21_spice3.sp", "sky130_inverter_spice3.sp", "sky130_nand2_spice3.sp",
+        ]
+
+    def test_manifest(self, tmp_path):
+        manifest = tmp_path / "cells.txt"
+        manifest.write_text(f"{EXAMPLES / 'inverter.yaml'}\n")
+        rc = main(["--manifest", str(manifest), "--output-dir", str(tmp_path / "out")])
+        assert rc == 0
+        assert (tmp_path / "out" / "inverter_spice3.sp").exists()
+
+    def test_failed_cell_sets_exit_code(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("cell: {name: BAD}\n")
+        rc = main([str(EXAMPLES / "inverter.yaml"), str(bad),
+                   "--output-dir", str(tmp_path / "out")])
+        assert rc == 2
+        assert (tmp_path / "out" / "inverter_spice3.sp").exists()
+
+    def test_stdout_rejected(self, tmp_path):
+        rc = main([str(EXAMPLES / "inverter.yaml"), str(EXAMPLES / "nand2.yaml"), "--stdout"])
+        assert rc == 1
+
+    def test_jobs(self, tmp_path):
+        rc = main([str(EXAMPLES / "inverter.yaml"), str(EXAMPLES / "nand2.yaml"),
+                   "--output-dir", str(tmp_path), "--jobs", "2"])
+        assert rc == 0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "inverter_spice3.sp", "nand2_spice3.sp",
+        ]
+
+
+    @pytest.mark.parametrize("jobs", ["-1", "two"])
+    def test_invalid_jobs_rejected(self, tmp_path, jobs):
+        with pytest.raises(SystemExit):
+            main([str(EXAMPLES / "inverter.yaml"), str(EXAMPLES / "nand2.yaml"),
+                  "--output-dir", str(tmp_path), "--jobs", jobs])
+
+
+class TestWatch:
+    def test_watch_rejects_stdout(self):
+        assert main([str(EXAMPLES / "inverter.yaml"), "--watch", "--stdout"]) == 1
@@ -0,0 +1,227 @@
+"""Tests for batch generation of many cells with a shared dep cache."""
+import pathlib
+
+import pytest
+
+from spice_gen.batch import expand_inputs, generate_library
+from spice_gen.parser.loader import LoadCache, load_file
+from spice_gen.pdk import load_pdk
+
+EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
+PDKS_DIR = pathlib.Path(__file__).parent.parent.parent / "pdks"
+
+INV = """
+    cell:
+      name: INV
+      ports: [A, Z, VDD, VSS]
+      components:
+        - id: MN1
+          type: primitive
+          model: nmos
+          connections: {D: Z, G: A, S: VSS, B: VSS}
+          parameters: {W: 1e-6, L: 180e-9, model_name: nch}
+"""
+
+BUF = """
+    cell:
+      name: {name}
+      ports: [A, Z, VDD, VSS]
+      deps: [inv.yaml]
+      components:
+        - id: X1
+          type: subckt
+          model: INV
+          connections: {{A: A, Z: mid, VDD: VDD, VSS: VSS}}
+        - id: X2
+          type: subckt
+          model: INV
+          connections: {{A: mid, Z: Z, VDD: VDD, VSS: VSS}}
+"""
+
+
+
+@pytest.fixture
+def library(tmp_path, write_yaml):
+    src = tmp_path / "src"
+    write_yaml("src/inv.yaml", INV)
+    bufs = [write_yaml(f"src/buf{i}.yaml", BUF.format(name=f"BUF{i}")) for i in range(3)]
+    return src, bufs
+
+
+class TestSharedCache:
+    def test_dep_loaded_once(self, library):
+        src, bufs = library
+        cache = LoadCache()
+        netlists = [load_file(b, cache=cache) for b in bufs]
+        inv_defs = {id(n.get_subckt("INV")) for n in netlists}
+        assert len(inv_defs) == 1
+        assert (src / "inv.yaml").resolve() in cache
+
+    def test_netlist_list_not_shared_with_cache(self, library):
+        _, bufs = library
+        cache = LoadCache()
+        netlist = load_file(bufs[0], cache=cache)
+        netlist.subckt_defs.clear()
+        assert load_file(bufs[0], cache=cache).top_cell == "BUF0"
+
+
+class TestExpandInputs:
+    def test_glob_sorted_and_deduplicated(self, library):
+        src, bufs = library
+        found = expand_inputs([str(src / "buf*.yaml"), str(bufs[0])])
+        assert found == bufs
+
+    def test_manifest_relative_to_its_dir(self, library):
+        src, bufs = library
+        manifest = src / "cells.txt"
+        manifest.write_text("# standard cells\nbuf1.yaml\n\nbuf2.yaml  # trailing\n")
+        assert [p.resolve() for p in expand_inputs(manifest=manifest)] == [
+            bufs[1].resolve(), bufs[2].resolve(),
+        ]
+
+
+class TestGenerateLibrary:
+    def test_one_output_per_cell(self, library, tmp_path):
+        _, bufs = library
+        out_dir = tmp_path / "out"
+        results = generate_library(bufs, out_dir, dialect="ngspice")
+        assert [r.ok for r in results] == [True, True, True]
+        assert [r.output_path.name for r in results] == [
+            "buf0_ngspice.sp", "buf1_ngspice.sp", "buf2_ngspice.sp",
+        ]
+        assert ".subckt BUF1" in (out_dir / "buf1_ngspice.sp").read_text()
+
+    def test_error_is_recorded_per_cell(self, library, tmp_path, write_yaml):
+        src, bufs = library
+        bad = write_yaml("src/bad.yaml", "cell: {name: BAD}\n")
+        results = generate_library([bufs[0], bad, bufs[1]], tmp_path / "out")
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].stage == "parse"
+        assert not results[1].output_path.exists()
+
+    def test_duplicate_output_names_rejected(self, library, tmp_path):
+        _, bufs = library
+        other = tmp_path / "other"
+        other.mkdir()
+        clash = other / "buf0.yaml"
+        clash.write_text(bufs[0].read_text())
+        with pytest.raises(ValueError, match="would both be written"):
+            generate_library([bufs[0], clash], tmp_path / "out")
+
+    def test_with_pdk(self, tmp_path):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        results = generate_library(
+            [EXAMPLES / "sky130_inverter.yaml", EXAMPLES / "sky130_aoi21.yaml"],
+            tmp_path, dialect="ngspice", pdk=pdk, corner="ff",
+        )
+        assert all(r.ok for r in results)
+        text = results[1].output_path.read_text()
+        assert 'sky130.lib.spice" ff' in text
+        assert "sky130_fd_pr__nfet_01v8" in text
+
+    def test_several_dialects_from_one_load(self, library, tmp_path, monkeypatch):
+        import spice_gen.batch as batch
+        _, bufs = library
+        loads = []
+        real_load = batch.load_file
+        monkeypatch.setattr(batch, "load_file",
+                            lambda path, **kw: loads.append(path) or real_load(path, **kw))
+
+        results = generate_library(bufs[:2], tmp_path / "out", dialect=["spice3", "hspice"])
+        assert len(loads) == 2
+        assert [p.name for p in results[0].outputs] == ["buf0_spice3.sp", "buf0_hspice.sp"]
+        assert "[hspice]" in results[1].outputs[1].read_text()
+
+    def test_corners(self, tmp_path):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        results = generate_library(
+            [EXAMPLES / "sky130_inverter.yaml"], tmp_path, dialect="ngspice",
+            pdk=pdk, corners=["tt", "ss"],
+        )
+        assert [p.name for p in results[0].outputs] == [
+            "sky130_inverter_ngspice_tt.sp", "sky130_inverter_ngspice_ss.sp",
+        ]
+        tt, ss = (p.read_text() for p in results[0].outputs)
+        assert 'sky130.lib.spice" ss' in ss
+        assert tt.replace('spice" tt', 'spice" ss') == ss
+        assert not results[0].output_path.exists()
+
+
+class TestPrune:
+    @pytest.fixture
+    def with_unused_dep(self, library, write_yaml):
+        src, _ = library
+        write_yaml("src/spare.yaml", INV.replace("name: INV", "name: SPARE"))
+        text = BUF.format(name="BUF").replace("deps: [inv.yaml]", "deps: [inv.yaml, spare.yaml]")
+        return write_yaml("src/buf.yaml", text)
+
+    def test_on_by_default(self, with_unused_dep, tmp_path):
+        (result,) = generate_library([with_unused_dep], tmp_path / "out")
+        assert result.ok and result.pruned == 1
+        assert ".subckt SPARE" not in result.output_path.read_text()
+
+    def test_disabled(self, with_unused_dep, tmp_path):
+        (result,) = generate_library([with_unused_dep], tmp_path / "out", prune=False)
+        assert result.ok and result.pruned == 0
+        assert ".subckt SPARE" in result.output_path.read_text()
+
+    def test_with_pdk_output_unchanged(self, tmp_path):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        top = EXAMPLES / "sky130_aoi21.yaml"
+        (pruned,) = generate_library([top], tmp_path / "pruned", pdk=pdk, dialect="ngspice")
+        (full,) = generate_library([top], tmp_path / "full", pdk=pdk, dialect="ngspice",
+                                   prune=False)
+        assert pruned.ok and pruned.pruned == 0
+        assert pruned.output_path.read_text() == full.output_path.read_text()
+
+    def test_def_instantiated_by_resolved_device_kept(self, tmp_path, write_yaml):
+        # A local wrapper named like the PDK subckt is only used after resolution
+        write_yaml("wrapper.yaml", """
+            cell:
+              name: sky130_fd_pr__nfet_01v8
+              ports: [d, g, s, b]
+              components:
+                - {id: R1, type: primitive, model: r, parameters: {value: 1k},
+                   connections: {P: d, N: s}}
+        """)
+        top = write_yaml("top.yaml", """
+            cell:
+              name: TOP
+              ports: [A, Z, VSS]
+              deps: [wrapper.yaml]
+              components:
+                - {id: MN1, type: primitive, model: nmos, connections: {D: Z, G: A, S: VSS, B: VSS},
+                   parameters: {W: 0.5, L: 0.15, model_name: nmos_1v8}}
+        """)
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        (result,) = generate_library([top], tmp_path / "out", pdk=pdk, dialect="ngspice")
+        assert result.ok and result.pruned == 0
+        assert ".subckt sky130_fd_pr__nfet_01v8" in result.output_path.read_text()
+
+
+class TestParallel:
+    def test_jobs_match_serial_output(self, library, tmp_path):
+        _, bufs = library
+        serial = generate_library(bufs, tmp_path / "serial", dialect="hspice")
+        parallel = generate_library(bufs, tmp_path / "parallel", dialect="hspice", jobs=2)
+        assert [r.input_path for r in parallel] == bufs
+        for s, p in zip(serial, parallel):
+            assert p.ok
+            assert p.top_cell == s.top_cell
+            assert p.output_path.read_text() == s.output_path.read_text()
+
+    def test_errors_collected_in_input_order(self, library, tmp_path, write_yaml):
+        src, bufs = library
+        bad = write_yaml("src/bad.yaml", "cell: {name: BAD}\n")
+        inputs = [bufs[0], bad, bufs[1], bufs[2]]
+        results = generate_library(inputs, tmp_path / "out", jobs=2)
+        assert [r.input_path for r in results] == inputs
+        assert [r.ok for r in results] == [True, False, True, True]
+        assert results[1].stage == "parse"
+
+    def test_parallel_with_pdk(self, tmp_path):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        inputs = [EXAMPLES / "sky130_inverter.yaml", EXAMPLES / "sky130_nand2.yaml"]
+        results = generate_library(inputs, tmp_path, dialect="ngspice", pdk=pdk, jobs=2)
+        assert all(r.ok for r in results)
+        assert "sky130_fd_pr__pfet_01v8" in results[0].output_path.read_text()
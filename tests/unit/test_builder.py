@@ -96,3 +96,28 @@ class TestSchemaValidation:
         }])
         with pytest.raises(ValidationError, match="unknown primitive model"):
             TopLevelSchema.model_validate(raw)
+
+
+class TestCompactModel:
+    def test_components_are_slotted(self):
+        raw = _make_cell([{
+            "id": "M1", "type": "primitive", "model": "nmos",
+            "connections": {"D": "out", "G": "in", "S": "gnd", "B": "gnd"},
+            "parameters": {"model_name": "nch"},
+        }])
+        defn = build_subckt_def(TopLevelSchema.model_validate(raw).cell)
+        assert not hasattr(defn.components[0], "__dict__")
+        assert not hasattr(defn, "__dict__")
+
+    def test_nets_and_parameter_keys_interned(self):
+        raw = _make_cell([
+            {"id": f"M{i}", "type": "primitive", "model": "nmos",
+             "connections": {"D": "out", "G": "in", "S": "".join(["V", "SS"]), "B": "VSS"},
+             "parameters": {"".join(["W"]): 1.0, "model_name": "nch"}}
+            for i in range(2)
+        ])
+        defn = build_subckt_def(TopLevelSchema.model_validate(raw).cell)
+        a, b = defn.components
+        assert a.connections["S"] is b.connections["S"] is a.connections["B"]
+        assert next(iter(a.parameters)) is next(iter(b.parameters))
+        assert a.parameters["W"] is b.parameters["W"]
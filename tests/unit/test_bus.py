@@ -0,0 +1,104 @@
+import pytest
+from pydantic import ValidationError
+
+from spice_gen.generator import get_generator
+from spice_gen.model.bus import BusRange
+from spice_gen.model.netlist import Netlist
+from spice_gen.parser.builder import build_subckt_def
+from spice_gen.schema.cell_schema import TopLevelSchema
+
+
+def _def(name, ports, components=()):
+    raw = {"cell": {"name": name, "ports": ports, "components": list(components)}}
+    return build_subckt_def(TopLevelSchema.model_validate(raw).cell)
+
+
+def _inst(id, model, **connections):
+    return {"id": id, "type": "subckt", "model": model, "connections": connections}
+
+
+def _generate(*defs, dialect="spice3") -> str:
+    return get_generator(dialect).generate(Netlist(subckt_defs=list(defs), top_cell=defs[-1].name))
+
+
+class TestBusRangeSlice:
+    def test_slice_follows_direction(self):
+        bus = BusRange("D", 7, 0, "<>")
+        assert bus.slice(0, 4) == BusRange("D", 7, 4, "<>")
+        assert bus.slice(4, 4) == BusRange("D", 3, 0, "<>")
+        assert bus.slice(2, 1) == "D<5>"
+
+
+class TestBusPorts:
+    def test_bus_port_kept_as_range(self):
+        defn = _def("REG", ["CLK", "D<255:0>"])
+        assert defn.ports == ["CLK", BusRange("D", 255, 0, "<>")]
+        assert defn.port_bits()[:3] == ["CLK", "D<255>", "D<254>"]
+        assert len(defn.port_bits()) == 257
+
+    def test_subckt_header_expands_bus(self):
+        out = _generate(_def("REG", ["CLK", "D[0:2]"]))
+        assert ".subckt REG CLK D[0] D[1] D[2]" in out
+
+    def test_bus_connection_stays_compact(self):
+        top = _def("TOP", ["DATA<4095:0>"], [_inst("XR", "REG", D="DATA<4095:0>")])
+        assert top.components[0].port_map == {"D": BusRange("DATA", 4095, 0, "<>")}
+
+    def test_instance_connects_bus_bit_by_bit(self):
+        reg = _def("REG", ["D<3:0>", "CLK"])
+        top = _def("TOP", ["BUS[0:3]", "CLK"],
+                   [_inst("XR", "REG", CLK="CLK", D="BUS[0:3]")])
+        assert "XXR BUS[0] BUS[1] BUS[2] BUS[3] CLK REG" in _generate(reg, top)
+
+    def test_port_key_may_carry_range(self):
+        reg = _def("REG", ["D<1:0>"])
+        top = _def("TOP", ["A<1:0>"], [_inst("XR", "REG", **{"D<1:0>": "A<1:0>"})])
+        assert "XXR A<1> A<0> REG" in _generate(reg, top)
+
+    def test_width_mismatch_raises(self):
+        reg = _def("REG", ["D<3:0>"])
+        top = _def("TOP", ["A<7:0>"], [_inst("XR", "REG", D="A<7:0>")])
+        with pytest.raises(ValueError, match="4 bit\\(s\\) wide but is connected to A<7:0>"):
+            _generate(reg, top)
+
+    def test_scalar_net_on_bus_port_raises(self):
+        reg = _def("REG", ["D<3:0>"])
+        top = _def("TOP", ["A"], [_inst("XR", "REG", D="A")])
+        with pytest.raises(ValueError, match="4 bit\\(s\\) wide"):
+            _generate(reg, top)
+
+    def test_external_subckt_expands_in_connection_order(self):
+        top = _def("TOP", ["A<1:0>", "B"], [_inst("XR", "EXT", P="A<1:0>", Q="B")])
+        assert "XXR A<1> A<0> B EXT" in _generate(top)
+
+    def test_primitive_bus_connection_rejected(self):
+        raw = {"cell": {"name": "T", "ports": ["A"], "components": [{
+            "id": "R1", "type": "primitive", "model": "r",
+            "connections": {"P": "A[0:1]", "N": "B"}, "parameters": {"value": "1k"},
+        }]}}
+        with pytest.raises(ValidationError, match="only supported for subckt"):
+            TopLevelSchema.model_validate(raw)
+
+
+class TestBusPortsOnArrays:
+    def test_bus_split_across_elements(self):
+        bit = _def("NIB", ["D<3:0>", "CLK"])
+        top = _def("TOP", ["DATA<7:0>", "CLK"],
+                   [_inst("XN[1:0]", "NIB", D="DATA<7:0>", CLK="CLK")])
+        out = _generate(bit, top)
+        assert "XXN[1] DATA<7> DATA<6> DATA<5> DATA<4> CLK NIB" in out
+        assert "XXN[0] DATA<3> DATA<2> DATA<1> DATA<0> CLK NIB" in out
+
+    def test_bus_shared_by_elements(self):
+        bit = _def("NIB", ["D<3:0>", "CLK"])
+        top = _def("TOP", ["SEL<3:0>", "CLK"],
+                   [_inst("XN[0:1]", "NIB", D="SEL<3:0>", CLK="CLK")])
+        out = _generate(bit, top)
+        assert "XXN[0] SEL<3> SEL<2> SEL<1> SEL<0> CLK NIB" in out
+        assert "XXN[1] SEL<3> SEL<2> SEL<1> SEL<0> CLK NIB" in out
+
+    def test_expanded_instances_keep_sub_ranges(self):
+        bit = _def("NIB", ["D<3:0>"])
+        top = _def("TOP", ["DATA<7:0>"], [_inst("XN[1:0]", "NIB", D="DATA<7:0>")])
+        first = next(top.components[0].expand(bit.ports))
+        assert first.port_map == {"D": BusRange("DATA", 7, 4, "<>")}
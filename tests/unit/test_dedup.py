@@ -0,0 +1,93 @@
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.model.component import SubcktInstance
+from spice_gen.model.device_table import DeviceTable
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.parser.loader import load_file
+from spice_gen.transform import deduplicate, flatten
+
+from ..conftest import cell, def_names, resistor
+from ..helpers.synthetic import Topology, write_topology
+
+
+def _top(*cells: SubcktDef) -> Netlist:
+    top = cell("TOP", *[
+        SubcktInstance(f"X{i}", c.name, {"A": "A", "B": "B"}) for i, c in enumerate(cells)
+    ])
+    return Netlist(subckt_defs=[*cells, top], top_cell="TOP")
+
+
+class TestDeduplicate:
+    def test_identical_variants_merged(self):
+        netlist = _top(cell("R_A", resistor()), cell("R_B", resistor()))
+        merged = deduplicate(netlist)
+        assert def_names(merged) == ["R_A", "TOP"]
+        assert [c.subckt_name for c in merged.get_subckt("TOP").components] == ["R_A", "R_A"]
+
+    @pytest.mark.parametrize("variant", [
+        cell("V", resistor(value="2k")),
+        cell("V", resistor(name="2")),
+        cell("V", resistor(p="B", n="A")),
+        cell("V", resistor(), ports=("B", "A")),
+        cell("V", resistor(), parameters={"w": "1"}),
+    ])
+    def test_differences_kept_apart(self, variant):
+        assert def_names(deduplicate(_top(cell("R", resistor()), variant))) == ["R", "V", "TOP"]
+
+    def test_connection_order_ignored(self):
+        swapped = resistor()
+        swapped.connections = {"N": "B", "P": "A"}
+        netlist = _top(cell("R_A", resistor()), cell("R_B", swapped))
+        assert def_names(deduplicate(netlist)) == ["R_A", "TOP"]
+
+    def test_top_never_merged(self):
+        leaf = cell("LEAF", resistor())
+        top = cell("TOP", resistor())
+        merged = deduplicate(Netlist(subckt_defs=[leaf, top], top_cell="TOP"))
+        assert def_names(merged) == ["LEAF", "TOP"]
+
+    def test_unchanged_defs_shared(self):
+        netlist = _top(cell("R_A", resistor()), cell("C", resistor(value="1p")))
+        merged = deduplicate(netlist)
+        assert all(a is b for a, b in zip(merged.subckt_defs, netlist.subckt_defs))
+
+    def test_merge_propagates_up(self, tmp_path):
+        netlist = load_file(write_topology(Topology(devices=5, depth=3, fanout=4), tmp_path))
+        merged = deduplicate(netlist)
+        assert def_names(merged) == ["LEAF", "L1_A", "L2_A", "L3_A", "TOP"]
+        assert {c.subckt_name for c in merged.get_subckt("TOP").components} == {"L3_A"}
+
+        gen = get_generator("spice3")
+        assert gen.generate(flatten(merged)) == gen.generate(flatten(netlist))
+        assert len(gen.generate(merged)) < len(gen.generate(netlist))
+
+    def test_columnar_defs(self):
+        def table_cell(name, value):
+            defn = cell(name)
+            defn.devices = DeviceTable.from_components([resistor(), resistor("2", value=value)])
+            return defn
+
+        netlist = _top(table_cell("T_A", "1k"), table_cell("T_B", "1k"), table_cell("T_C", "2k"))
+        assert def_names(deduplicate(netlist)) == ["T_A", "T_C", "TOP"]
+
+    def test_references_renamed_in_any_order(self):
+        # A user of R_B placed before it must still be rewritten
+        user = cell("USER", SubcktInstance("X", "R_B", {"A": "A", "B": "B"}))
+        netlist = Netlist(
+            subckt_defs=[cell("R_A", resistor()), user, cell("R_B", resistor()),
+                         cell("TOP", SubcktInstance("XU", "USER", {"A": "A", "B": "B"}))],
+            top_cell="TOP",
+        )
+        merged = deduplicate(netlist)
+        assert def_names(merged) == ["R_A", "USER", "TOP"]
+        assert merged.get_subckt("USER").components[0].subckt_name == "R_A"
+        assert netlist.get_subckt("USER").components[0].subckt_name == "R_B"
+
+    def test_shadowed_def_ignored(self):
+        # The second R_A is shadowed by the first; it must not rename R_A to R
+        netlist = _top(cell("R", resistor()), cell("R_A", resistor(value="2k")))
+        netlist.subckt_defs.insert(2, cell("R_A", resistor()))
+        merged = deduplicate(netlist)
+        assert def_names(merged) == ["R", "R_A", "TOP"]
+        assert merged.get_subckt("R_A").components[0].value == "2k"
@@ -1,10 +1,15 @@
 """Tests for hierarchical cell composition via the 'deps' field."""
 import pathlib
 import textwrap
+import threading
 import pytest
 
-from spice_gen.parser.loader import load_file
+from spice_gen import tracing
+from spice_gen.parser.loader import LoadCache, load_file
 from spice_gen.generator import get_generator
+from spice_gen.tracing import Tracer
+
+from ..helpers.synthetic import Topology, write_topology
 
 EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
 FIXTURES = pathlib.Path(__file__).parent.parent / "fixtures"
@@ -218,6 +223,68 @@ class TestMissingDep:
             load_file(tmp_path / "top.yaml")
 
 
+# ------------------------------------------------------------------ #
+# Concurrent dep parsing
+# ------------------------------------------------------------------ #
+
+class _FileSpans(Tracer):
+    def __init__(self):
+        self.files = []
+
+    def span_start(self, name, attrs):
+        if name == "file":
+            self.files.append((attrs["path"].name, threading.current_thread().name))
+
+
+class TestConcurrentLoading:
+    @pytest.fixture
+    def hierarchy(self, tmp_path):
+        return write_topology(Topology(devices=4, depth=4, fanout=4), tmp_path)
+
+    def test_same_result_as_sequential(self, hierarchy):
+        sequential = load_file(hierarchy, prefetch_threads=1)
+        with tracing.tracing(_FileSpans()) as spans:
+            concurrent = load_file(hierarchy, prefetch_threads=4)
+        assert [d.name for d in concurrent.subckt_defs] == [d.name for d in sequential.subckt_defs]
+        gen = get_generator("hspice")
+        assert gen.generate(concurrent) == gen.generate(sequential)
+
+        # Each file parsed once despite the diamonds; deps on the pool
+        names = [name for name, _ in spans.files]
+        assert sorted(names) == sorted(set(names)) and len(names) == 10
+        assert spans.files[0] == ("top.yaml", threading.current_thread().name)
+        assert all(t.startswith("spice_gen-load") for _, t in spans.files[1:])
+
+    def test_first_error_in_dependency_order(self, tmp_path):
+        top = _write(tmp_path, "top.yaml", """
+            cell:
+              name: TOP
+              ports: [A]
+              deps: [a.yaml, b.yaml]
+              components: []
+        """)
+        for name in ("a", "b"):
+            _write(tmp_path, f"{name}.yaml", f"""
+                cell:
+                  name: {name.upper()}
+                  ports: [A]
+                  components:
+                    - {{id: "{name}!", type: primitive, model: r,
+                       connections: {{P: A, N: A}}}}
+            """)
+        for threads in (1, 8):
+            with pytest.raises(ValueError, match="'a!' is invalid"):
+                load_file(top, prefetch_threads=threads)
+
+    def test_cached_parses_reused(self, hierarchy):
+        cache = LoadCache()
+        load_file(hierarchy, cache=cache)
+        cache.invalidate(hierarchy.parent / "l2_a.yaml")
+        with tracing.tracing(_FileSpans()) as spans:
+            load_file(hierarchy, cache=cache)
+        assert [name for name, _ in spans.files] == ["l2_a.yaml"]
+
+
 # ------------------------------------------------------------------ #
 # Integration: sky130 AOI21 example
 # ------------------------------------------------------------------ #
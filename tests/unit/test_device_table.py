@@ -0,0 +1,140 @@
+import pathlib
+
+import pytest
+
+from spice_gen.generator import DIALECT_REGISTRY, get_generator
+from spice_gen.generator.spice3 import Spice3Generator
+from spice_gen.model.component import PrimitiveComponent, SubcktInstance
+from spice_gen.model.device_table import DeviceTable
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.model.primitives import PRIMITIVE_REGISTRY, PrimitiveKind
+from spice_gen.parser.loader import load_file
+from spice_gen.pdk import load_pdk, resolve
+
+ROOT     = pathlib.Path(__file__).parent.parent.parent
+EXAMPLES = ROOT / "examples"
+PDKS     = ROOT / "pdks"
+
+
+@pytest.fixture(scope="module")
+def sky130_pdk():
+    return load_pdk(PDKS / "sky130A.yaml")
+
+
+def _mixed_components() -> list[PrimitiveComponent]:
+    def prim(name, kind, conns, params=None, model=None, value=None):
+        return PrimitiveComponent(
+            instance_name=name, kind=kind, spec=PRIMITIVE_REGISTRY[kind],
+            connections=conns, parameters=params or {}, model_name=model, value=value,
+        )
+    return [
+        prim("M1", PrimitiveKind.NMOS, {"D": "Z", "G": "A", "S": "VSS", "B": "VSS"},
+             {"W": "1", "L": "0.15"}, model="nmos_1v8"),
+        prim("R1", PrimitiveKind.R, {"P": "Z", "N": "mid"}, value="10k"),
+        prim("R2", PrimitiveKind.R, {"P": "mid", "N": "VSS"}, {"W": "1"},
+             model="res_poly", value="2k"),
+        prim("C1", PrimitiveKind.C, {"P": "Z", "N": "VSS"}, value="1p"),
+        prim("V1", PrimitiveKind.VSRC, {"P": "VDD", "N": "VSS"}, value="1.8"),
+    ]
+
+
+def _mixed_netlist(columnar: bool) -> Netlist:
+    comps = _mixed_components()
+    defn = SubcktDef(name="MIX", ports=["A", "Z", "VDD", "VSS"], components=comps)
+    if columnar:
+        defn.components = []
+        defn.devices = DeviceTable.from_components(comps)
+    return Netlist(subckt_defs=[defn], top_cell="MIX")
+
+
+class TestDeviceTable:
+    def test_shared_lookup_tables(self):
+        table = DeviceTable()
+        for i in range(4):
+            table.append(
+                f"M{i}", PrimitiveKind.NMOS,
+                {"D": f"d{i}", "G": "in", "S": "gnd", "B": "gnd"},
+                {"W": "1e-6"}, model_name="nch",
+            )
+        assert len(table) == 4
+        assert table.models == ["nch"]
+        assert table.params == [{}, {"W": "1e-6"}]
+        assert table.net_names.count("gnd") == 1
+
+    def test_row_view_matches_component(self):
+        table = DeviceTable()
+        table.append(
+            "R1", PrimitiveKind.R, {"N": "b", "P": "a"}, {}, value="10k",
+        )
+        comp = table.row(0)
+        assert isinstance(comp, PrimitiveComponent)
+        assert comp.ordered_nets() == ["a", "b"]
+        assert comp.value == "10k"
+        assert comp.model_name is None
+
+    def test_missing_port_raises(self):
+        with pytest.raises(ValueError, match="missing required port"):
+            DeviceTable().append(
+                "M1", PrimitiveKind.NMOS, {"D": "a", "G": "b", "S": "c"}, {},
+            )
+
+    def test_with_models_shares_columns(self):
+        table = DeviceTable()
+        table.append("M1", PrimitiveKind.NMOS,
+                     {"D": "a", "G": "b", "S": "c", "B": "c"}, {}, model_name="nch")
+        mapped = table.with_models(["sky_nfet"], [("d", "g", "s", "b")])
+        assert mapped.nets is table.nets
+        assert table.models == ["nch"]
+
+        comp = mapped.row(0)
+        assert isinstance(comp, SubcktInstance)
+        assert comp.subckt_name == "sky_nfet"
+        assert comp.port_map == {"d": "a", "g": "b", "s": "c", "b": "c"}
+
+
+class TestColumnarLoading:
+    def test_threshold_selects_storage(self):
+        small = load_file(EXAMPLES / "inverter.yaml", columnar_threshold=100)
+        assert small.subckt_defs[0].devices is None
+
+        big = load_file(EXAMPLES / "inverter.yaml", columnar_threshold=1)
+        defn = big.subckt_defs[0]
+        assert defn.devices is not None
+        assert not any(isinstance(c, PrimitiveComponent) for c in defn.components)
+
+    def test_iter_components_matches_object_storage(self):
+        objects = load_file(EXAMPLES / "inverter.yaml").subckt_defs[0]
+        columnar = load_file(EXAMPLES / "inverter.yaml", columnar_threshold=1).subckt_defs[0]
+        assert list(columnar.iter_components()) == objects.components
+
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    @pytest.mark.parametrize("example", ["inverter.yaml", "nand2.yaml"])
+    def test_generated_output_identical(self, dialect, example):
+        gen = get_generator(dialect)
+        expected = gen.generate(load_file(EXAMPLES / example))
+        assert gen.generate(load_file(EXAMPLES / example, columnar_threshold=1)) == expected
+
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    @pytest.mark.parametrize("example", ["sky130_inverter.yaml", "sky130_nand2.yaml"])
+    def test_pdk_resolved_output_identical(self, sky130_pdk, dialect, example):
+        gen = get_generator(dialect)
+        expected = gen.generate(resolve(load_file(EXAMPLES / example), sky130_pdk))
+        columnar = resolve(load_file(EXAMPLES / example, columnar_threshold=1), sky130_pdk)
+        assert gen.generate(columnar) == expected
+
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    def test_mixed_kinds_output_identical(self, sky130_pdk, dialect):
+        gen = get_generator(dialect)
+        assert gen.generate(_mixed_netlist(True)) == gen.generate(_mixed_netlist(False))
+
+        expected = gen.generate(resolve(_mixed_netlist(False), sky130_pdk))
+        assert gen.generate(resolve(_mixed_netlist(True), sky130_pdk)) == expected
+
+    def test_overridden_formatter_uses_row_views(self):
+        class TaggingGenerator(Spice3Generator):
+            def _format_primitive(self, comp):
+                return "* " + super()._format_primitive(comp)
+
+        netlist = load_file(EXAMPLES / "inverter.yaml", columnar_threshold=1)
+        out = TaggingGenerator().generate(netlist)
+        assert "* MMP1 " in out
@@ -0,0 +1,219 @@
+import pathlib
+
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.model.bus import parse_range
+from spice_gen.model.component import (
+    PrimitiveComponent, SubcktInstance, SubcktInstanceArray,
+)
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.parser.loader import load_file
+from spice_gen.pdk import load_pdk, resolve
+from spice_gen.transform import FlatComponents, flatten, iter_flat
+
+from ..conftest import resistor
+from ..helpers.synthetic import Topology, write_topology
+
+EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
+PDKS = pathlib.Path(__file__).parent.parent.parent / "pdks"
+
+
+
+def _body(netlist: Netlist, dialect: str = "spice3") -> list[str]:
+    return get_generator(dialect).generate(netlist).splitlines()[1:]
+
+
+@pytest.fixture
+def buf(write_yaml):
+    write_yaml("inv.yaml", """
+        cell:
+          name: INV
+          ports: [A, Z, VDD, VSS]
+          components:
+            - {id: MP, type: primitive, model: pmos, connections: {D: Z, G: A, S: VDD, B: VDD}}
+            - {id: MN, type: primitive, model: nmos, connections: {D: Z, G: A, S: VSS, B: VSS}}
+    """)
+    write_yaml("buf.yaml", """
+        cell:
+          name: BUF
+          ports: [A, Z, VDD, VSS]
+          deps: [inv.yaml]
+          components:
+            - {id: X1, type: subckt, model: INV, connections: {A: A, Z: mid, VDD: VDD, VSS: VSS}}
+            - {id: X2, type: subckt, model: INV, connections: {A: mid, Z: Z, VDD: VDD, VSS: VSS}}
+    """)
+    return write_yaml("top.yaml", """
+        cell:
+          name: TOP
+          ports: [IN, OUT, VDD, VSS]
+          deps: [buf.yaml]
+          components:
+            - {id: XB, type: subckt, model: BUF, connections: {A: IN, Z: OUT, VDD: VDD, VSS: VSS}}
+            - {id: RL, type: primitive, model: r, parameters: {value: 10k},
+               connections: {P: OUT, N: "0"}}
+    """)
+
+
+class TestFlatten:
+    def test_hierarchical_names(self, buf):
+        assert _body(flatten(load_file(buf))) == [
+            ".subckt TOP IN OUT VDD VSS",
+            "MXB/X1/MP XB/mid IN VDD VDD",
+            "MXB/X1/MN XB/mid IN VSS VSS",
+            "MXB/X2/MP OUT XB/mid VDD VDD",
+            "MXB/X2/MN OUT XB/mid VSS VSS",
+            "RRL OUT 0 10k",
+            ".ends TOP",
+        ]
+
+    def test_depth_limit_keeps_deeper_defs(self, buf):
+        netlist = load_file(buf)
+        flat = flatten(netlist, max_depth=1)
+        assert [d.name for d in flat.subckt_defs] == ["INV", "TOP"]
+        assert flat.subckt_defs[0] is netlist.get_subckt("INV")
+        assert _body(flat)[-4:] == [
+            "XXB/X1 IN XB/mid VDD VSS INV",
+            "XXB/X2 XB/mid OUT VDD VSS INV",
+            "RRL OUT 0 10k",
+            ".ends TOP",
+        ]
+
+    def test_depth_zero_is_unchanged(self, buf):
+        netlist = load_file(buf)
+        assert _body(flatten(netlist, max_depth=0)) == _body(netlist)
+
+    def test_negative_depth_rejected(self, buf):
+        with pytest.raises(ValueError, match="max_depth"):
+            flatten(load_file(buf), max_depth=-1)
+
+    def test_separator(self, buf):
+        assert "MXB.X1.MP XB.mid IN VDD VDD" in _body(flatten(load_file(buf), separator="."))
+
+    def test_ground_is_global(self):
+        inner = SubcktDef(name="LOAD", ports=["A"], components=[resistor(n="0")])
+        top = SubcktDef(name="TOP", ports=["N"], components=[
+            SubcktInstance("XL", "LOAD", {"A": "N"}),
+        ])
+        flat = flatten(Netlist(subckt_defs=[inner, top], top_cell="TOP"))
+        assert "RXL/1 N 0 1k" in _body(flat)
+
+    def test_parameterized_instances_kept(self, write_yaml):
+        write_yaml("res.yaml", """
+            cell:
+              name: RES
+              ports: [P, N]
+              parameters: {val: 1k}
+              components:
+                - {id: R1, type: primitive, model: r, parameters: {value: "{val}"},
+                   connections: {P: P, N: N}}
+        """)
+        top = write_yaml("top.yaml", """
+            cell:
+              name: TOP
+              ports: [A, B]
+              deps: [res.yaml]
+              components:
+                - {id: XR, type: subckt, model: RES, parameters: {val: 2k},
+                   connections: {P: A, N: B}}
+        """)
+        flat = flatten(load_file(top))
+        assert [d.name for d in flat.subckt_defs] == ["RES", "TOP"]
+        assert "XXR A B RES val=2k" in _body(flat)
+
+    def test_flat_view_is_lazy_and_reiterable(self, buf):
+        flat = flatten(load_file(buf)).get_subckt("TOP")
+        assert isinstance(flat.components, FlatComponents)
+        assert [c.instance_name for c in flat.components] == \
+            [c.instance_name for c in flat.components]
+
+    def test_recursive_subckt_rejected(self):
+        loop = SubcktDef(name="LOOP", ports=["A"], components=[
+            SubcktInstance("X", "LOOP", {"A": "A"}),
+        ])
+        with pytest.raises(ValueError, match="instantiates itself"):
+            list(iter_flat(Netlist(subckt_defs=[loop], top_cell="LOOP")))
+
+    def test_deep_hierarchy_does_not_recurse(self):
+        defs = [SubcktDef(name="C0", ports=["A"], components=[resistor(n="0")])]
+        for i in range(1, 3000):
+            defs.append(SubcktDef(name=f"C{i}", ports=["A"], components=[
+                SubcktInstance("X", f"C{i - 1}", {"A": "A"}),
+            ]))
+        (comp,) = iter_flat(Netlist(subckt_defs=defs, top_cell="C2999"))
+        assert comp.instance_name == "X/" * 2999 + "1"
+
+
+class TestFlattenBuses:
+    @pytest.fixture
+    def register(self, write_yaml):
+        write_yaml("bit.yaml", """
+            cell:
+              name: BIT
+              ports: [D, Q, "S<1:0>"]
+              components:
+                - {id: R1, type: primitive, model: r, parameters: {value: 1k},
+                   connections: {P: D, N: "t<0>"}}
+                - {id: R2, type: primitive, model: r, parameters: {value: 1k},
+                   connections: {P: "t<0>", N: "S<1>"}}
+                - {id: X, type: subckt, model: EXT, connections: {A: "S<1:0>", B: "t<1:0>"}}
+        """)
+        return write_yaml("reg.yaml", """
+            cell:
+              name: REG
+              ports: ["D<1:0>", "Q<1:0>", "S<3:0>"]
+              deps: [bit.yaml]
+              components:
+                - {id: "XB[0:1]", type: subckt, model: BIT,
+                   connections: {D: "D<1:0>", Q: "Q<1:0>", S: "S<3:0>"}}
+        """)
+
+    def test_array_elements_and_bus_bits(self, register):
+        assert _body(flatten(load_file(register)))[1:-1] == [
+            "RXB[0]/R1 D<1> XB[0]/t<0> 1k",
+            "RXB[0]/R2 XB[0]/t<0> S<3> 1k",
+            "XXB[0]/X S<3> S<2> XB[0]/t<1> XB[0]/t<0> EXT",
+            "RXB[1]/R1 D<0> XB[1]/t<0> 1k",
+            "RXB[1]/R2 XB[1]/t<0> S<1> 1k",
+            "XXB[1]/X S<1> S<0> XB[1]/t<1> XB[1]/t<0> EXT",
+        ]
+
+    def test_external_instances_keep_buses(self, register):
+        flat = list(iter_flat(load_file(register)))
+        ext = flat[2]
+        assert str(ext.port_map["A"]) == "S<3:2>"
+        assert str(ext.port_map["B"]) == "XB[0]/t<1:0>"
+
+    def test_kept_array_renamed(self):
+        inner = SubcktDef(name="CELL", ports=["A"], components=[resistor(n="0")])
+        mid = SubcktDef(name="MID", ports=["A"], components=[
+            SubcktInstanceArray(parse_range("XC[0:3]"), "CELL", {"A": "A"}),
+        ])
+        top = SubcktDef(name="TOP", ports=["A"], components=[
+            SubcktInstance("XM", "MID", {"A": "A"}),
+        ])
+        (arr,) = iter_flat(Netlist(subckt_defs=[inner, mid, top], top_cell="TOP"), max_depth=1)
+        assert isinstance(arr, SubcktInstanceArray)
+        assert arr.instance_name == "XM/XC[0:3]" and len(arr) == 4
+
+
+class TestFlattenEquivalence:
+    def test_synthetic_device_count(self, tmp_path):
+        topo = Topology(devices=6, depth=2, fanout=3, bus_width=4)
+        flat = list(iter_flat(load_file(write_topology(topo, tmp_path))))
+        assert len(flat) == topo.expanded_devices
+        assert all(isinstance(c, PrimitiveComponent) for c in flat)
+        assert len({c.instance_name for c in flat}) == len(flat)
+
+    def test_columnar_leaf_same_output(self, tmp_path):
+        top = write_topology(Topology(devices=6, depth=1, fanout=2, bus_width=4), tmp_path)
+        objects = flatten(load_file(top))
+        columnar = flatten(load_file(top, columnar_threshold=1))
+        assert _body(columnar) == _body(objects)
+
+    def test_pdk_resolved_devices(self):
+        pdk = load_pdk(PDKS / "sky130A.yaml")
+        netlist = flatten(resolve(load_file(EXAMPLES / "sky130_aoi21.yaml"), pdk))
+        body = _body(netlist, "ngspice")
+        assert netlist.pdk_includes and [d.name for d in netlist.subckt_defs] == ["AOI21_SKY130"]
+        assert "XXNAND/MN2 XNAND/mid B VSS VSS sky130_fd_pr__nfet_01v8 W=0.65 L=0.15 nf=1" in body
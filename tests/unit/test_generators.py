@@ -1,7 +1,7 @@
 import pytest
 from spice_gen.parser.loader import load_file
-from spice_gen.generator import get_generator, DIALECT_REGISTRY
-from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.generator import get_generator, generate_dialects, parse_dialects, DIALECT_REGISTRY
+from spice_gen.model.netlist import Netlist, PdkInclude, SubcktDef
 from spice_gen.model.component import PrimitiveComponent
 from spice_gen.model.primitives import PrimitiveKind, PRIMITIVE_REGISTRY
 
@@ -126,3 +126,62 @@ class TestGetGenerator:
         for dialect in DIALECT_REGISTRY:
             gen = get_generator(dialect)
             assert gen.DIALECT_NAME == dialect
+
+
+class TestStreaming:
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    def test_iter_generate_matches_generate(self, dialect):
+        netlist = load_file(FIXTURES / "inverter.yaml")
+        gen = get_generator(dialect)
+        assert "".join(gen.iter_generate(netlist)) == gen.generate(netlist)
+
+    def test_chunks_are_newline_terminated(self):
+        netlist = _make_inverter_netlist()
+        chunks = list(get_generator("spice3").iter_generate(netlist))
+        assert len(chunks) > 1
+        assert all(chunk.endswith("\n") for chunk in chunks)
+
+    def test_generate_to_writes_stream(self):
+        import io
+        netlist = _make_inverter_netlist()
+        gen = get_generator("ngspice")
+        buf = io.StringIO()
+        written = gen.generate_to(netlist, buf)
+        assert buf.getvalue() == gen.generate(netlist)
+        assert written == len(buf.getvalue())
+
+
+class TestCorners:
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    def test_each_corner_matches_single_generation(self, dialect):
+        import io
+        netlist = _make_inverter_netlist()
+        netlist.pdk_includes = [PdkInclude(lib_file="/pdk/models.lib", corner="tt")]
+        gen = get_generator(dialect)
+        streams = {corner: io.StringIO() for corner in ("tt", "ff", "ss")}
+        gen.generate_corners_to(netlist, streams)
+        for corner, buf in streams.items():
+            assert buf.getvalue() == gen.generate(netlist.with_corner(corner))
+
+    def test_with_corner_shares_defs(self):
+        netlist = _make_inverter_netlist()
+        netlist.pdk_includes = [PdkInclude(lib_file="/pdk/models.lib", corner="tt")]
+        ff = netlist.with_corner("ff")
+        assert ff.pdk_includes[0].corner == "ff"
+        assert netlist.pdk_includes[0].corner == "tt"
+        assert ff.subckt_defs[0] is netlist.subckt_defs[0]
+
+
+class TestDialectFanOut:
+    def test_parse_dialects(self):
+        assert parse_dialects("ngspice, spice3,ngspice") == ["ngspice", "spice3"]
+        assert parse_dialects("all") == list(DIALECT_REGISTRY)
+        with pytest.raises(ValueError, match="Unknown dialect"):
+            parse_dialects("spice3,ltspice")
+
+    def test_generate_dialects_matches_each_generator(self):
+        netlist = _make_inverter_netlist()
+        outputs = generate_dialects(netlist)
+        assert list(outputs) == list(DIALECT_REGISTRY)
+        for dialect, text in outputs.items():
+            assert text == get_generator(dialect).generate(netlist)
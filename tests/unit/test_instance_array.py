@@ -0,0 +1,113 @@
+import pytest
+from pydantic import ValidationError
+
+from spice_gen.generator import DIALECT_REGISTRY, get_generator
+from spice_gen.generator.spice3 import Spice3Generator
+from spice_gen.model.bus import BusRange, parse_range
+from spice_gen.model.component import SubcktInstance, SubcktInstanceArray
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.parser.builder import build_subckt_def
+from spice_gen.schema.cell_schema import TopLevelSchema
+
+
+def _make_cell(components: list[dict], name="REG", ports=None) -> dict:
+    return {"cell": {"name": name, "ports": ports or ["CLK", "VDD", "VSS"],
+                     "components": components}}
+
+
+def _bit_array(id="XBIT[0:3]", **connections) -> dict:
+    conns = {"D": "D[0:3]", "Q": "Q[0:3]", "CLK": "CLK"}
+    conns.update(connections)
+    return {"id": id, "type": "subckt", "model": "DFF", "connections": conns,
+            "parameters": {"m": 2}}
+
+
+def _netlist(components: list[dict], dff_ports=("CLK", "D", "Q")) -> Netlist:
+    top = build_subckt_def(TopLevelSchema.model_validate(_make_cell(components)).cell)
+    defs = [top]
+    if dff_ports is not None:
+        defs.insert(0, SubcktDef(name="DFF", ports=list(dff_ports), components=[]))
+    return Netlist(subckt_defs=defs, top_cell="REG")
+
+
+class TestBusRange:
+    def test_parse_square_and_angle(self):
+        assert parse_range("D[0:3]") == BusRange("D", 0, 3, "[]")
+        assert parse_range("D<7:0>") == BusRange("D", 7, 0, "<>")
+        assert parse_range("VDD") is None
+        assert parse_range("D[3]") is None
+
+    def test_bits_follow_range_direction(self):
+        assert list(parse_range("D<2:0>").bits()) == ["D<2>", "D<1>", "D<0>"]
+        assert len(parse_range("XBIT[0:1023]")) == 1024
+
+
+class TestArrayBuilding:
+    def test_array_stays_one_object(self):
+        netlist = _netlist([_bit_array("XBIT[0:1023]", D="D[0:1023]", Q="Q[1023:0]")])
+        top = netlist.get_subckt("REG")
+        assert len(top.components) == 1
+        arr = top.components[0]
+        assert isinstance(arr, SubcktInstanceArray)
+        assert len(arr) == 1024
+        assert arr.port_map["CLK"] == "CLK"
+        assert arr.port_map["Q"] == BusRange("Q", 1023, 0, "[]")
+
+    def test_expand(self):
+        arr = _netlist([_bit_array()]).get_subckt("REG").components[0]
+        elements = list(arr.expand())
+        assert all(isinstance(e, SubcktInstance) for e in elements)
+        assert [e.instance_name for e in elements] == [f"XBIT[{i}]" for i in range(4)]
+        assert elements[2].port_map == {"D": "D[2]", "Q": "Q[2]", "CLK": "CLK"}
+
+    def test_width_mismatch_raises_at_generation(self):
+        netlist = _netlist([_bit_array(D="D[0:5]")])
+        with pytest.raises(ValueError, match=r"needs a 1- or 4-bit connection"):
+            get_generator("spice3").generate(netlist)
+
+    def test_primitive_array_rejected(self):
+        raw = _make_cell([{
+            "id": "R[0:3]", "type": "primitive", "model": "r",
+            "connections": {"P": "a", "N": "b"}, "parameters": {"value": "1k"},
+        }])
+        with pytest.raises(ValidationError, match="only supported for subckt"):
+            TopLevelSchema.model_validate(raw)
+
+    def test_overlapping_arrays_rejected(self):
+        raw = _make_cell([_bit_array("XBIT[0:3]"), _bit_array("XBIT[3:6]")])
+        with pytest.raises(ValidationError, match="overlaps another array"):
+            TopLevelSchema.model_validate(raw)
+
+
+class TestArrayGeneration:
+    def test_lines_in_def_port_order(self):
+        out = get_generator("spice3").generate(_netlist([_bit_array()]))
+        assert "XXBIT[0] CLK D[0] Q[0] DFF m=2" in out
+        assert "XXBIT[3] CLK D[3] Q[3] DFF m=2" in out
+        assert "XBIT[0:3]" not in out
+
+    def test_external_subckt_uses_connection_order(self):
+        out = get_generator("spice3").generate(_netlist([_bit_array()], dff_ports=None))
+        assert "XXBIT[1] D[1] Q[1] CLK DFF m=2" in out
+
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    def test_matches_individual_instances(self, dialect):
+        array_out = get_generator(dialect).generate(_netlist([_bit_array()]))
+        single = [
+            {"id": f"XBIT_{i}", "type": "subckt", "model": "DFF",
+             "connections": {"D": f"D[{i}]", "Q": f"Q[{i}]", "CLK": "CLK"},
+             "parameters": {"m": 2}}
+            for i in range(4)
+        ]
+        single_out = get_generator(dialect).generate(_netlist(single))
+        for i in range(4):
+            array_out = array_out.replace(f"XXBIT[{i}] ", f"XXBIT_{i} ")
+        assert array_out == single_out
+
+    def test_overridden_formatter_gets_instances(self):
+        class TaggingGenerator(Spice3Generator):
+            def _format_subckt_instance(self, comp, netlist):
+                return "* " + super()._format_subckt_instance(comp, netlist)
+
+        out = TaggingGenerator().generate(_netlist([_bit_array()]))
+        assert "* XXBIT[2] CLK D[2] Q[2] DFF m=2" in out
@@ -0,0 +1,78 @@
+"""Tests for compiled binary cell libraries (.sglib)."""
+import pathlib
+import sys
+
+import pytest
+
+from spice_gen.generator import DIALECT_REGISTRY, get_generator
+from spice_gen.parser import library
+from spice_gen.parser.library import library_cells, load_library, write_library
+from spice_gen.parser.loader import load_file
+
+from ..helpers.synthetic import Topology, write_topology
+
+EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
+
+
+@pytest.fixture
+def hierarchy(tmp_path):
+    top = write_topology(Topology(devices=12, depth=2, fanout=3, bus_width=4), tmp_path / "src")
+    netlist = load_file(top, columnar_threshold=10)
+    lib = tmp_path / "top.sglib"
+    write_library(netlist, lib)
+    return netlist, lib
+
+
+class TestRoundTrip:
+    @pytest.mark.parametrize("dialect", sorted(DIALECT_REGISTRY))
+    @pytest.mark.parametrize("example", ["nand2.yaml", "opamp_snippet.yaml", "sky130_aoi21.yaml"])
+    def test_examples_identical(self, tmp_path, dialect, example):
+        netlist = load_file(EXAMPLES / example)
+        write_library(netlist, tmp_path / "lib.sglib")
+        gen = get_generator(dialect)
+        assert gen.generate(load_file(tmp_path / "lib.sglib")) == gen.generate(netlist)
+
+    def test_arrays_buses_and_tables(self, hierarchy):
+        netlist, lib = hierarchy
+        loaded = load_library(lib)
+        assert loaded.top_cell == "TOP"
+        assert loaded.get_subckt("LEAF").devices is not None
+        gen = get_generator("ngspice")
+        assert gen.generate(loaded) == gen.generate(netlist)
+
+    def test_strings_interned_and_specs_shared(self, tmp_path):
+        netlist = load_file(EXAMPLES / "inverter.yaml")
+        write_library(netlist, tmp_path / "inv.sglib")
+        original = netlist.subckt_defs[0].components[0]
+        loaded = load_library(tmp_path / "inv.sglib").subckt_defs[0].components[0]
+        assert loaded.spec is original.spec
+        assert all(net is sys.intern(net) for net in loaded.connections.values())
+
+
+class TestSingleCell:
+    def test_loads_only_closure(self, hierarchy):
+        _, lib = hierarchy
+        netlist = load_library(lib, cell="L1_B")
+        assert netlist.top_cell == "L1_B"
+        assert [d.name for d in netlist.subckt_defs] == ["LEAF", "L1_B"]
+
+    def test_index(self, hierarchy):
+        netlist, lib = hierarchy
+        assert library_cells(lib) == [d.name for d in netlist.subckt_defs]
+
+    def test_unknown_cell(self, hierarchy):
+        with pytest.raises(ValueError, match="Cell 'NOPE' is not in library"):
+            load_library(hierarchy[1], cell="NOPE")
+
+
+class TestErrors:
+    def test_not_a_library(self, tmp_path):
+        path = tmp_path / "x.sglib"
+        path.write_bytes(b"cell: {}\n")
+        with pytest.raises(ValueError, match="not a compiled spice_gen library"):
+            load_file(path)
+
+    def test_other_version_rejected(self, hierarchy, monkeypatch):
+        monkeypatch.setattr(library, "__version__", "99.0")
+        with pytest.raises(ValueError, match="recompile it with spice_gen 99.0"):
+            load_library(hierarchy[1])
@@ -0,0 +1,78 @@
+"""Tests for the Netlist container and its subckt name index."""
+import pathlib
+
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.pdk import load_pdk, resolve
+from spice_gen.parser.loader import load_file
+
+EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
+PDKS_DIR = pathlib.Path(__file__).parent.parent.parent / "pdks"
+
+
+def _defn(name: str, ports=None) -> SubcktDef:
+    return SubcktDef(name=name, ports=ports or ["A", "Z"], components=[])
+
+
+class TestSubcktIndex:
+    def test_lookup_by_name(self):
+        a, b = _defn("A"), _defn("B")
+        netlist = Netlist(subckt_defs=[a, b], top_cell="B")
+        assert netlist.get_subckt("A") is a
+        assert netlist.get_subckt("B") is b
+        assert netlist.get_subckt("MISSING") is None
+
+    def test_first_definition_wins(self):
+        first, second = _defn("A", ["X"]), _defn("A", ["Y"])
+        netlist = Netlist(subckt_defs=[first, second])
+        assert netlist.get_subckt("A") is first
+
+    def test_add_subckt_appends(self):
+        netlist = Netlist(subckt_defs=[_defn("A")])
+        b = _defn("B")
+        netlist.add_subckt(b)
+        assert [d.name for d in netlist.subckt_defs] == ["A", "B"]
+        assert netlist.get_subckt("B") is b
+
+    def test_add_subckt_replaces_in_place(self):
+        netlist = Netlist(subckt_defs=[_defn("A"), _defn("B")])
+        new_a = _defn("A", ["P", "Q"])
+        netlist.add_subckt(new_a)
+        assert [d.name for d in netlist.subckt_defs] == ["A", "B"]
+        assert netlist.subckt_defs[0] is new_a
+        assert netlist.get_subckt("A") is new_a
+
+    def test_direct_append_is_picked_up(self):
+        netlist = Netlist(subckt_defs=[_defn("A")])
+        c = _defn("C")
+        netlist.subckt_defs.append(c)
+        assert netlist.get_subckt("C") is c
+
+    def test_constructor_list_is_aliased(self):
+        defs = [_defn("A")]
+        netlist = Netlist(subckt_defs=defs)
+        c = _defn("C")
+        defs.append(c)
+        assert netlist.subckt_defs is defs
+        assert netlist.get_subckt("C") is c
+
+    def test_rename_in_place_is_picked_up(self):
+        a = _defn("A")
+        netlist = Netlist(subckt_defs=[a, _defn("B")])
+        assert netlist.get_subckt("A") is a
+        a.name = "Z"
+        assert netlist.get_subckt("A") is None
+        assert netlist.get_subckt("Z") is a
+
+    def test_assigned_list_is_picked_up(self):
+        netlist = Netlist(subckt_defs=[_defn("A"), _defn("B")])
+        assert netlist.get_subckt("A") is not None
+        a, c = _defn("A", ["P"]), _defn("C")
+        netlist.subckt_defs = [a, c]
+        assert netlist.get_subckt("A") is a
+        assert netlist.get_subckt("C") is c
+
+    def test_resolved_netlist_is_indexed(self):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        resolved = resolve(load_file(EXAMPLES / "sky130_aoi21.yaml"), pdk)
+        for defn in resolved.subckt_defs:
+            assert resolved.get_subckt(defn.name) is defn
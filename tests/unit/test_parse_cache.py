@@ -0,0 +1,86 @@
+"""Tests for the persistent on-disk parse cache."""
+import pathlib
+import textwrap
+
+import pytest
+
+from spice_gen.parser import loader
+from spice_gen.parser.cache import ParseCache
+from spice_gen.parser.loader import load_file
+from spice_gen.generator import get_generator
+
+INV = """
+    cell:
+      name: INV
+      ports: [A, Z, VDD, VSS]
+      components:
+        - id: MN1
+          type: primitive
+          model: nmos
+          connections: {D: Z, G: A, S: VSS, B: VSS}
+          parameters: {W: 1e-6, L: 180e-9, model_name: nch}
+"""
+
+BUF = """
+    cell:
+      name: BUF
+      ports: [A, Z, VDD, VSS]
+      deps: [inv.yaml]
+      components:
+        - id: X1
+          type: subckt
+          model: INV
+          connections: {A: A, Z: Z, VDD: VDD, VSS: VSS}
+"""
+
+
+@pytest.fixture
+def cells(tmp_path):
+    (tmp_path / "inv.yaml").write_text(textwrap.dedent(INV))
+    (tmp_path / "buf.yaml").write_text(textwrap.dedent(BUF))
+    return tmp_path
+
+
+def _forbid_parsing(monkeypatch):
+    def _fail(*args, **kwargs):
+        raise AssertionError("file was re-parsed despite a cache hit")
+    monkeypatch.setattr(loader, "_read_raw", _fail)
+
+
+class TestParseCache:
+    def test_hit_skips_parsing_and_gives_same_output(self, cells, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "cache"
+        first = load_file(cells / "buf.yaml", cache_dir=cache_dir)
+        _forbid_parsing(monkeypatch)
+        second = load_file(cells / "buf.yaml", cache_dir=cache_dir)
+        gen = get_generator("spice3")
+        assert gen.generate(second) == gen.generate(first)
+
+    def test_edited_file_misses(self, cells, tmp_path):
+        cache_dir = tmp_path / "cache"
+        load_file(cells / "buf.yaml", cache_dir=cache_dir)
+        (cells / "inv.yaml").write_text(textwrap.dedent(INV).replace("W: 1e-6", "W: 3e-6"))
+        netlist = load_file(cells / "buf.yaml", cache_dir=cache_dir)
+        assert netlist.get_subckt("INV").components[0].parameters["W"] == "3e-6"
+
+    def test_key_depends_on_path_and_content(self, tmp_path):
+        cache = ParseCache(tmp_path)
+        a, b = pathlib.Path("/x/a.yaml"), pathlib.Path("/x/b.yaml")
+        assert cache.key(a, b"data") == cache.key(a, b"data")
+        assert cache.key(a, b"data") != cache.key(b, b"data")
+        assert cache.key(a, b"data") != cache.key(a, b"other")
+
+    def test_corrupt_entry_is_a_miss(self, cells, tmp_path):
+        cache_dir = tmp_path / "cache"
+        load_file(cells / "inv.yaml", cache_dir=cache_dir)
+        for entry in cache_dir.rglob("*.pickle"):
+            entry.write_bytes(b"not a pickle")
+        assert load_file(cells / "inv.yaml", cache_dir=cache_dir).top_cell == "INV"
+
+    def test_errors_are_not_cached(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("cell: {name: BAD}\n")
+        cache_dir = tmp_path / "cache"
+        with pytest.raises(Exception):
+            load_file(bad, cache_dir=cache_dir)
+        assert not list(cache_dir.rglob("*.pickle"))
@@ -2,7 +2,7 @@ import pathlib
 import pytest
 from pydantic import ValidationError
 
-from spice_gen.pdk import load_pdk, resolve, PdkConfig, ModelEntry
+from spice_gen.pdk import load_pdk, invalidate_pdk_cache, resolve, PdkConfig, ModelEntry
 from spice_gen.model.netlist import Netlist, SubcktDef, PdkInclude
 from spice_gen.model.component import PrimitiveComponent, SubcktInstance
 from spice_gen.model.primitives import PrimitiveKind, PRIMITIVE_REGISTRY
@@ -46,6 +46,61 @@ class TestPdkConfig:
         pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
         assert str(pdk.lib_path).endswith("sky130.lib.spice")
 
+    def test_select_corners(self):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        assert pdk.select_corners("ff, tt,ff") == ["ff", "tt"]
+        assert pdk.select_corners("all") == pdk.corners
+        with pytest.raises(ValueError, match="Unknown corner 'zz'"):
+            pdk.select_corners("tt,zz")
+
+
+# ------------------------------------------------------------------ #
+# load_pdk cache
+# ------------------------------------------------------------------ #
+
+class TestPdkCache:
+    @pytest.fixture
+    def pdk_file(self, tmp_path):
+        path = tmp_path / "pdk.yaml"
+        path.write_text((PDKS_DIR / "sky130A.yaml").read_text())
+        yield path
+        invalidate_pdk_cache()
+
+    def test_repeated_load_is_cached(self, pdk_file):
+        assert load_pdk(pdk_file) is load_pdk(str(pdk_file))
+
+    def test_edited_file_reloads(self, pdk_file):
+        import os
+        first = load_pdk(pdk_file)
+        pdk_file.write_text(pdk_file.read_text().replace("name: sky130A", "name: edited"))
+        st = pdk_file.stat()
+        os.utime(pdk_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        second = load_pdk(pdk_file)
+        assert second is not first
+        assert second.name == "edited"
+
+    def test_invalidate(self, pdk_file):
+        first = load_pdk(pdk_file)
+        invalidate_pdk_cache(pdk_file)
+        assert load_pdk(pdk_file) is not first
+
+    def test_lru_bound(self, pdk_file, tmp_path, monkeypatch):
+        import spice_gen.pdk.resolver as resolver
+        monkeypatch.setattr(resolver, "PDK_CACHE_SIZE", 2)
+        copies = []
+        for i in range(3):
+            copy = tmp_path / f"pdk{i}.yaml"
+            copy.write_text(pdk_file.read_text())
+            copies.append(copy)
+        first = load_pdk(copies[0])
+        load_pdk(copies[1])
+        load_pdk(copies[2])
+        assert len(resolver._pdk_cache) == 2
+        assert load_pdk(copies[0]) is not first
+
+    def test_uncached_load(self, pdk_file):
+        assert load_pdk(pdk_file, use_cache=False) is not load_pdk(pdk_file, use_cache=False)
+
 
 # ------------------------------------------------------------------ #
 # Resolver: component transformation
@@ -138,3 +193,33 @@ class TestResolver:
         resolve(netlist, pdk)
         # Original should still be PrimitiveComponent
         assert isinstance(netlist.subckt_defs[0].components[0], PrimitiveComponent)
+
+    def test_untouched_def_shared(self):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        netlist = _make_netlist(_make_nmos_comp("my_custom_model"))
+        resolved = resolve(netlist, pdk)
+        assert resolved.subckt_defs[0] is netlist.subckt_defs[0]
+
+    def test_unchanged_components_shared(self):
+        pdk = load_pdk(PDKS_DIR / "sky130A.yaml")
+        custom = _make_nmos_comp("my_custom_model")
+        mapped = _make_nmos_comp("nmos_1v8")
+        netlist = _make_netlist(custom)
+        netlist.subckt_defs[0].components.append(mapped)
+        comps = resolve(netlist, pdk).subckt_defs[0].components
+        assert comps[0] is custom
+        assert isinstance(comps[1], SubcktInstance)
+        assert comps[1].parameters is mapped.parameters
+        assert netlist.subckt_defs[0].components == [custom, mapped]
+
+    def test_model_swap_shares_dicts(self):
+        pdk = PdkConfig.model_validate({
+            "name": "test", "path": "/tmp", "lib_file": "x.spice",
+            "corners": ["tt"], "default_corner": "tt",
+            "models": {"nmos_fake": {"pdk_name": "REAL_NMOS", "is_subckt": False}},
+        })
+        original = _make_nmos_comp("nmos_fake")
+        comp = resolve(_make_netlist(original), pdk).subckt_defs[0].components[0]
+        assert comp.connections is original.connections
+        assert comp.parameters is original.parameters
+        assert original.model_name == "nmos_fake"
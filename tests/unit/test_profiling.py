@@ -0,0 +1,60 @@
+import io
+import time
+
+from spice_gen import profiling, tracing
+from spice_gen.profiling import Profile, ProfiledStream
+
+
+class TestProfile:
+    def test_inactive_is_noop(self):
+        assert profiling.active() is None
+        profiling.count("files")
+
+    def test_nested_phase_time_excluded(self):
+        profile = Profile()
+        with profiling.profiling(profile, memory=False):
+            with tracing.span("generate"):
+                with tracing.span("write"):
+                    time.sleep(0.02)
+        gen, write = profile.phases["generate"], profile.phases["write"]
+        assert write.seconds >= 0.02
+        assert gen.seconds < write.seconds
+        assert profile.seconds >= gen.seconds + write.seconds
+        assert profiling.active() is None
+
+    def test_peak_memory_includes_nested(self):
+        profile = Profile()
+        with profiling.profiling(profile):
+            with tracing.span("build"):
+                with tracing.span("validate"):
+                    block = bytearray(1 << 20)
+                    del block
+        assert profile.phases["validate"].peak_bytes >= 1 << 20
+        assert profile.phases["build"].peak_bytes >= 1 << 20
+
+    def test_report_order_and_other_spans_ignored(self):
+        profile = Profile()
+        with profiling.profiling(profile, memory=False):
+            for name in ("file", "write", "read"):
+                with tracing.span(name):
+                    pass
+            profiling.count("files", 3)
+        assert not tracing.enabled()
+        report = profile.to_dict()
+        assert list(report["phases"]) == ["read", "write"]
+        assert report["counts"] == {"files": 3}
+
+
+class TestProfiledStream:
+    def test_buffers_and_counts_bytes(self):
+        target = io.StringIO()
+        profile = Profile()
+        with profiling.profiling(profile, memory=False):
+            stream = ProfiledStream(target)
+            for _ in range(3):
+                stream.write("µ\n")
+            assert target.getvalue() == ""
+            stream.flush()
+        assert target.getvalue() == "µ\n" * 3
+        assert profile.counts["output_bytes"] == 9
+        assert profile.phases["write"].calls == 1
@@ -0,0 +1,79 @@
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.model.bus import parse_range
+from spice_gen.model.component import SubcktInstance, SubcktInstanceArray
+from spice_gen.model.device_table import DeviceTable
+from spice_gen.model.netlist import Netlist, SubcktDef
+from spice_gen.model.primitives import PrimitiveKind
+from spice_gen.profiling import Profile, profiling
+from spice_gen.transform import prune, reachable_defs
+
+from ..conftest import cell, def_names, resistor
+
+
+def _cell(name: str, *uses: str, **kwargs) -> SubcktDef:
+    """A one-port cell instantiating `uses`, or holding a resistor when empty."""
+    components = [SubcktInstance(f"X{u}", u, {"A": "A"}) for u in uses] or [resistor(n="0")]
+    return cell(name, *components, ports=["A"], **kwargs)
+
+
+@pytest.fixture
+def library():
+    # TOP uses MID, which uses LEAF; UNUSED (and the SPARE it uses) are never reached
+    return Netlist(
+        subckt_defs=[_cell("LEAF"), _cell("SPARE"), _cell("UNUSED", "SPARE"),
+                     _cell("MID", "LEAF", "EXT"), _cell("TOP", "MID")],
+        top_cell="TOP",
+    )
+
+
+class TestPrune:
+    def test_unreachable_defs_dropped(self, library):
+        pruned = prune(library)
+        assert def_names(pruned) == ["LEAF", "MID", "TOP"]
+        assert all(d is library.get_subckt(d.name) for d in pruned.subckt_defs)
+
+    def test_output_only_loses_unused_blocks(self, library):
+        gen = get_generator("spice3")
+        text = gen.generate(prune(library))
+        assert ".subckt UNUSED" not in text and ".subckt SPARE" not in text
+        assert text.count(".subckt") == 3
+
+    def test_reachable_through_arrays_and_device_tables(self):
+        table = DeviceTable()
+        table.append("M1", PrimitiveKind.NMOS, {"D": "A", "G": "A", "S": "0", "B": "0"},
+                     {}, model_name="PCELL")
+        table = table.with_models(["PCELL"], [("d", "g", "s", "b")])
+        netlist = Netlist(subckt_defs=[
+            _cell("BIT"), _cell("PCELL"), _cell("UNUSED"),
+            SubcktDef(name="TOP", ports=["A"], components=[
+                SubcktInstanceArray(parse_range("XB[0:3]"), "BIT", {"A": "A"}),
+            ], devices=table),
+        ], top_cell="TOP")
+        assert def_names(prune(netlist)) == ["BIT", "PCELL", "TOP"]
+
+    def test_last_def_is_top_when_unset(self, library):
+        library.top_cell = None
+        assert def_names(prune(library)) == ["LEAF", "MID", "TOP"]
+
+    def test_unknown_top_rejected(self, library):
+        library.top_cell = "NOPE"
+        with pytest.raises(ValueError, match="'NOPE' is not defined"):
+            prune(library)
+
+    def test_netlist_includes_kept(self):
+        netlist = Netlist(subckt_defs=[_cell("UNUSED", includes=["models.inc"]), _cell("TOP")],
+                          top_cell="TOP")
+        pruned = prune(netlist)
+        assert def_names(pruned) == ["TOP"]
+        assert '.include "models.inc"' in get_generator("spice3").generate(pruned)
+        assert netlist.get_subckt("TOP").includes == []
+
+    def test_pruned_count_profiled(self, library):
+        with profiling(Profile(), memory=False) as profile:
+            prune(library)
+        assert profile.counts["pruned_defs"] == 2
+
+    def test_reachable_defs(self, library):
+        assert reachable_defs(library, "MID") == {"MID", "LEAF"}
@@ -0,0 +1,80 @@
+import pathlib
+
+import pytest
+
+from spice_gen import tracing
+from spice_gen.generator import get_generator
+from spice_gen.parser.loader import load_file
+from spice_gen.pdk import load_pdk, resolve
+from spice_gen.tracing import Tracer
+
+ROOT     = pathlib.Path(__file__).parent.parent.parent
+EXAMPLES = ROOT / "examples"
+PDKS     = ROOT / "pdks"
+
+
+class Recorder(Tracer):
+    def __init__(self):
+        self.events = []
+
+    def span_start(self, name, attrs):
+        self.events.append(("start", name, dict(attrs)))
+
+    def span_end(self, name, attrs, error):
+        self.events.append(("end", name, error))
+
+    def started(self, name):
+        return [attrs for kind, n, attrs in self.events if kind == "start" and n == name]
+
+
+class TestSpans:
+    def test_no_tracer_shares_null_span(self):
+        assert not tracing.enabled()
+        assert tracing.span("load", path="x") is tracing.span("resolve")
+
+    def test_pipeline_spans(self):
+        pdk = load_pdk(PDKS / "sky130A.yaml")
+        with tracing.tracing(Recorder()) as rec:
+            netlist = resolve(load_file(EXAMPLES / "sky130_aoi21.yaml"), pdk, "ff")
+            get_generator("ngspice").generate(netlist)
+        assert not tracing.enabled()
+
+        files = [attrs["path"].name for attrs in rec.started("file")]
+        assert sorted(files) == ["sky130_aoi21.yaml", "sky130_inverter.yaml", "sky130_nand2.yaml"]
+        assert rec.events[0] == ("start", "load",
+                                 {"path": (EXAMPLES / "sky130_aoi21.yaml").resolve()})
+        assert rec.events[1][:2] == ("start", "file")
+        assert [e[1] for e in rec.events[2:8]] == [
+            "read", "read", "validate", "validate", "build", "build",
+        ]
+        assert rec.started("resolve") == [{"pdk": "sky130A", "corner": "ff"}]
+        assert rec.started("generate") == [{"dialect": "ngspice", "cell": "AOI21_SKY130"}]
+        assert rec.events[-1] == ("end", "generate", None)
+
+    def test_error_reported_at_span_end(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("cell: {name: X}\n")
+        with tracing.tracing(Recorder()) as rec, pytest.raises(Exception):
+            load_file(bad)
+        kind, name, error = rec.events[-1]
+        assert (kind, name) == ("end", "load")
+        assert error is not None
+
+    def test_tracers_called_in_nesting_order(self):
+        calls = []
+
+        class Named(Tracer):
+            def __init__(self, tag):
+                self.tag = tag
+
+            def span_start(self, name, attrs):
+                calls.append(f"{self.tag}+")
+
+            def span_end(self, name, attrs, error):
+                calls.append(f"{self.tag}-")
+
+        a, b = Named("a"), Named("b")
+        with tracing.tracing(a), tracing.tracing(b):
+            with tracing.span("resolve"):
+                pass
+        assert calls == ["a+", "b+", "b-", "a-"]
@@ -0,0 +1,79 @@
+"""Tests for the trusted (validate=False) loading path."""
+import pathlib
+
+import pytest
+
+from spice_gen.generator import get_generator
+from spice_gen.parser.loader import load_file
+from spice_gen.parser.trusted import trusted_cell
+
+EXAMPLES = pathlib.Path(__file__).parent.parent.parent / "examples"
+
+
+def _cell(**fields) -> dict:
+    cell = {"name": "T", "ports": ["A"], "components": []}
+    cell.update(fields)
+    return {"cell": cell}
+
+
+def _comp(**fields) -> dict:
+    comp = {"id": "R1", "type": "primitive", "model": "r",
+            "connections": {"P": "A", "N": "B"}, "parameters": {"value": "1k"}}
+    comp.update(fields)
+    return comp
+
+
+class TestTrustedLoad:
+    @pytest.mark.parametrize("example", sorted(p.name for p in EXAMPLES.glob("*.yaml")))
+    def test_matches_validated(self, example):
+        gen = get_generator("ngspice")
+        validated = load_file(EXAMPLES / example)
+        assert gen.generate(load_file(EXAMPLES / example, validate=False)) == gen.generate(validated)
+
+    def test_columnar(self):
+        netlist = load_file(EXAMPLES / "inverter.yaml", validate=False, columnar_threshold=1)
+        assert len(netlist.subckt_defs[0].devices) == 2
+
+    def test_disk_cache_keeps_trusted_builds_apart(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("cell: {name: T, ports: [A], components: "
+                       "[{id: 1bad, type: subckt, model: X, connections: {A: A}}]}\n")
+        load_file(bad, cache_dir=tmp_path / "cache", validate=False)
+        with pytest.raises(Exception, match="is invalid"):
+            load_file(bad, cache_dir=tmp_path / "cache")
+
+
+class TestTrustedChecks:
+    def test_defaults_filled(self):
+        cell = trusted_cell(_cell(components=[_comp(parameters=None)]))
+        assert cell.deps == [] and cell.includes == [] and cell.parameters == {}
+        assert cell.components[0].parameters == {}
+
+    @pytest.mark.parametrize("raw, message", [
+        ({}, "'cell' mapping is missing"),
+        (_cell(ports=[]), "'ports' must be a non-empty list"),
+        (_cell(components=None), "'components' must be a list"),
+        (_cell(components=["R1"]), "component #0 must be a mapping"),
+        (_cell(components=[{"id": "R1", "type": "primitive"}]), "missing required field 'model'"),
+        (_cell(components=[_comp(type="device")]), "invalid type 'device'"),
+        (_cell(components=[_comp(model="jfet")]), "unknown primitive model 'jfet'"),
+        (_cell(components=[_comp(connections=["A", "B"])]), "'connections' must be a mapping"),
+        (_cell(ports=["A", 1]), "'ports' must be a list of strings"),
+        (_cell(deps="inv.yaml"), "'deps' must be a list of strings"),
+        (_cell(deps=["inv.yaml", None]), "'deps' must be a list of strings"),
+        (_cell(includes=[3]), "'includes' must be a list of strings"),
+        (_cell(components=[_comp(id=1)]), "component #0: 'id' must be a string"),
+        (_cell(components=[_comp(connections={"P": "A", "N": 0})]),
+         "component 'R1': model, ports and nets must be strings"),
+        (_cell(components=[_comp(type="subckt", model=5)]), "model, ports and nets must be strings"),
+    ])
+    def test_structural_errors(self, raw, message):
+        with pytest.raises(ValueError, match=message):
+            trusted_cell(raw)
+
+    def test_integer_net_in_file(self, tmp_path):
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("cell: {name: T, ports: [A], components: "
+                       "[{id: R1, type: primitive, model: r, connections: {P: A, N: 0}}]}\n")
+        with pytest.raises(ValueError, match="Cell 'T': component 'R1'"):
+            load_file(bad, validate=False)
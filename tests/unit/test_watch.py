@@ -0,0 +1,123 @@
+"""Tests for watch mode: incremental regeneration from the dep graph."""
+import pathlib
+
+import pytest
+
+from spice_gen.parser import loader
+from spice_gen.watch import Watcher
+
+PDKS_DIR = pathlib.Path(__file__).parent.parent.parent / "pdks"
+
+INV = """
+    cell:
+      name: INV
+      ports: [A, Z, VDD, VSS]
+      components:
+        - id: MN1
+          type: primitive
+          model: nmos
+          connections: {{D: Z, G: A, S: VSS, B: VSS}}
+          parameters: {{W: {w}, L: 0.15, model_name: nmos_1v8}}
+"""
+
+WRAP = """
+    cell:
+      name: {name}
+      ports: [A, Z, VDD, VSS]
+      deps: [{dep}]
+      components:
+        - id: X1
+          type: subckt
+          model: {model}
+          connections: {{A: A, Z: Z, VDD: VDD, VSS: VSS}}
+"""
+
+
+
+@pytest.fixture
+def tree(tmp_path, write_yaml):
+    """inv <- buf <- top, plus an independent cell 'other'."""
+    src = tmp_path / "src"
+    write_yaml("src/inv.yaml", INV.format(w=1.0))
+    write_yaml("src/buf.yaml", WRAP.format(name="BUF", dep="inv.yaml", model="INV"))
+    write_yaml("src/top.yaml", WRAP.format(name="TOP", dep="buf.yaml", model="BUF"))
+    write_yaml("src/other.yaml", INV.format(w=2.0).replace("name: INV", "name: OTHER"))
+    out = tmp_path / "out"
+    out.mkdir()
+    targets = [(src / f"{n}.yaml", out / f"{n}.sp") for n in ("buf", "top", "other")]
+    return src, targets
+
+
+@pytest.fixture
+def parse_log(monkeypatch):
+    log = []
+    real = loader._parse_cell
+
+    def _logged(path, *args, **kwargs):
+        log.append(path.name)
+        return real(path, *args, **kwargs)
+
+    monkeypatch.setattr(loader, "_parse_cell", _logged)
+    return log
+
+
+class TestWatcher:
+    def test_build_all_parses_each_file_once(self, tree, parse_log):
+        _, targets = tree
+        results = Watcher(targets).build_all()
+        assert all(r.ok for r in results)
+        assert sorted(parse_log) == ["buf.yaml", "inv.yaml", "other.yaml", "top.yaml"]
+
+    def test_no_change_no_rebuild(self, tree):
+        _, targets = tree
+        watcher = Watcher(targets)
+        watcher.build_all()
+        assert watcher.poll() == []
+
+    def test_leaf_change_reparses_only_leaf(self, tree, parse_log, write_yaml):
+        src, targets = tree
+        watcher = Watcher(targets)
+        watcher.build_all()
+        parse_log.clear()
+
+        write_yaml("src/inv.yaml", INV.format(w=5.0))
+        results = watcher.poll()
+
+        assert parse_log == ["inv.yaml"]
+        assert [r.input_path.name for r in results] == ["buf.yaml", "top.yaml"]
+        assert "W=5.0" in targets[1][1].read_text()
+
+    def test_top_change_rebuilds_only_that_cell(self, tree, parse_log, write_yaml):
+        src, targets = tree
+        watcher = Watcher(targets)
+        watcher.build_all()
+        parse_log.clear()
+
+        write_yaml("src/other.yaml", INV.format(w=3.0).replace("name: INV", "name: OTHER"))
+        results = watcher.poll()
+
+        assert parse_log == ["other.yaml"]
+        assert [r.input_path.name for r in results] == ["other.yaml"]
+
+    def test_broken_file_is_retried_after_fix(self, tree, write_yaml):
+        src, targets = tree
+        watcher = Watcher(targets)
+        watcher.build_all()
+
+        write_yaml("src/inv.yaml", "cell: {name: INV}\n")
+        assert [r.ok for r in watcher.poll()] == [False, False]
+
+        write_yaml("src/inv.yaml", INV.format(w=1.0))
+        assert [r.ok for r in watcher.poll()] == [True, True]
+
+    def test_pdk_change_rebuilds_everything(self, tree, write_yaml):
+        _, targets = tree
+        pdk = write_yaml("pdk.yaml", (PDKS_DIR / "sky130A.yaml").read_text())
+        watcher = Watcher(targets, dialect="ngspice", pdk_path=pdk)
+        watcher.build_all()
+        assert "sky130_fd_pr__nfet_01v8 " in targets[2][1].read_text()
+
+        write_yaml("pdk.yaml", pdk.read_text().replace("sky130_fd_pr__nfet_01v8\n", "renamed_nfet\n"))
+        results = watcher.poll()
+        assert len(results) == 3
+        assert "renamed_nfet" in targets[2][1].read_text()
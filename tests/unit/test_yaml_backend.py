@@ -0,0 +1,28 @@
+"""Tests for the shared YAML loading layer."""
+import importlib
+
+import yaml
+
+import spice_gen.yaml_backend as yaml_backend
+
+
+def test_load_yaml_parses_mapping():
+    assert yaml_backend.load_yaml("cell: {name: INV, ports: [A, Z]}") == {
+        "cell": {"name": "INV", "ports": ["A", "Z"]}
+    }
+
+
+def test_backend_name_reported():
+    assert yaml_backend.YAML_BACKEND in ("libyaml", "pure-python")
+
+
+def test_falls_back_without_libyaml(monkeypatch):
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    try:
+        reloaded = importlib.reload(yaml_backend)
+        assert reloaded.YAML_BACKEND == "pure-python"
+        assert reloaded.SafeLoader is yaml.SafeLoader
+        assert reloaded.load_yaml("a: 1") == {"a": 1}
+    finally:
+        monkeypatch.undo()
+        importlib.reload(yaml_backend)